@@ -14,6 +14,14 @@ NETWORK_PORT = 9999
 DEBUG_MODE = False
 SHOW_FPS = True
 
+# Configuración de render
+# Volcar solo las zonas de pantalla que cambian (display.update(rects))
+# en vez de limpiar y hacer flip de toda la pantalla cada frame
+DIRTY_RECTS = False
+# Nivel de detalle de unidades, torres y héroe: None = automático (según
+# número de figuras y tiempo de frame), 0 completo, 1 silueta, 2 ficha
+LOD_LEVEL = None
+
 # Configuración de eventos y temporadas (futuro)
 SEASON_ACTIVE = None
 EVENT_ACTIVE = None
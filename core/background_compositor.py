@@ -0,0 +1,87 @@
+"""
+Background Compositor - Fondo con Oclusión
+==========================================
+El pasto ocupa toda la pantalla, pero la mayor parte queda debajo de capas
+opacas (la zona de juego con el tablero). El compositor lleva la lista de
+esas capas, calcula qué zonas del fondo siguen a la vista y se lo pasa al
+pasto para que no simule ni dibuje lo que se va a tapar.
+"""
+import pygame
+
+
+def subtract_rect(rects, hole):
+    """
+    Resta un rectángulo a una lista de rectángulos disjuntos.
+
+    Returns:
+        Nueva lista de rectángulos disjuntos (hasta 4 trozos por cada uno
+        que toque el hueco: franjas de arriba y abajo, y lados intermedios).
+    """
+    result = []
+    for rect in rects:
+        cut = rect.clip(hole)
+        if not cut:
+            result.append(rect)
+            continue
+        if cut.top > rect.top:
+            result.append(pygame.Rect(rect.left, rect.top, rect.width, cut.top - rect.top))
+        if cut.bottom < rect.bottom:
+            result.append(pygame.Rect(rect.left, cut.bottom, rect.width,
+                                      rect.bottom - cut.bottom))
+        if cut.left > rect.left:
+            result.append(pygame.Rect(rect.left, cut.top, cut.left - rect.left, cut.height))
+        if cut.right < rect.right:
+            result.append(pygame.Rect(cut.right, cut.top, rect.right - cut.right, cut.height))
+    return result
+
+
+class BackgroundCompositor:
+    """Dibuja el fondo animado solo en las zonas que no tapan capas opacas."""
+
+    def __init__(self):
+        # Capas opacas por nombre: {nombre: Rect}
+        self.occluders = {}
+        self.visible_rects = None
+        self._size = None
+        self._dirty = True
+        # Pasto que ya tiene las zonas visibles actuales
+        self._synced = None
+
+    def set_occluder(self, name, rect):
+        """Registra (o mueve) una capa opaca que tapa el fondo."""
+        rect = pygame.Rect(rect)
+        if self.occluders.get(name) != rect:
+            self.occluders[name] = rect
+            self._dirty = True
+
+    def remove_occluder(self, name):
+        if self.occluders.pop(name, None) is not None:
+            self._dirty = True
+
+    def _update_visible(self, size):
+        """Recalcula las zonas visibles si cambió alguna capa o la pantalla."""
+        if not self._dirty and size == self._size:
+            return False
+        self._size = size
+        self._dirty = False
+        visible = [pygame.Rect((0, 0), size)]
+        for rect in self.occluders.values():
+            visible = subtract_rect(visible, rect)
+        self.visible_rects = visible
+        return True
+
+    def draw(self, screen, grass_system):
+        """Dibuja el pasto solo en las zonas visibles."""
+        if self._update_visible(screen.get_size()) or self._synced is not grass_system:
+            grass_system.set_visible_rects(self.visible_rects)
+            self._synced = grass_system
+        grass_system.draw(screen)
+
+    def get_stats(self, grass_system):
+        """Contadores de depuración de lo que se ha descartado."""
+        return {
+            'visible_rects': len(self.visible_rects or ()),
+            'culled_blades': grass_system.culled_blades,
+            'culled_pixels': grass_system.culled_pixels,
+            'culled_waves': grass_system.culled_waves,
+        }
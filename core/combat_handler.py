@@ -37,8 +37,7 @@ class CombatHandler:
         
         # Ejecutar movimiento
         self.particles.spawn_dust(from_tile.x, from_tile.y)
-        from_tile.unit = None
-        to_tile.unit = unit
+        self.grid.place_unit(to_tile, unit)
         self.particles.spawn_dust(to_tile.x, to_tile.y)
         unit.move_to(to_tile.x, to_tile.y)
         unit.has_moved = True
@@ -0,0 +1,82 @@
+"""
+Depth Order - Lista de Dibujado Persistente
+===========================================
+Unidades y torres se dibujan en orden de Y (lo de abajo tapa a lo de
+arriba). En vez de reconstruir y ordenar la lista cada frame, GridManager
+la mantiene al colocar o retirar algo: cada objeto quieto se inserta con
+bisect en la posición de su tile y ahí se queda.
+
+Una unidad recién colocada va a un grupo aparte mientras se mueve (su Y
+visual cambia cada frame); al terminar el movimiento se inserta en la
+lista fija. Cada frame solo se ordenan esas pocas unidades en marcha y
+se mezclan con la lista fija.
+"""
+import heapq
+from bisect import bisect_left
+from operator import itemgetter
+
+# Desempate a igual Y: unidades antes que torres
+KIND_UNIT = 0
+KIND_TOWER = 1
+
+
+class DepthOrder:
+    """Unidades y torres ordenadas por Y, mantenidas incrementalmente."""
+
+    def __init__(self):
+        # Lista fija: claves (y, índice del tile, tipo) y entradas
+        # (y, objeto, tile) en paralelo, ordenadas por clave
+        self._keys = []
+        self._items = []
+        self._key_of = {}
+        # Unidades colocadas que aún no se han asentado: objeto -> tile
+        self._moving = {}
+
+        # Estadísticas
+        self.inserts = 0
+
+    def __len__(self):
+        return len(self._items) + len(self._moving)
+
+    def place_unit(self, unit, tile):
+        """Unidad colocada en tile: se asienta cuando deja de moverse."""
+        self.remove(unit)
+        self._moving[unit] = tile
+
+    def place_tower(self, tower, tile):
+        """Torre colocada en tile (las torres no se mueven)."""
+        self.remove(tower)
+        self._insert(tower, tile, KIND_TOWER)
+
+    def remove(self, obj):
+        """Retira una unidad o torre (muerte, cambio de tile)."""
+        if self._moving.pop(obj, None) is not None:
+            return
+        key = self._key_of.pop(obj, None)
+        if key is not None:
+            i = bisect_left(self._keys, key)
+            del self._keys[i]
+            del self._items[i]
+
+    def _insert(self, obj, tile, kind):
+        key = (tile.y, tile.index, kind)
+        i = bisect_left(self._keys, key)
+        self._keys.insert(i, key)
+        self._items.insert(i, (tile.y, obj, tile))
+        self._key_of[obj] = key
+        self.inserts += 1
+
+    def items(self):
+        """
+        Entradas (y, objeto, tile) en orden de dibujado. Sin unidades en
+        movimiento es la lista interna: no modificarla.
+        """
+        moving = self._moving
+        if moving:
+            for unit in [u for u in moving if not getattr(u, 'is_moving', False)]:
+                self._insert(unit, moving.pop(unit), KIND_UNIT)
+        if not moving:
+            return self._items
+        movers = sorted(((unit.visual_y, unit, tile) for unit, tile in moving.items()),
+                        key=itemgetter(0))
+        return list(heapq.merge(self._items, movers, key=itemgetter(0)))
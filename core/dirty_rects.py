@@ -0,0 +1,164 @@
+"""
+Dirty Rects - Actualización Parcial de Pantalla
+===============================================
+Modo opcional (DIRTY_RECTS en config/settings.py) en el que la pantalla
+no se limpia ni se vuelca entera cada frame. Cada subsistema marca las
+zonas que pinta; al frame siguiente esas zonas se restauran desde la
+capa cacheada del tablero (se "borra" lo dibujado) y se vuelve a pintar
+encima, y al final solo se envían a la ventana las zonas del frame
+anterior y del actual con pygame.display.update(rects).
+
+Las zonas se acumulan en una rejilla (array de NumPy) de celdas de
+DIRTY_CELL píxeles: marcar una zona es asignar un trozo del array, las
+partículas se marcan todas de una vez con mark_array, y la lista final
+son pocas franjas horizontales.
+
+Un redibujado completo (fill + flip) ocurre solo al empezar, al cambiar
+el tamaño de la pantalla, al cambiar de escena (invalidate) o si lo
+sucio supera DIRTY_FULL_RATIO de la pantalla.
+"""
+import numpy as np
+import pygame
+
+# Lado de las celdas en que se agrupan las zonas sucias
+DIRTY_CELL = 32
+# Fracción de pantalla a partir de la cual sale más a cuenta un flip
+DIRTY_FULL_RATIO = 0.75
+
+
+class DirtyRectTracker:
+    """Zonas de pantalla pintadas por frame y volcado parcial."""
+
+    def __init__(self, enabled=False, cell=DIRTY_CELL):
+        self.enabled = enabled
+        self.cell = cell
+        # Redibujado completo pendiente (primer frame, resize, escena)
+        self.full = True
+        # Zonas pintadas en el frame anterior: hay que borrarlas en este
+        self.previous = []
+        # Celdas marcadas (filas x columnas) en este frame y en el anterior
+        self._cells = None
+        self._previous_cells = None
+        self._size = None
+
+        # Estadísticas del último frame
+        self.last_rects = 0
+        self.last_area = 0
+        self.full_redraws = 0
+
+    def invalidate(self):
+        """Fuerza un redibujado completo (cambio de escena)."""
+        self.full = True
+
+    def begin_frame(self, size):
+        """Empieza un frame; un cambio de tamaño obliga a redibujar todo."""
+        shape = (-(-size[1] // self.cell), -(-size[0] // self.cell))
+        if size != self._size:
+            self._size = size
+            self.full = True
+            self._previous_cells = np.zeros(shape, dtype=bool)
+        self._cells = np.zeros(shape, dtype=bool)
+
+    @property
+    def partial(self):
+        """True si este frame se compone solo sobre las zonas sucias."""
+        return self.enabled and not self.full
+
+    def mark(self, rect):
+        """Marca una zona de pantalla pintada en este frame."""
+        if not self.enabled:
+            return
+        x, y, w, h = rect
+        if w <= 0 or h <= 0:
+            return
+        cell = self.cell
+        self._cells[max(0, int(y) // cell):max(0, (int(y + h) - 1) // cell + 1),
+                    max(0, int(x) // cell):max(0, (int(x + w) - 1) // cell + 1)] = True
+
+    def mark_all(self, rects):
+        for rect in rects:
+            self.mark(rect)
+
+    def mark_array(self, bounds):
+        """
+        Marca muchas zonas pequeñas a la vez (partículas).
+
+        Args:
+            bounds: array (n, 4) de x, y, ancho, alto
+        """
+        if not self.enabled or not len(bounds):
+            return
+        bounds = np.asarray(bounds, dtype=np.int64)
+        cell = self.cell
+        rows, cols = self._cells.shape
+        x0, y0 = bounds[:, 0], bounds[:, 1]
+        x1 = x0 + np.maximum(bounds[:, 2], 1) - 1
+        y1 = y0 + np.maximum(bounds[:, 3], 1) - 1
+        # Puntos separados como mucho una celda, del borde inicial al final:
+        # entre todos tocan cada celda que cubre la zona
+        steps_x = int((x1 - x0).max()) // cell + 1
+        steps_y = int((y1 - y0).max()) // cell + 1
+        for i in range(steps_x + 1):
+            c = np.minimum(x0 + i * cell, x1) // cell
+            for j in range(steps_y + 1):
+                r = np.minimum(y0 + j * cell, y1) // cell
+                inside = (c >= 0) & (c < cols) & (r >= 0) & (r < rows)
+                self._cells[r[inside], c[inside]] = True
+
+    def _to_rects(self, cells):
+        """Celdas -> franjas horizontales (una por racha de celdas seguidas)."""
+        rows, cols = cells.shape
+        padded = np.zeros((rows, cols + 2), dtype=np.int8)
+        padded[:, 1:-1] = cells
+        edges = np.diff(padded, axis=1)
+        starts = np.argwhere(edges == 1)
+        ends = np.argwhere(edges == -1)[:, 1]
+        cell = self.cell
+        screen_rect = pygame.Rect((0, 0), self._size)
+        return [pygame.Rect(c0 * cell, row * cell, (c1 - c0) * cell, cell).clip(screen_rect)
+                for (row, c0), c1 in zip(starts.tolist(), ends.tolist())]
+
+    def end_frame(self):
+        """
+        Cierra el frame.
+
+        Returns:
+            None si hay que volcar la pantalla entera, o la lista de zonas
+            a actualizar (las del frame anterior más las de este)
+        """
+        cells = self._cells
+        if not self.enabled or self.full:
+            update = None
+        else:
+            update = self._to_rects(cells | self._previous_cells)
+            width, height = self._size
+            self.last_area = sum(r.width * r.height for r in update)
+            if self.last_area > width * height * DIRTY_FULL_RATIO:
+                update = None
+
+        if update is None:
+            self.full_redraws += 1
+            self.last_area = self._size[0] * self._size[1] if self._size else 0
+            self.last_rects = 1
+        else:
+            self.last_rects = len(update)
+
+        self._previous_cells = cells
+        self.previous = self._to_rects(cells) if self.enabled else []
+        self.full = False
+        return update
+
+    def present(self):
+        """Vuelca a la ventana lo pintado en este frame."""
+        update = self.end_frame()
+        if update is None:
+            pygame.display.flip()
+        elif update:
+            pygame.display.update(update)
+
+    def get_stats(self):
+        return {
+            'rects': self.last_rects,
+            'area': self.last_area,
+            'full_redraws': self.full_redraws,
+        }
@@ -0,0 +1,198 @@
+"""
+Frame Profiler - Tiempos por Subsistema
+=======================================
+Mide cuánto tarda cada etapa de TacticalDefenseGame.update y draw (hover,
+turnos, unidades, pasto, partículas, fondo, tablero, figuras, efectos,
+interfaz, flip...) y lo muestra en un HUD con la media de los últimos
+PROFILER_WINDOW frames, p95/p99 y una gráfica del tiempo por frame.
+
+Funciona como un cronómetro de vueltas: lap(etapa) suma a esa etapa el
+tiempo transcurrido desde la vuelta anterior. Apagado, lap() retorna sin
+leer el reloj, así que cuesta una llamada por etapa.
+
+Modos (F3 los recorre): apagado, solo FPS (SHOW_FPS) y completo
+(DEBUG_MODE). El HUD se re-renderiza cada PROFILER_REFRESH frames y entre
+medias solo se copia con un blit.
+"""
+import time
+from collections import deque
+
+import pygame
+
+from systems.text_cache import get_font
+
+PROFILER_OFF = 0
+PROFILER_FPS = 1
+PROFILER_FULL = 2
+
+# Frames de la ventana de medias y percentiles
+PROFILER_WINDOW = 120
+# Cada cuántos frames se re-renderiza el HUD
+PROFILER_REFRESH = 15
+# Presupuesto de un frame (60 FPS), línea de referencia de la gráfica
+FRAME_BUDGET_MS = 1000 / 60
+
+
+def percentile(values, fraction):
+    """Percentil de una lista ya ordenada (sin interpolar)."""
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+class FrameProfiler:
+    """Tiempos por etapa de los últimos frames y su HUD."""
+
+    WIDTH = 300
+    LINE_HEIGHT = 15
+    GRAPH_HEIGHT = 60
+    COLOR_BG = (10, 12, 18, 210)
+    COLOR_TEXT = (200, 220, 255)
+    COLOR_WARN = (255, 180, 80)
+    COLOR_GRAPH = (100, 220, 140)
+    COLOR_BUDGET = (255, 90, 90)
+
+    def __init__(self, mode=PROFILER_OFF, window=PROFILER_WINDOW, clock=time.perf_counter):
+        self.window = window
+        self.clock = clock
+        # {etapa: deque de ms por frame}, en orden de primera aparición
+        self.stages = {}
+        self.frame_ms = deque(maxlen=window)
+        self.interval_ms = deque(maxlen=window)
+        self.frames = 0
+
+        self._current = {}
+        self._frame_start = None
+        self._last = None
+        self._surface = None
+        self.mode = mode
+
+    # ============================================================
+    # MEDICIÓN
+    # ============================================================
+
+    @property
+    def mode(self):
+        return self._mode
+
+    @mode.setter
+    def mode(self, mode):
+        self._mode = mode
+        self.enabled = mode != PROFILER_OFF
+        self._frame_start = None
+        self._surface = None
+
+    def cycle_mode(self):
+        """Apagado -> FPS -> completo -> apagado."""
+        self.mode = (self._mode + 1) % 3
+
+    def begin_frame(self):
+        """Empieza a medir un frame."""
+        if not self.enabled:
+            return
+        now = self.clock()
+        if self._frame_start is not None:
+            self.interval_ms.append((now - self._frame_start) * 1000)
+        self._frame_start = self._last = now
+        self._current = {}
+
+    def lap(self, stage):
+        """Suma a stage el tiempo desde la vuelta anterior."""
+        if not self.enabled or self._last is None:
+            return
+        now = self.clock()
+        self._current[stage] = self._current.get(stage, 0.0) + now - self._last
+        self._last = now
+
+    def end_frame(self):
+        """Cierra el frame y guarda sus tiempos."""
+        if not self.enabled or self._last is None:
+            return
+        self.frame_ms.append((self._last - self._frame_start) * 1000)
+        for stage in self._current:
+            if stage not in self.stages:
+                # Etapa nueva: los frames anteriores cuentan como 0 ms
+                self.stages[stage] = deque([0.0] * (len(self.frame_ms) - 1), maxlen=self.window)
+        for stage, values in self.stages.items():
+            values.append(self._current.get(stage, 0.0) * 1000)
+        self._last = None
+        self.frames += 1
+        if self.frames % PROFILER_REFRESH == 0:
+            self._surface = None
+
+    def get_stats(self):
+        """
+        Returns:
+            {etapa: (media, p95, p99)} en ms, más 'frame' para el total
+        """
+        stats = {}
+        for stage, values in list(self.stages.items()) + [('frame', self.frame_ms)]:
+            ordered = sorted(values)
+            average = sum(ordered) / len(ordered) if ordered else 0.0
+            stats[stage] = (average, percentile(ordered, 0.95), percentile(ordered, 0.99))
+        return stats
+
+    def get_fps(self):
+        """FPS reales según el intervalo medio entre frames."""
+        if not self.interval_ms:
+            return 0.0
+        return 1000 / (sum(self.interval_ms) / len(self.interval_ms))
+
+    # ============================================================
+    # HUD
+    # ============================================================
+
+    def draw(self, screen, x=None, y=70):
+        """
+        Dibuja el HUD (esquina superior derecha por defecto).
+
+        Returns:
+            zona pintada, o None si está apagado
+        """
+        if not self.enabled:
+            return None
+        if self._surface is None:
+            self._surface = self._render()
+        if x is None:
+            x = screen.get_width() - self._surface.get_width() - 10
+        return screen.blit(self._surface, (x, y))
+
+    def _render(self):
+        """Compone el HUD con los tiempos actuales."""
+        font = get_font("consolas", 14)
+        stats = self.get_stats()
+        frame_avg, frame_p95, frame_p99 = stats.pop('frame')
+        lines = [(f"FPS {self.get_fps():5.1f} | frame {frame_avg:5.2f} ms "
+                  f"(p95 {frame_p95:.2f})", self.COLOR_TEXT)]
+        if self._mode == PROFILER_FULL:
+            lines.append((f"{'etapa':<12}{'media':>7}{'p95':>7}{'p99':>7}", self.COLOR_TEXT))
+            for stage, (average, p95, p99) in stats.items():
+                color = self.COLOR_WARN if p95 > FRAME_BUDGET_MS / 4 else self.COLOR_TEXT
+                lines.append((f"{stage:<12}{average:7.2f}{p95:7.2f}{p99:7.2f}", color))
+            lines.append((f"{'total':<12}{frame_avg:7.2f}{frame_p95:7.2f}{frame_p99:7.2f}",
+                          self.COLOR_TEXT))
+
+        graph = self._mode == PROFILER_FULL
+        height = len(lines) * self.LINE_HEIGHT + 8 + (self.GRAPH_HEIGHT + 6 if graph else 0)
+        surface = pygame.Surface((self.WIDTH, height), pygame.SRCALPHA)
+        surface.fill(self.COLOR_BG)
+        for i, (text, color) in enumerate(lines):
+            surface.blit(font.render(text, True, color), (6, 4 + i * self.LINE_HEIGHT))
+        if graph:
+            self._draw_graph(surface, pygame.Rect(6, height - self.GRAPH_HEIGHT - 6,
+                                                  self.WIDTH - 12, self.GRAPH_HEIGHT))
+        return surface
+
+    def _draw_graph(self, surface, rect):
+        """Barras con el tiempo de cada frame; la línea roja es el presupuesto."""
+        pygame.draw.rect(surface, (30, 35, 45), rect)
+        scale = rect.height / (FRAME_BUDGET_MS * 2)
+        bar_w = rect.width / self.window
+        for i, ms in enumerate(self.frame_ms):
+            h = min(rect.height, max(1, int(ms * scale)))
+            color = self.COLOR_BUDGET if ms > FRAME_BUDGET_MS else self.COLOR_GRAPH
+            pygame.draw.line(surface, color,
+                             (rect.x + int(i * bar_w), rect.bottom - 1),
+                             (rect.x + int(i * bar_w), rect.bottom - h))
+        budget_y = rect.bottom - int(FRAME_BUDGET_MS * scale)
+        pygame.draw.line(surface, self.COLOR_BUDGET, (rect.x, budget_y), (rect.right - 1, budget_y))
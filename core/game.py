@@ -8,6 +8,10 @@ Punto central del juego. Maneja:
 - Eventos de botones
 - Coordinación entre módulos
 """
+import os
+import random
+import time
+
 import pygame
 from config.constants import *
 from config.settings import *
@@ -16,6 +20,7 @@ from config.settings import *
 from systems import GrassSystem, ParticleSystem
 from systems.alternating_turn_system import AlternatingTurnSystem, AlternatingPhase
 from systems.enemy_ai import EnemyAI
+from systems.text_cache import get_font
 from systems.sound_generator import SoundGenerator
 from systems.music_dopamine import start_music as start_epic_music, stop_music
 
@@ -25,6 +30,7 @@ from core.unit_manager import UnitManager
 from core.combat_handler import CombatHandler
 from core.animation_manager import AnimationManager
 from core.renderer import GameRenderer
+from core.frame_profiler import FrameProfiler, PROFILER_OFF, PROFILER_FPS, PROFILER_FULL
 
 # UI y Entidades
 from ui import OracleOfKimi, PersistentMenu
@@ -35,32 +41,60 @@ from entities import Hero
 class TacticalDefenseGame:
     """Juego principal - Coordinador de sistemas."""
     
-    def __init__(self):
+    def __init__(self, grid_cols=GRID_COLS, grid_rows=GRID_ROWS, headless=False, seed=None):
+        """
+        Args:
+            headless: sin ventana ni audio (driver SDL dummy); se dibuja en
+                una superficie en memoria y no se reproduce música
+            seed: semilla de random y del pasto para partidas reproducibles
+        """
+        self.headless = headless
+        if headless:
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
+        if seed is not None:
+            random.seed(seed)
+        
         pygame.init()
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption("Tower Defense Táctico - Day R Combat")
+        if headless:
+            self.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        else:
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+            pygame.display.set_caption("Tower Defense Táctico - Day R Combat")
         self.clock = pygame.time.Clock()
         
         # Fuentes
-        self.font_large = pygame.font.SysFont("arial", 52, bold=True)
-        self.font_medium = pygame.font.SysFont("arial", 28)
-        self.font_small = pygame.font.SysFont("arial", 22)
+        self.font_large = get_font("arial", 52, bold=True)
+        self.font_medium = get_font("arial", 28)
+        self.font_small = get_font("arial", 22)
         
         # Sistemas visuales
-        self.grass = GrassSystem(SCREEN_WIDTH, SCREEN_HEIGHT)
+        self.grass = GrassSystem(SCREEN_WIDTH, SCREEN_HEIGHT, seed=seed)
         self.particles = ParticleSystem()
         self.oracle = OracleOfKimi()
         
         # Sistema de audio
         self.sounds = SoundGenerator()
         
-        # Módulos core
-        self.grid = GridManager()
+        # Módulos core (dimensiones del mapa configurables)
+        self.grid_cols = grid_cols
+        self.grid_rows = grid_rows
+        self.grid = GridManager(grid_cols, grid_rows)
         self.units = UnitManager(self.grid)
         self.combat = CombatHandler(self.grid, self.units, self.particles)
         self.animations = AnimationManager(self.particles)
         self.enemy_ai = EnemyAI(self.grid, self.units, self.particles)
-        self.renderer = GameRenderer(self.screen, self.font_large, self.font_medium, self.font_small)
+        self.renderer = GameRenderer(self.screen, self.font_large, self.font_medium, self.font_small,
+                                     dirty_rects=DIRTY_RECTS, headless=headless,
+                                     lod_level=LOD_LEVEL)
+        
+        # Profiler por etapas (F3 cambia de modo). En headless va apagado:
+        # el HUD mostraría tiempos reales y rompería los checksums
+        if headless:
+            profiler_mode = PROFILER_OFF
+        else:
+            profiler_mode = PROFILER_FULL if DEBUG_MODE else PROFILER_FPS if SHOW_FPS else PROFILER_OFF
+        self.profiler = FrameProfiler(profiler_mode)
         
         # Sistema de turnos
         self.alt_turn_system = AlternatingTurnSystem()
@@ -98,7 +132,8 @@ class TacticalDefenseGame:
         self.selected_tile = None
         
         # Resetear módulos
-        self.grid = GridManager()
+        self.grid = GridManager(self.grid_cols, self.grid_rows)
+        self.grid.update_hover(pygame.mouse.get_pos())
         self.units = UnitManager(self.grid)
         self.units.setup_initial_units()
         
@@ -111,13 +146,15 @@ class TacticalDefenseGame:
         self.alt_turn_system.setup(self.units.hero, troops, self.units.enemy_units)
         
         # Limpiar UI
-        self.oracle.clear_recommendation(self.grid.grid)
+        self.oracle.clear_recommendation(self.grid)
         self.persistent_menu.clear()
         self.animations.clear()
         self.combat.clear_projectiles()
+        self.renderer.invalidate()
         
         # Iniciar música épica con nuevo sistema robusto
-        start_epic_music()
+        if not self.headless:
+            start_epic_music()
     
     # ============================================================
     # CALLBACKS DEL SISTEMA DE TURNOS
@@ -130,7 +167,7 @@ class TacticalDefenseGame:
         
         # Limpiar selección anterior
         if self.selected_tile:
-            self.selected_tile.selected = False
+            self.grid.set_selected(self.selected_tile, False)
             self.selected_tile = None
         
         # Auto-seleccionar unidad del jugador
@@ -138,7 +175,7 @@ class TacticalDefenseGame:
             tile = self.grid.get_unit_tile(unit)
             if tile:
                 self.selected_tile = tile
-                tile.selected = True
+                self.grid.set_selected(tile)
                 if unit_type == 'hero':
                     self._show_hero_menu(unit)
                 else:
@@ -164,6 +201,7 @@ class TacticalDefenseGame:
         """Maneja todo el input del usuario."""
         mouse_pos = pygame.mouse.get_pos()
         dt = self.clock.tick(FPS) / 1000.0
+        self.profiler.begin_frame()
         
         # Actualizar menú
         self.persistent_menu.update(mouse_pos, dt)
@@ -176,9 +214,19 @@ class TacticalDefenseGame:
             if event.type == pygame.QUIT:
                 return False
             
+            # La ventana se ha vuelto a mostrar: volcar la pantalla entera
+            if event.type == pygame.VIDEOEXPOSE:
+                self.renderer.invalidate()
+            
             if event.type == pygame.KEYDOWN:
                 self._handle_keydown(event.key)
             
+            # Hover del grid: solo cuando el ratón se mueve
+            if event.type == pygame.MOUSEMOTION:
+                self.profiler.lap('entrada')
+                self.grid.update_hover(event.pos)
+                self.profiler.lap('hover')
+            
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 # Sonido de click al presionar
                 self.sounds.button_click().play()
@@ -197,6 +245,7 @@ class TacticalDefenseGame:
                 if self.phase in [PHASE_VICTORY, PHASE_DEFEAT]:
                     self.btn_restart.handle_click(mouse_pos, pressed=False)
         
+        self.profiler.lap('entrada')
         return True
     
     def _handle_keydown(self, key):
@@ -209,6 +258,15 @@ class TacticalDefenseGame:
         
         if key == pygame.K_r and self.phase in [PHASE_VICTORY, PHASE_DEFEAT]:
             self.reset_game()
+        
+        # Profiler: apagado -> FPS -> completo
+        if key == pygame.K_F3:
+            self.profiler.cycle_mode()
+            self.renderer.invalidate()
+        
+        # Nivel de detalle: automático -> completo -> silueta -> ficha
+        if key == pygame.K_F4:
+            self.renderer.lod.cycle_level()
     
     def _handle_click(self, mouse_pos):
         """Maneja clicks en el grid."""
@@ -255,7 +313,7 @@ class TacticalDefenseGame:
     def _select_unit(self, tile):
         """Selecciona una unidad."""
         self.selected_tile = tile
-        tile.selected = True
+        self.grid.set_selected(tile)
         self.grid.update_valid_moves(tile)
         
         if self.alt_turn_system.is_hero_turn():
@@ -264,24 +322,24 @@ class TacticalDefenseGame:
             self._show_troop_menu(tile.unit)
         
         self.oracle.analyze_battlefield(
-            tile.unit, tile, self.grid.grid,
+            tile.unit, tile, self.grid,
             self.units.player_units, self.units.enemy_units
         )
     
     def _clear_selection(self):
         """Limpia la selección actual."""
         if self.selected_tile:
-            self.selected_tile.selected = False
+            self.grid.set_selected(self.selected_tile, False)
             self.selected_tile = None
         self.persistent_menu.clear()
-        self.oracle.clear_recommendation(self.grid.grid)
+        self.oracle.clear_recommendation(self.grid)
         self.grid.update_valid_moves(None)
     
     def _switch_selection(self, current_tile, new_tile):
         """Cambia la selección a otra unidad."""
-        current_tile.selected = False
+        self.grid.set_selected(current_tile, False)
         self.selected_tile = new_tile
-        new_tile.selected = True
+        self.grid.set_selected(new_tile)
         self.grid.update_valid_moves(new_tile)
         
         if self.alt_turn_system.is_hero_turn():
@@ -298,10 +356,10 @@ class TacticalDefenseGame:
             # Sonido de paso al moverse
             self.sounds.footstep('grass', 'normal').play()
             
-            from_tile.selected = False
+            self.grid.set_selected(from_tile, False)
             self.selected_tile = None
             self.persistent_menu.clear()
-            self.oracle.clear_recommendation(self.grid.grid)
+            self.oracle.clear_recommendation(self.grid)
             self.grid.update_valid_moves(None)
     
     def _execute_attack(self, attacker, target):
@@ -411,23 +469,24 @@ class TacticalDefenseGame:
     
     def update(self, dt):
         """Actualiza el estado del juego."""
-        mouse_pos = pygame.mouse.get_pos()
-        
-        # Actualizar grid
-        self.grid.update(mouse_pos)
+        profiler = self.profiler
         
         # Actualizar sistema de turnos
         self._update_turn_system(dt)
+        profiler.lap('turnos')
         
         # Actualizar animaciones
         self.animations.update(dt)
         self.animations.update_projectiles(dt)
+        profiler.lap('animaciones')
         
         # Actualizar grass
         self.grass.update(dt)
+        profiler.lap('pasto')
         
         # Actualizar partículas
         self.particles.update(dt)
+        profiler.lap('partículas')
     
     def _update_turn_system(self, dt):
         """Actualiza el sistema de turnos."""
@@ -444,7 +503,9 @@ class TacticalDefenseGame:
         # Actualizar unidad activa
         active = alt.active_unit
         if active:
+            self.profiler.lap('turnos')
             self.units.update(dt, self.grass)
+            self.profiler.lap('unidades')
         
         # Procesar turno enemigo
         if alt.is_enemy_turn() and active:
@@ -473,17 +534,19 @@ class TacticalDefenseGame:
     
     def draw(self):
         """Dibuja el juego."""
+        profiler = self.profiler
         self.renderer.clear_screen()
-        self.renderer.draw_background(self.grass, self.grid.neutral_zone_y)
+        self.renderer.draw_background(self.grass, self.grid)
+        profiler.lap('fondo')
         self.renderer.draw_grid(self.grid)
+        profiler.lap('tablero')
         self.renderer.draw_units_and_towers(self.grid)
+        profiler.lap('figuras')
         
-        # Proyectiles
+        # Proyectiles y partículas
         all_projectiles = self.combat.projectiles + self.enemy_ai.projectiles + self.animations.projectiles
-        self.renderer.draw_projectiles(all_projectiles)
-        
-        # Partículas
-        self.renderer.draw_particles(self.particles)
+        self.renderer.draw_effects(all_projectiles, self.particles)
+        profiler.lap('efectos')
         
         # UI
         self.renderer.draw_ui(self.alt_turn_system, self.units, 
@@ -494,13 +557,24 @@ class TacticalDefenseGame:
             self.renderer.draw_victory_screen(self.btn_restart)
         elif self.phase == PHASE_DEFEAT:
             self.renderer.draw_defeat_screen(self.btn_restart)
+        profiler.lap('interfaz')
         
+        self.renderer.draw_profiler(profiler)
+        profiler.lap('hud')
         self.renderer.flip_display()
+        profiler.lap('flip')
+        profiler.end_frame()
     
     # ============================================================
     # MAIN LOOP
     # ============================================================
     
+    def step(self, dt):
+        """Un frame sin input ni espera del reloj (modo headless)."""
+        self.profiler.begin_frame()
+        self.update(dt)
+        self.draw()
+    
     def run(self):
         """Loop principal del juego."""
         running = True
@@ -508,8 +582,12 @@ class TacticalDefenseGame:
             while running:
                 dt = self.clock.tick(FPS) / 1000.0
                 running = self.handle_input()
+                # Tiempo de CPU de update + draw (sin la espera del reloj)
+                # para el nivel de detalle automático
+                start = time.perf_counter()
                 self.update(dt)
                 self.draw()
+                self.renderer.lod.report_frame((time.perf_counter() - start) * 1000)
         finally:
             # Asegurar que el audio se detenga al cerrar
             stop_music()
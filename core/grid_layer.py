@@ -0,0 +1,123 @@
+"""
+Grid Layer - Capa Cacheada del Tablero
+======================================
+El tablero (fondo de la zona de juego + tiles hexagonales) casi nunca
+cambia, así que se dibuja una vez en una superficie propia y cada frame
+solo se copia con un blit. Los tiles que cambian de aspecto (hover,
+selección, movimientos válidos, oráculo) llegan por
+GridManager.pop_dirty_tiles() y se recomponen recortando la superficie
+a su zona: se repinta el fondo y se vuelven a dibujar, en orden de Y,
+todos los tiles que tocan esa zona. Solo los tiles con glow (seleccionado,
+oráculo) pintan fuera de su hexágono, así que se siguen aparte.
+"""
+import pygame
+from config.constants import HEX_RADIUS
+
+
+class GridLayer:
+    """Superficie opaca con el tablero y redibujado por tiles sucios."""
+
+    def __init__(self, grid_manager, size, area, paint_background):
+        """
+        Args:
+            grid_manager: GridManager a dibujar
+            size: tamaño de la pantalla destino
+            area: rectángulo opaco que cubre la capa (zona de juego)
+            paint_background: callback(surface) que pinta el fondo bajo los tiles
+        """
+        self.grid = grid_manager
+        self.size = size
+        self.area = pygame.Rect(area).clip(pygame.Rect((0, 0), size))
+        self.paint_background = paint_background
+
+        self.surface = pygame.Surface(size)
+        # Lienzo auxiliar: recortar el dibujado de polígonos cambia su
+        # rasterizado, así que los tiles se dibujan enteros aquí y solo se
+        # copia la zona sucia a la capa
+        self._scratch = pygame.Surface(size)
+        
+        # Tiles dibujados con glow en la capa (pintan más allá del hexágono)
+        self._glowing = set()
+
+        # Estadísticas del último frame (benchmarks / depuración)
+        self.tiles_redrawn = 0
+
+        self.rebuild()
+
+    def rebuild(self):
+        """Redibuja el tablero completo."""
+        self.grid.pop_dirty_tiles()
+        self._glowing = {t for t in self.grid.tiles if self._has_glow(t)}
+        self._redraw(self.area)
+
+    @staticmethod
+    def _has_glow(tile):
+        """Mismo criterio que HoneycombTile.draw para el glow."""
+        return tile.oracle_recommended or tile.selected
+
+    def tile_rect(self, tile, glow=False):
+        """Zona de pantalla que pinta un tile (hexágono + paredes, o glow)."""
+        if glow:
+            extent = int(HEX_RADIUS * 1.5) + 1
+            return pygame.Rect(tile.x - extent, tile.y - extent, extent * 2, extent * 2)
+        half_h = int(HEX_RADIUS * 0.87) + 2
+        return pygame.Rect(tile.x - HEX_RADIUS - 2, tile.y - half_h,
+                           HEX_RADIUS * 2 + 4, half_h * 2 + tile.wall_height + 2)
+
+    def _redraw(self, rect):
+        """Repinta una zona: fondo y tiles que la tocan, en orden de Y."""
+        rect = rect.clip(self.area)
+        if not rect:
+            return
+
+        # Tiles cuyo hexágono toca la zona + tiles con glow que llegan a ella
+        tiles = [t for t in self.grid.get_visible_tiles(tuple(rect), HEX_RADIUS + 2)
+                 if t in self._glowing or self.tile_rect(t).colliderect(rect)]
+        glows = [t for t in self._glowing
+                 if t not in tiles and self.tile_rect(t, True).colliderect(rect)]
+        if glows:
+            tiles = sorted(tiles + glows, key=lambda t: (t.y, t.x))
+
+        scratch = self._scratch
+        scratch.set_clip(rect)
+        self.paint_background(scratch)
+        scratch.set_clip(None)
+        for tile in tiles:
+            tile.draw(scratch)
+        self.surface.blit(scratch, rect.topleft, rect)
+        self.tiles_redrawn += len(tiles)
+
+    def draw(self, screen, restore=None):
+        """
+        Recompone los tiles sucios y copia la capa a pantalla.
+
+        Args:
+            restore: None copia la capa entera; con una lista de Rect (modo
+                dirty-rect) solo se copian esas zonas y las de los tiles
+                recompuestos
+
+        Returns:
+            zonas de los tiles recompuestos en este frame
+        """
+        self.tiles_redrawn = 0
+        dirty = self.grid.pop_dirty_tiles()
+        
+        # Un tile que pierde el glow debe limpiar también su halo anterior
+        rects = []
+        for tile in dirty:
+            glow = self._has_glow(tile)
+            rects.append(self.tile_rect(tile, glow or tile in self._glowing))
+            if glow:
+                self._glowing.add(tile)
+            else:
+                self._glowing.discard(tile)
+        for rect in rects:
+            self._redraw(rect)
+        if restore is None:
+            screen.blit(self.surface, self.area.topleft, self.area)
+        else:
+            for rect in list(restore) + rects:
+                rect = rect.clip(self.area)
+                if rect:
+                    screen.blit(self.surface, rect.topleft, rect)
+        return rects
@@ -3,114 +3,254 @@ Grid Manager - Gestión del Grid Hexagonal
 =========================================
 Maneja la creación, consulta y operaciones sobre el grid de hexágonos.
 """
-import math
+from array import array
 from config.constants import *
 from systems.grid import HoneycombTile
+from systems.hex_layout import HexLayout
+from core.depth_order import DepthOrder
 
 
 class GridManager:
     """Gestiona el grid hexagonal del juego."""
     
-    def __init__(self):
+    def __init__(self, cols=GRID_COLS, rows=GRID_ROWS):
+        self.layout = HexLayout(cols, rows)
         self.grid = {}
+        self.tiles = []            # tiles por índice (tile.index)
+        self.neighbor_table = None # array('i') de 6 vecinos por tile, -1 = sin vecino
         self.neutral_zone_y = 0
+        self.hovered_tile = None
+        self._visible_cache = {}  # (rect, margen) -> tiles visibles ordenados por Y
+        
+        # Índice de ocupación inverso: unidad/torre -> tile
+        self._unit_tiles = {}
+        self._tower_tiles = {}
+        # Unidades y torres en orden de dibujado (se mantiene al colocar/retirar)
+        self.draw_order = DepthOrder()
+        self._tiles_by_y = None
+        
+        # Versión de ocupación y oyentes de cambios (cachés de pathfinding, etc.)
+        self.occupancy_version = 0
+        self.cost_version = 0
+        self._occupancy_listeners = []
+        
+        # Tiles resaltados (solo se tocan los que cambian) y tiles cuyo
+        # aspecto cambió desde que el renderer los recogió por última vez
+        self.selected_tiles = set()
+        self.valid_move_tiles = set()
+        self.oracle_tiles = set()
+        self.dirty_tiles = set()
+        
         self._create_grid()
     
     def _create_grid(self):
         """Crea el grid hexagonal con zonas de jugador y enemigo."""
-        total_width = GRID_COLS * HEX_WIDTH * 0.75
-        start_x = (SCREEN_WIDTH - total_width) // 2 + HEX_RADIUS
-        
-        # Zona del jugador (filas positivas)
-        for row in range(GRID_ROWS):
-            for col in range(GRID_COLS):
-                x = start_x + col * HEX_WIDTH * 0.75
-                y = ZONE_PLAYER_Y + row * HEX_HEIGHT
-                if col % 2 == 1:
-                    y += HEX_HEIGHT // 2
-                
-                tile = HoneycombTile(col, row, int(x), int(y), "player", False)
-                self.grid[(col, row)] = tile
+        layout = self.layout
         
-        # Zona enemiga (filas negativas)
-        for row in range(GRID_ROWS):
-            for col in range(GRID_COLS):
-                x = start_x + col * HEX_WIDTH * 0.75
-                y = ZONE_ENEMY_Y + (GRID_ROWS - 1 - row) * HEX_HEIGHT
-                if col % 2 == 1:
-                    y += HEX_HEIGHT // 2
-                
-                tile = HoneycombTile(col, -(row + 1), int(x), int(y), "enemy", False)
-                self.grid[(col, -(row + 1))] = tile
+        # Zona del jugador (filas positivas) y zona enemiga (filas negativas)
+        for col, row in layout.keys():
+            x, y = layout.center(col, row)
+            tile = HoneycombTile(col, row, x, y, layout.owner(row), False)
+            tile.index = len(self.tiles)
+            self.tiles.append(tile)
+            self.grid[(col, row)] = tile
         
-        self.neutral_zone_y = (ZONE_ENEMY_Y + ZONE_PLAYER_Y) // 2
+        self._build_neighbor_table()
+        self.neutral_zone_y = (layout.enemy_y + layout.player_y) // 2
+    
+    def _build_neighbor_table(self):
+        """
+        Precalcula la adyacencia una sola vez: tabla plana de enteros con
+        los índices de los 6 vecinos de cada tile (-1 si no existe).
+        """
+        table = array('i', [-1]) * (len(self.tiles) * 6)
+        for tile in self.tiles:
+            base = tile.index * 6
+            for slot, key in enumerate(self.layout.neighbor_keys(tile.col, tile.row)):
+                neighbor = self.grid.get(key)
+                if neighbor is not None:
+                    table[base + slot] = neighbor.index
+        self.neighbor_table = table
+    
+    def get_neighbors(self, tile):
+        """Tiles adyacentes a un tile (lectura directa de la tabla)."""
+        base = tile.index * 6
+        tiles = self.tiles
+        return [tiles[i] for i in self.neighbor_table[base:base + 6] if i >= 0]
     
     def find_tile(self, pos):
-        """Encuentra el tile en la posición dada (mouse)."""
-        for tile in self.grid.values():
-            dx = pos[0] - tile.x
-            dy = pos[1] - tile.y
-            if (dx**2 + dy**2)**0.5 <= HEX_RADIUS * 0.9:
-                return tile
-        return None
+        """
+        Encuentra el tile en la posición dada (mouse).
+        O(1): se invierte la geometría del panal y solo se comprueban el
+        hexágono candidato y sus vecinos (quedándose con el más cercano).
+        """
+        px, py = pos
+        layout = self.layout
+        col, row = layout.pixel_to_key(px, py)
+        
+        best = None
+        best_dist = layout.hit_radius_sq
+        for key in [(col, row)] + layout.neighbor_keys(col, row):
+            tile = self.grid.get(key)
+            if tile is None:
+                continue
+            dist = (px - tile.x) ** 2 + (py - tile.y) ** 2
+            if dist <= best_dist:
+                best_dist = dist
+                best = tile
+        return best
     
     def get_unit_tile(self, unit):
-        """Obtiene el tile donde está ubicada una unidad."""
-        for tile in self.grid.values():
-            if getattr(tile, 'unit', None) == unit:
-                return tile
-        return None
+        """Obtiene el tile donde está ubicada una unidad (O(1))."""
+        return self._unit_tiles.get(unit)
     
     def get_tower_tile(self, tower):
-        """Obtiene el tile donde está ubicada una torre."""
-        for tile in self.grid.values():
-            if getattr(tile, 'tower', None) == tower:
-                return tile
-        return None
+        """Obtiene el tile donde está ubicada una torre (O(1))."""
+        return self._tower_tiles.get(tower)
+    
+    # ============================================================
+    # OCUPACIÓN (toda escritura de tile.unit / tile.tower pasa por aquí)
+    # ============================================================
+    
+    def add_occupancy_listener(self, callback):
+        """Registra callback(tile) que se llama cada vez que cambia un tile."""
+        self._occupancy_listeners.append(callback)
+    
+    def _occupancy_changed(self, tile):
+        """Incrementa la versión y avisa a los oyentes."""
+        self.occupancy_version += 1
+        for callback in self._occupancy_listeners:
+            callback(tile)
+    
+    def place_unit(self, tile, unit):
+        """Coloca una unidad en un tile (la retira de su tile anterior)."""
+        previous = self._unit_tiles.get(unit)
+        if previous is tile and tile.unit is unit:
+            return
+        if previous is not None and previous is not tile:
+            previous.unit = None
+            self._occupancy_changed(previous)
+        if tile.unit is not None and tile.unit is not unit:
+            self._unit_tiles.pop(tile.unit, None)
+            self.draw_order.remove(tile.unit)
+        tile.unit = unit
+        self._unit_tiles[unit] = tile
+        self.draw_order.place_unit(unit, tile)
+        self._occupancy_changed(tile)
+    
+    def remove_unit(self, tile):
+        """Vacía la unidad de un tile."""
+        if tile.unit is not None:
+            self._unit_tiles.pop(tile.unit, None)
+            self.draw_order.remove(tile.unit)
+            tile.unit = None
+            self._occupancy_changed(tile)
+    
+    def place_tower(self, tile, tower):
+        """Coloca una torre en un tile."""
+        previous = self._tower_tiles.get(tower)
+        if previous is tile and tile.tower is tower:
+            return
+        if previous is not None and previous is not tile:
+            previous.tower = None
+            self._occupancy_changed(previous)
+        if tile.tower is not None and tile.tower is not tower:
+            self._tower_tiles.pop(tile.tower, None)
+            self.draw_order.remove(tile.tower)
+        tile.tower = tower
+        self._tower_tiles[tower] = tile
+        self.draw_order.place_tower(tower, tile)
+        self._occupancy_changed(tile)
+    
+    def remove_tower(self, tile):
+        """Vacía la torre de un tile."""
+        if tile.tower is not None:
+            self._tower_tiles.pop(tile.tower, None)
+            self.draw_order.remove(tile.tower)
+            tile.tower = None
+            self._occupancy_changed(tile)
+    
+    def set_movement_cost(self, tile, cost):
+        """Cambia el coste extra de movimiento de un tile (terreno difícil)."""
+        if tile.movement_cost != cost:
+            tile.movement_cost = cost
+            self.cost_version += 1
+            self._occupancy_changed(tile)
     
     def get_tile(self, col, row):
         """Obtiene un tile por coordenadas."""
         return self.grid.get((col, row))
     
+    # ============================================================
+    # RESALTADO (selección, movimientos válidos, oráculo)
+    # ============================================================
+    
+    def _set_flag(self, tile, attr, tiles, value):
+        """Cambia un flag visual de un tile manteniendo su set y los sucios."""
+        if getattr(tile, attr) == value:
+            return
+        setattr(tile, attr, value)
+        if value:
+            tiles.add(tile)
+        else:
+            tiles.discard(tile)
+        self.dirty_tiles.add(tile)
+    
+    def _replace_flag(self, attr, tiles, new_tiles):
+        """Deja marcados exactamente new_tiles tocando solo la diferencia."""
+        for tile in tiles - new_tiles:
+            self._set_flag(tile, attr, tiles, False)
+        for tile in new_tiles - tiles:
+            self._set_flag(tile, attr, tiles, True)
+    
+    def set_selected(self, tile, selected=True):
+        """Marca o desmarca un tile como seleccionado."""
+        self._set_flag(tile, 'selected', self.selected_tiles, selected)
+    
+    def set_oracle_recommended(self, tile):
+        """Tile recomendado por el oráculo (None = ninguno)."""
+        new_tiles = {tile} if tile is not None else set()
+        self._replace_flag('oracle_recommended', self.oracle_tiles, new_tiles)
+    
     def update_valid_moves(self, selected_tile):
         """Actualiza los tiles válidos para movimiento."""
-        # Limpiar movimientos válidos previos
-        for tile in self.grid.values():
-            tile.valid_move = False
-        
-        if not selected_tile:
-            return
-        
-        unit = selected_tile.unit
-        if not unit or unit.has_moved:
-            return
-        
-        # Marcar vecinos vacíos como válidos
-        neighbors = selected_tile.get_neighbors(self.grid)
-        for neighbor in neighbors:
-            if neighbor.is_empty():
-                neighbor.valid_move = True
+        new_tiles = set()
+        unit = selected_tile.unit if selected_tile else None
+        if unit and not unit.has_moved:
+            # Marcar vecinos vacíos como válidos
+            new_tiles = {n for n in self.get_neighbors(selected_tile) if n.is_empty()}
+        self._replace_flag('valid_move', self.valid_move_tiles, new_tiles)
+    
+    def mark_dirty(self, tile):
+        """Marca un tile para redibujar (hover, ocupación...)."""
+        if tile is not None:
+            self.dirty_tiles.add(tile)
+    
+    def pop_dirty_tiles(self):
+        """Devuelve los tiles que cambiaron de aspecto y vacía el registro."""
+        dirty = self.dirty_tiles
+        self.dirty_tiles = set()
+        return dirty
     
     def move_unit(self, from_tile, to_tile):
         """Mueve una unidad de un tile a otro."""
         unit = from_tile.unit
-        to_tile.unit = unit
-        from_tile.unit = None
+        self.place_unit(to_tile, unit)
         unit.move_to(to_tile.x, to_tile.y)
     
     def clear_dead_units(self):
         """Limpia unidades muertas del grid."""
-        for tile in self.grid.values():
-            if getattr(tile, 'unit', None) and not tile.unit.is_alive():
-                tile.unit = None
-            if getattr(tile, 'tower', None) and not tile.tower.is_alive():
-                tile.tower = None
+        for unit, tile in list(self._unit_tiles.items()):
+            if not unit.is_alive():
+                self.remove_unit(tile)
+        for tower, tile in list(self._tower_tiles.items()):
+            if not tower.is_alive():
+                self.remove_tower(tile)
     
     def clear_selections(self):
         """Limpia todas las selecciones del grid."""
-        for tile in self.grid.values():
-            tile.selected = False
-            tile.valid_move = False
+        self._replace_flag('selected', self.selected_tiles, set())
+        self._replace_flag('valid_move', self.valid_move_tiles, set())
     
     def get_empty_tiles_in_zone(self, zone="enemy"):
         """Obtiene tiles vacíos en una zona específica."""
@@ -118,24 +258,69 @@ class GridManager:
                 if t.owner == zone and t.is_empty()]
     
     def get_tiles_sorted_by_y(self):
-        """Retorna tiles ordenados por coordenada Y (para dibujado)."""
-        return sorted(self.grid.values(), key=lambda t: t.y)
+        """
+        Retorna tiles ordenados por coordenada Y (para dibujado). Los tiles
+        no se mueven: se ordena una vez y se reutiliza la lista.
+        """
+        if self._tiles_by_y is None:
+            self._tiles_by_y = sorted(self.tiles, key=lambda t: t.y)
+        return self._tiles_by_y
     
-    def get_all_units_and_towers(self, sorted_by_y=True):
-        """Obtiene todas las unidades y torres con sus posiciones."""
-        items = []
-        for tile in self.grid.values():
-            if tile.unit:
-                visual_y = tile.unit.visual_y if tile.unit.is_moving else tile.y
-                items.append((visual_y, tile.unit, tile))
-            if tile.tower:
-                items.append((tile.y, tile.tower, tile))
+    def get_visible_tiles(self, rect, margin=HEX_RADIUS * 1.5):
+        """
+        Tiles que pueden verse dentro de rect (x, y, w, h), en orden de
+        dibujado (Y creciente). Coste proporcional a lo visible, no al mapa:
+        el rango sale del layout y el resultado se cachea por rectángulo.
+        margin amplía el rectángulo (por defecto cubre el glow de un tile).
+        """
+        rect = tuple(rect)
+        cached = self._visible_cache.get((rect, margin))
+        if cached is not None:
+            return cached
+        
+        x, y, w, h = rect
+        tiles = []
+        span = self.layout.visible_range(x, y, x + w, y + h, margin)
+        if span:
+            col0, col1, g0, g1 = span
+            rows = self.layout.rows
+            for g in range(g0, g1 + 1):
+                # Dentro de una fila global las columnas pares van más arriba
+                for parity in (0, 1):
+                    first = col0 + ((parity - col0) % 2)
+                    for col in range(first, col1 + 1, 2):
+                        tiles.append(self.grid[(col, g - rows)])
         
+        self._visible_cache[(rect, margin)] = tiles
+        return tiles
+    
+    def get_all_units_and_towers(self, sorted_by_y=True):
+        """
+        Obtiene todas las unidades y torres con sus posiciones. Ordenadas
+        salen de la lista de dibujado persistente (sin ordenar por frame).
+        """
         if sorted_by_y:
-            items.sort(key=lambda x: x[0])
+            return self.draw_order.items()
+        items = []
+        for unit, tile in self._unit_tiles.items():
+            visual_y = unit.visual_y if unit.is_moving else tile.y
+            items.append((visual_y, unit, tile))
+        for tower, tile in self._tower_tiles.items():
+            items.append((tile.y, tower, tile))
         return items
     
-    def update(self, mouse_pos):
-        """Actualiza el estado de hover de los tiles."""
-        for tile in self.grid.values():
-            tile.update(mouse_pos)
+    def update_hover(self, mouse_pos):
+        """
+        Actualiza el tile bajo el ratón. Llamar solo con MOUSEMOTION: sin
+        movimiento no hay trabajo. Ensucia el tile anterior y el nuevo.
+        """
+        tile = self.find_tile(mouse_pos)
+        if tile is self.hovered_tile:
+            return
+        if self.hovered_tile:
+            self.hovered_tile.hovered = False
+            self.dirty_tiles.add(self.hovered_tile)
+        if tile:
+            tile.hovered = True
+            self.dirty_tiles.add(tile)
+        self.hovered_tile = tile
@@ -0,0 +1,176 @@
+"""
+Headless - Partidas sin Pantalla
+================================
+Ejecuta TacticalDefenseGame sin ventana ni audio (driver SDL dummy y
+pantalla en memoria) tan rápido como se pueda: sin eventos ni espera del
+reloj, con un dt fijo por frame. Sirve para medir y hacer tests de
+regresión del render en máquinas sin display.
+
+Las animaciones que leen pygame.time.get_ticks ven un reloj simulado que
+avanza dt por frame, así que con la misma semilla cada frame sale igual
+y su checksum es reproducible.
+
+Ejecutar: python -m core.headless --frames 600
+         python -m core.headless --frames 120 --autoplay --checksums sums.txt
+         python -m core.headless --frames 60 --dump frames/
+"""
+import argparse
+import hashlib
+import os
+import random
+import sys
+import time
+
+import pygame
+
+# Frames por segundo simulados (dt fijo)
+HEADLESS_FPS = 60
+
+
+def frame_checksum(surface):
+    """SHA-1 de los píxeles RGB de una superficie."""
+    return hashlib.sha1(pygame.image.tobytes(surface, 'RGB')).hexdigest()
+
+
+class HeadlessRunner:
+    """Partida headless que avanza frame a frame."""
+
+    def __init__(self, seed=0, dt=1 / HEADLESS_FPS, autoplay=False, **game_args):
+        """
+        Args:
+            seed: semilla de la partida (random y pasto)
+            dt: segundos simulados por frame
+            autoplay: el jugador mueve cada unidad a una casilla válida al
+                azar y termina el turno, para que haya combate
+            game_args: argumentos extra de TacticalDefenseGame (grid_cols...)
+        """
+        from core.game import TacticalDefenseGame
+
+        self.dt = dt
+        self.autoplay = autoplay
+        self.frame = 0
+        self.ticks = 0.0
+        self._real_get_ticks = pygame.time.get_ticks
+        pygame.time.get_ticks = self.get_ticks
+        try:
+            self.game = TacticalDefenseGame(headless=True, seed=seed, **game_args)
+        except Exception:
+            self.close()
+            raise
+        self._rng = random.Random(seed)
+
+        # Estadísticas
+        self.frame_ms = []
+
+    def get_ticks(self):
+        """Reloj simulado (ms) que sustituye a pygame.time.get_ticks."""
+        return int(self.ticks)
+
+    @property
+    def screen(self):
+        return self.game.screen
+
+    def step(self, frames=1):
+        """Avanza frames del juego (update + draw) sin esperar al reloj."""
+        game = self.game
+        for _ in range(frames):
+            if self.autoplay:
+                self._play_turn()
+            start = time.perf_counter()
+            game.step(self.dt)
+            self.frame_ms.append((time.perf_counter() - start) * 1000)
+            self.frame += 1
+            self.ticks = self.frame * self.dt * 1000
+
+    def _play_turn(self):
+        """Jugada automática: mueve la unidad activa al azar y pasa turno."""
+        game = self.game
+        turns = game.alt_turn_system
+        if not turns.is_player_turn() or self.frame % 10:
+            return
+        unit = turns.active_unit
+        tile = game.grid.get_unit_tile(unit) if unit else None
+        if tile and not unit.has_moved:
+            if game.selected_tile is None:
+                game._handle_click((tile.x, tile.y))
+            moves = [t for t in game.grid.tiles if t.valid_move]
+            if moves:
+                target = self._rng.choice(moves)
+                game._handle_click((target.x, target.y))
+        game._end_player_turn()
+
+    def run(self, frames, dump_dir=None, checksums=False):
+        """
+        Avanza varios frames guardando opcionalmente cada uno.
+
+        Args:
+            frames: número de frames
+            dump_dir: carpeta donde guardar cada frame como PNG
+            checksums: calcular el checksum de cada frame
+
+        Returns:
+            lista de checksums (vacía si checksums es False)
+        """
+        if dump_dir:
+            os.makedirs(dump_dir, exist_ok=True)
+        sums = []
+        for _ in range(frames):
+            self.step()
+            if dump_dir:
+                pygame.image.save(self.screen,
+                                  os.path.join(dump_dir, f"frame_{self.frame:05d}.png"))
+            if checksums:
+                sums.append(frame_checksum(self.screen))
+        return sums
+
+    def get_stats(self):
+        times = sorted(self.frame_ms)
+        if not times:
+            return {'frames': 0}
+        return {
+            'frames': len(times),
+            'avg_ms': sum(times) / len(times),
+            'p95_ms': times[min(len(times) - 1, int(len(times) * 0.95))],
+            'max_ms': times[-1],
+        }
+
+    def close(self):
+        """Devuelve pygame.time.get_ticks a su reloj real."""
+        pygame.time.get_ticks = self._real_get_ticks
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Partida sin pantalla (SDL dummy)")
+    parser.add_argument('--frames', type=int, default=600, help="frames a simular")
+    parser.add_argument('--seed', type=int, default=0, help="semilla de la partida")
+    parser.add_argument('--fps', type=float, default=HEADLESS_FPS, help="frames por segundo simulados")
+    parser.add_argument('--autoplay', action='store_true', help="el jugador juega solo")
+    parser.add_argument('--dump', metavar='DIR', help="guardar cada frame como PNG")
+    parser.add_argument('--checksums', metavar='FILE',
+                        help="escribir el checksum de cada frame ('-' = salida estándar)")
+    args = parser.parse_args(argv)
+
+    runner = HeadlessRunner(seed=args.seed, dt=1 / args.fps, autoplay=args.autoplay)
+    try:
+        sums = runner.run(args.frames, dump_dir=args.dump, checksums=bool(args.checksums))
+    finally:
+        runner.close()
+
+    if args.checksums:
+        lines = "".join(f"{i + 1:05d} {digest}\n" for i, digest in enumerate(sums))
+        if args.checksums == '-':
+            sys.stdout.write(lines)
+        else:
+            with open(args.checksums, 'w') as f:
+                f.write(lines)
+        # Resumen de toda la secuencia, para comparar de un vistazo
+        print(f"[CHECKSUM] {hashlib.sha1(''.join(sums).encode()).hexdigest()}")
+
+    stats = runner.get_stats()
+    print(f"[HEADLESS] {stats['frames']} frames | {stats['avg_ms']:.2f} ms/frame "
+          f"(p95 {stats['p95_ms']:.2f}, máx {stats['max_ms']:.2f}) | fase {runner.game.phase}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -5,67 +5,147 @@ Maneja todo el dibujado del juego: UI, unidades, efectos, etc.
 """
 import pygame
 from config.constants import *
+from core.background_compositor import BackgroundCompositor
+from core.dirty_rects import DirtyRectTracker
+from core.grid_layer import GridLayer
+from systems.lod import LodSelector, LOD_FRAME_BUDGET_MS
+from systems.stamp_batch import StampBatch
+from systems.text_cache import text_cache
+from ui.retained_layer import RetainedLayer
 
 
 class GameRenderer:
     """Renderiza todos los elementos del juego."""
     
-    def __init__(self, screen, font_large, font_medium, font_small):
+    # Caja (dx, dy, ancho, alto) respecto a su posición que pinta un objeto
+    # del tablero sin DRAW_BOUNDS propio
+    OBJECT_BOUNDS = (-48, -80, 96, 128)
+    
+    def __init__(self, screen, font_large, font_medium, font_small, dirty_rects=False,
+                 headless=False, lod_level=None):
         self.screen = screen
+        # Sin ventana: screen es una superficie en memoria y no se vuelca
+        self.headless = headless
         self.font_large = font_large
         self.font_medium = font_medium
         self.font_small = font_small
+        
+        # Tablero cacheado (se recrea si cambia el grid o la pantalla)
+        self.grid_layer = None
+        # Fondo animado: no se simula ni dibuja bajo las capas opacas
+        self.background = BackgroundCompositor()
+        # Lote de sellos de partículas y proyectiles
+        self.effects = StampBatch()
+        # Zonas pintadas por frame (modo dirty-rect opcional)
+        self.dirty = DirtyRectTracker(dirty_rects)
+        # Panel superior y pantallas de fin ya compuestos
+        self.top_panel = RetainedLayer()
+        self.end_screen = RetainedLayer()
+        # Nivel de detalle de las figuras (None = automático). Sin ventana
+        # no se mira el tiempo de frame: el resultado sería irreproducible
+        self.lod = LodSelector(lod_level, None if headless else LOD_FRAME_BUDGET_MS)
+    
+    def invalidate(self):
+        """Cambio de escena: el próximo volcado es de pantalla completa."""
+        self.dirty.invalidate()
     
     def clear_screen(self):
-        """Limpia la pantalla con color de fondo."""
-        self.screen.fill(COLOR_BG)
+        """
+        Limpia la pantalla con color de fondo. En modo dirty-rect no hace
+        falta: el pasto y la capa del tablero restauran lo que se pinta.
+        """
+        self.dirty.begin_frame(self.screen.get_size())
+        if not self.dirty.partial:
+            self.screen.fill(COLOR_BG)
     
-    def draw_background(self, grass_system, neutral_zone_y):
-        """Dibuja el fondo y zonas."""
-        grass_system.draw(self.screen)
+    def draw_background(self, grass_system, grid_manager):
+        """
+        Dibuja el fondo y zonas. La zona de juego (opaca) la aporta la capa
+        del tablero en draw_grid; aquí solo queda lo que asoma fuera de ella.
+        """
+        self.background.set_occluder('play_area', self._play_area_rect(grid_manager))
+        self.background.draw(self.screen, grass_system)
+        # El pasto está animado: sus zonas visibles cambian cada frame
+        self.dirty.mark_all(self.background.visible_rects)
+        self.dirty.mark_all(self._draw_zone_labels(self.screen, grid_manager))
+    
+    def _play_area_rect(self, grid_manager):
+        """Rectángulo opaco de la zona de juego."""
+        layout = grid_manager.layout
+        player_bottom = layout.player_y + layout.rows * HEX_HEIGHT
+        return pygame.Rect(0, layout.enemy_y - 30, SCREEN_WIDTH,
+                           player_bottom - layout.enemy_y + 100)
+    
+    def _draw_play_area(self, surface, grid_manager):
+        """Fondo de la zona de juego: rectángulo, línea neutral y etiquetas."""
+        neutral_zone_y = grid_manager.neutral_zone_y
         
         # Zona de juego
-        pygame.draw.rect(self.screen, (30, 40, 35), 
-                        (0, ZONE_ENEMY_Y - 30, SCREEN_WIDTH, 
-                         ZONE_PLAYER_Y - ZONE_ENEMY_Y + GRID_ROWS * HEX_HEIGHT + 100))
+        pygame.draw.rect(surface, (30, 40, 35), self._play_area_rect(grid_manager))
         
         # Línea neutral
-        pygame.draw.line(self.screen, COLOR_HONEY_BORDER, 
+        pygame.draw.line(surface, COLOR_HONEY_BORDER, 
                         (50, neutral_zone_y), (SCREEN_WIDTH-50, neutral_zone_y), 4)
         
-        # Etiquetas de zona
-        self.screen.blit(self.font_medium.render("ZONA ENEMIGA", True, (255, 150, 150)), 
-                        (SCREEN_WIDTH//2 - 100, ZONE_ENEMY_Y - 45))
-        self.screen.blit(self.font_medium.render("TU ZONA", True, (150, 255, 150)), 
-                        (SCREEN_WIDTH//2 - 60, ZONE_PLAYER_Y + GRID_ROWS * HEX_HEIGHT + 25))
+        self._draw_zone_labels(surface, grid_manager)
+    
+    def _draw_zone_labels(self, surface, grid_manager):
+        """Etiquetas de zona. Returns: zonas pintadas."""
+        layout = grid_manager.layout
+        player_bottom = layout.player_y + layout.rows * HEX_HEIGHT
+        return [
+            surface.blit(text_cache.render(self.font_medium, "ZONA ENEMIGA", (255, 150, 150)), 
+                         (SCREEN_WIDTH//2 - 100, layout.enemy_y - 45)),
+            surface.blit(text_cache.render(self.font_medium, "TU ZONA", (150, 255, 150)), 
+                         (SCREEN_WIDTH//2 - 60, player_bottom + 25)),
+        ]
     
     def draw_grid(self, grid_manager):
-        """Dibuja el grid hexagonal."""
-        tiles = grid_manager.get_tiles_sorted_by_y()
-        for tile in tiles:
-            tile.draw(self.screen)
+        """
+        Dibuja el tablero desde la capa cacheada: un blit más los tiles que
+        cambiaron de aspecto desde el frame anterior. En modo dirty-rect
+        solo se copian las zonas pintadas en el frame anterior (borra
+        unidades, efectos e interfaz) y los tiles que cambiaron.
+        """
+        size = self.screen.get_size()
+        layer = self.grid_layer
+        if layer is None or layer.grid is not grid_manager or layer.size != size:
+            layer = GridLayer(grid_manager, size, self._play_area_rect(grid_manager),
+                              lambda surface: self._draw_play_area(surface, grid_manager))
+            self.grid_layer = layer
+            self.dirty.invalidate()
+        restore = self.dirty.previous if self.dirty.partial else None
+        self.dirty.mark_all(layer.draw(self.screen, restore))
     
     def draw_units_and_towers(self, grid_manager):
-        """Dibuja todas las unidades y torres."""
+        """Dibuja todas las unidades y torres (al nivel de detalle del frame)."""
         items = grid_manager.get_all_units_and_towers(sorted_by_y=True)
+        lod = self.lod.select(len(items))
         
         for y_pos, obj, tile in items:
-            if hasattr(obj, 'is_moving'):
-                if obj.is_moving:
-                    obj.draw(self.screen, obj.visual_x, obj.visual_y + tile.wall_height//2)
-                else:
-                    obj.draw(self.screen, tile.x, tile.y + tile.wall_height//2)
+            if getattr(obj, 'is_moving', False):
+                x, y = obj.visual_x, obj.visual_y + tile.wall_height//2
             else:
-                obj.draw(self.screen, tile.x, tile.y + tile.wall_height//2)
+                x, y = tile.x, tile.y + tile.wall_height//2
+            obj.draw(self.screen, x, y, lod=lod)
+            
+            if self.dirty.enabled:
+                dx, dy, w, h = getattr(obj, 'DRAW_BOUNDS', self.OBJECT_BOUNDS)
+                self.dirty.mark((x + dx, y + dy, w, h))
     
-    def draw_projectiles(self, projectiles):
-        """Dibuja los proyectiles."""
+    def draw_effects(self, projectiles, particle_system):
+        """
+        Dibuja proyectiles y después partículas como sellos
+        pre-renderizados, con un único Surface.blits para todo el frame.
+        """
         for proj in projectiles:
-            proj.draw(self.screen)
-    
-    def draw_particles(self, particle_system):
-        """Dibuja el sistema de partículas."""
-        particle_system.draw(self.screen)
+            proj.collect(self.effects)
+        particle_system.collect(self.effects)
+        self.effects.flush(self.screen)
+        
+        if self.dirty.enabled:
+            self.dirty.mark_all(r for r in (proj.get_rect() for proj in projectiles) if r)
+            self.dirty.mark_array(particle_system.get_bounds())
     
     def draw_ui(self, turn_system, unit_manager, selected_tile, oracle, menu):
         """Dibuja la interfaz de usuario principal."""
@@ -78,36 +158,32 @@ class GameRenderer:
         # Oracle y menú
         oracle.draw(self.screen, self.font_small)
         menu.draw(self.screen, self.font_small)
+        if self.dirty.enabled:
+            self.dirty.mark_all(r for r in (oracle.get_rect(), menu.get_rect()) if r)
         
         # Info de unidad seleccionada
         if selected_tile and selected_tile.unit:
-            self._draw_unit_info(selected_tile.unit)
+            self.dirty.mark(self._draw_unit_info(selected_tile.unit))
     
     def _draw_top_panel(self, turn_system, unit_manager):
-        """Dibuja el panel superior con información del turno."""
-        # Fondo del panel
-        panel_top = pygame.Surface((SCREEN_WIDTH, 60), pygame.SRCALPHA)
-        pygame.draw.rect(panel_top, (20, 25, 35, 240), (0, 0, SCREEN_WIDTH, 60))
-        self.screen.blit(panel_top, (0, 0))
-        
+        """
+        Dibuja el panel superior con información del turno. Se recompone
+        solo cuando cambia la ronda, la fase, la unidad activa, sus AP o
+        los recuentos de unidades.
+        """
         # Info de fase
-        phase_name = turn_system.get_phase_name()
+        phase_text = f"Ronda {turn_system.turn_number} - {turn_system.get_phase_name()}"
         phase_color = turn_system.get_phase_color()
         
-        # Ronda y estado
-        self.screen.blit(self.font_medium.render(f"Ronda {turn_system.turn_number} - {phase_name}", 
-                                                True, phase_color), (20, 8))
-        
         # Info de unidad activa
+        name_text = name_color = ap_text = ap_color = None
         active = turn_system.active_unit
         if active:
             is_hero = getattr(active, 'is_hero', False)
             name = getattr(active, 'name', getattr(active, 'unit_type', 'Unidad'))
             name_color = (255, 215, 0) if is_hero else \
                         (100, 255, 100) if turn_system.is_troop_turn() else (255, 100, 100)
-            
             name_text = f"Activa: {name}"
-            self.screen.blit(self.font_small.render(name_text, True, name_color), (20, 38))
             
             # AP solo para héroe
             if is_hero and hasattr(active, 'action_points'):
@@ -115,15 +191,35 @@ class GameRenderer:
                 ap_color = (100, 255, 100) if ap.current >= 4 else \
                           (255, 255, 100) if ap.current >= 2 else (255, 100, 100)
                 ap_text = f"AP: {ap.current}/{ap.maximum}"
-                self.screen.blit(self.font_medium.render(ap_text, True, ap_color), (300, 8))
         
-        # Panel derecho (stats)
-        px = SCREEN_WIDTH - 180
-        pygame.draw.rect(self.screen, (30, 35, 45), (px, 5, 170, 50))
         alive_p = len(unit_manager.get_alive_player_units())
         alive_e = len(unit_manager.get_alive_enemy_units())
-        self.screen.blit(self.font_small.render(f"Aliados: {alive_p}", True, (100, 255, 100)), (px+10, 10))
-        self.screen.blit(self.font_small.render(f"Enemigos: {alive_e}", True, (255, 100, 100)), (px+10, 30))
+        
+        key = (phase_text, phase_color, name_text, name_color, ap_text, ap_color, alive_p, alive_e)
+        panel = self.top_panel.get(key, lambda: self._render_top_panel(*key))
+        self.dirty.mark(self.screen.blit(panel, (0, 0)))
+    
+    def _render_top_panel(self, phase_text, phase_color, name_text, name_color,
+                          ap_text, ap_color, alive_p, alive_e):
+        """Compone el panel superior (algo más alto: el nombre sobresale)."""
+        height = max(60, 38 + self.font_small.get_height())
+        panel_top = pygame.Surface((SCREEN_WIDTH, height), pygame.SRCALPHA)
+        pygame.draw.rect(panel_top, (20, 25, 35, 240), (0, 0, SCREEN_WIDTH, 60))
+        
+        # Ronda y estado
+        panel_top.blit(text_cache.render(self.font_medium, phase_text, phase_color), (20, 8))
+        
+        if name_text:
+            panel_top.blit(text_cache.render(self.font_small, name_text, name_color), (20, 38))
+        if ap_text:
+            panel_top.blit(text_cache.render(self.font_medium, ap_text, ap_color), (300, 8))
+        
+        # Panel derecho (stats)
+        px = SCREEN_WIDTH - 180
+        pygame.draw.rect(panel_top, (30, 35, 45), (px, 5, 170, 50))
+        panel_top.blit(text_cache.render(self.font_small, f"Aliados: {alive_p}", (100, 255, 100)), (px+10, 10))
+        panel_top.blit(text_cache.render(self.font_small, f"Enemigos: {alive_e}", (255, 100, 100)), (px+10, 30))
+        return panel_top
     
     def _draw_help_text(self, turn_system):
         """Dibuja el texto de ayuda contextual."""
@@ -139,10 +235,11 @@ class GameRenderer:
             msg = ""
         
         if msg:
-            self.screen.blit(self.font_small.render(msg, True, (200, 220, 255)), (20, help_y))
+            self.dirty.mark(self.screen.blit(text_cache.render(self.font_small, msg, (200, 220, 255)),
+                                             (20, help_y)))
     
     def _draw_unit_info(self, unit):
-        """Dibuja la información de la unidad seleccionada."""
+        """Dibuja la información de la unidad seleccionada. Returns: zona del panel."""
         x = 20
         y = SCREEN_HEIGHT - 140
         
@@ -155,7 +252,7 @@ class GameRenderer:
         title_color = (255, 215, 0) if is_hero else \
                      (100, 255, 100) if unit.owner == "player" else (255, 100, 100)
         title = f"{'★ ' if is_hero else ''}{unit.unit_type.upper()}"
-        self.screen.blit(self.font_small.render(title, True, title_color), (x, y))
+        self.screen.blit(text_cache.render(self.font_small, title, title_color), (x, y))
         
         # Info básica
         info_lines = [
@@ -180,36 +277,55 @@ class GameRenderer:
             pygame.draw.rect(self.screen, (200, 200, 200), (x, y + 110, bar_w, 8), 1)
         
         for i, text in enumerate(info_lines):
-            self.screen.blit(self.font_small.render(text, True, (220, 220, 220)), (x, y + 22 + i*20))
+            self.screen.blit(text_cache.render(self.font_small, text, (220, 220, 220)), (x, y + 22 + i*20))
+        return pygame.Rect(x - 10, y - 5, 180, panel_h)
     
     def draw_victory_screen(self, btn_restart):
         """Dibuja la pantalla de victoria."""
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        pygame.draw.rect(overlay, (0, 100, 0, 150), overlay.get_rect())
-        self.screen.blit(overlay, (0, 0))
-        
-        self.screen.blit(self.font_large.render("¡VICTORIA!", True, (255, 215, 0)), 
-                        (SCREEN_WIDTH//2 - 150, SCREEN_HEIGHT//2 - 50))
-        
-        self.screen.blit(self.font_medium.render("Has derrotado a todos los enemigos", True, (255, 255, 200)), 
-                        (SCREEN_WIDTH//2 - 180, SCREEN_HEIGHT//2 + 10))
-        
-        btn_restart.draw(self.screen, self.font_small)
+        self._draw_end_screen('victoria', btn_restart)
     
     def draw_defeat_screen(self, btn_restart):
         """Dibuja la pantalla de derrota."""
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        pygame.draw.rect(overlay, (100, 0, 0, 150), overlay.get_rect())
+        self._draw_end_screen('derrota', btn_restart)
+    
+    def _draw_end_screen(self, kind, btn_restart):
+        """Capa de fin de partida (compuesta una vez) y botón de reinicio."""
+        self._mark_overlay()
+        overlay = self.end_screen.get(kind, lambda: self._render_end_screen(kind))
         self.screen.blit(overlay, (0, 0))
-        
-        self.screen.blit(self.font_large.render("DERROTA", True, (255, 100, 100)), 
-                        (SCREEN_WIDTH//2 - 100, SCREEN_HEIGHT//2 - 50))
-        
-        self.screen.blit(self.font_medium.render("Tus fuerzas han caído", True, (255, 200, 200)), 
-                        (SCREEN_WIDTH//2 - 130, SCREEN_HEIGHT//2 + 30))
-        
         btn_restart.draw(self.screen, self.font_small)
     
+    def _render_end_screen(self, kind):
+        """Compone el velo a pantalla completa con sus textos."""
+        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        if kind == 'victoria':
+            pygame.draw.rect(overlay, (0, 100, 0, 150), overlay.get_rect())
+            overlay.blit(text_cache.render(self.font_large, "¡VICTORIA!", (255, 215, 0)), 
+                         (SCREEN_WIDTH//2 - 150, SCREEN_HEIGHT//2 - 50))
+            overlay.blit(text_cache.render(self.font_medium, "Has derrotado a todos los enemigos", (255, 255, 200)), 
+                         (SCREEN_WIDTH//2 - 180, SCREEN_HEIGHT//2 + 10))
+        else:
+            pygame.draw.rect(overlay, (100, 0, 0, 150), overlay.get_rect())
+            overlay.blit(text_cache.render(self.font_large, "DERROTA", (255, 100, 100)), 
+                         (SCREEN_WIDTH//2 - 100, SCREEN_HEIGHT//2 - 50))
+            overlay.blit(text_cache.render(self.font_medium, "Tus fuerzas han caído", (255, 200, 200)), 
+                         (SCREEN_WIDTH//2 - 130, SCREEN_HEIGHT//2 + 30))
+        return overlay
+    
+    def draw_profiler(self, profiler):
+        """Dibuja el HUD de rendimiento (si está activo)."""
+        rect = profiler.draw(self.screen)
+        if rect:
+            self.dirty.mark(rect)
+
+    def _mark_overlay(self):
+        """Las capas a pantalla completa se vuelcan con un flip."""
+        self.dirty.mark(self.screen.get_rect())
+        self.dirty.invalidate()
+    
     def flip_display(self):
-        """Actualiza la pantalla."""
-        pygame.display.flip()
+        """Actualiza la pantalla (entera, o solo las zonas sucias)."""
+        if self.headless:
+            self.dirty.end_frame()
+        else:
+            self.dirty.present()
@@ -33,7 +33,7 @@ class UnitManager:
         self.hero = Hero(name="Comandante")
         hero_tile = self.grid.get_tile(4, 3)
         if hero_tile:
-            hero_tile.unit = self.hero
+            self.grid.place_unit(hero_tile, self.hero)
             self.hero.set_position(hero_tile.x, hero_tile.y)
             self.player_units.append(self.hero)
     
@@ -53,7 +53,7 @@ class UnitManager:
             unit = UltraUnit(unit_type, "player")
             tile = self.grid.get_tile(col, row)
             if tile:
-                tile.unit = unit
+                self.grid.place_unit(tile, unit)
                 unit.set_position(tile.x, tile.y)
                 self.player_units.append(unit)
     
@@ -64,7 +64,7 @@ class UnitManager:
             if tile:
                 tower = UltraTower("player")
                 tower.set_position(tile.x, tile.y)
-                tile.tower = tower
+                self.grid.place_tower(tile, tower)
                 self.player_towers.append(tower)
     
     def _create_enemy_hero(self):
@@ -82,7 +82,7 @@ class UnitManager:
         
         enemy_hero_tile = self.grid.get_tile(4, -3)
         if enemy_hero_tile:
-            enemy_hero_tile.unit = self.enemy_hero
+            self.grid.place_unit(enemy_hero_tile, self.enemy_hero)
             self.enemy_hero.set_position(enemy_hero_tile.x, enemy_hero_tile.y)
             self.enemy_units.append(self.enemy_hero)
     
@@ -102,7 +102,7 @@ class UnitManager:
             unit = UltraUnit(unit_type, "enemy")
             tile = self.grid.get_tile(col, row)
             if tile:
-                tile.unit = unit
+                self.grid.place_unit(tile, unit)
                 unit.set_position(tile.x, tile.y)
                 self.enemy_units.append(unit)
     
@@ -113,7 +113,7 @@ class UnitManager:
             if tile:
                 tower = UltraTower("enemy")
                 tower.set_position(tile.x, tile.y)
-                tile.tower = tower
+                self.grid.place_tower(tile, tower)
                 self.enemy_towers.append(tower)
     
     def get_all_player_units(self):
@@ -0,0 +1,125 @@
+"""
+Benchmark del modo dirty-rect
+=============================
+CPU por frame (composición + volcado a la ventana) con flip completo y
+con display.update de las zonas sucias, para un tablero en reposo y para
+un combate activo (ráfagas de partículas, proyectiles y una unidad que
+se mueve sin parar), y fracción de pantalla que se vuelca.
+Ejecutar: python dev_tools/bench_dirty_rects.py
+"""
+import random
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dev_tools.bench_utils import measure, print_header, setup_headless
+setup_headless()
+
+import pygame
+from config.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from core.grid_manager import GridManager
+from core.renderer import GameRenderer
+from core.unit_manager import UnitManager
+from entities.projectile import TracerProjectile
+from systems.alternating_turn_system import AlternatingTurnSystem
+from systems.grass import GrassSystem
+from systems.particles import ParticleSystem
+from ui import OracleOfKimi, PersistentMenu
+
+FRAMES = 120
+DT = 1 / 60
+
+
+class _Target:
+    """Objetivo inmóvil lejano: los proyectiles no llegan a impactar."""
+    x, y = SCREEN_WIDTH * 10, SCREEN_HEIGHT * 10
+
+    def is_alive(self):
+        return True
+
+
+def _make_frame(screen, dirty_rects, combat):
+    """Frame completo del juego (update + draw + volcado) de una escena."""
+    random.seed(1)
+    font = pygame.font.Font(None, 24)
+    renderer = GameRenderer(screen, pygame.font.Font(None, 52), font, font,
+                            dirty_rects=dirty_rects)
+    grid = GridManager()
+    units = UnitManager(grid)
+    units.setup_initial_units()
+    grass = GrassSystem(SCREEN_WIDTH, SCREEN_HEIGHT, seed=1)
+    particles = ParticleSystem()
+    turns = AlternatingTurnSystem()
+    turns.setup(units.hero, units.get_troops_only(), units.enemy_units)
+    oracle = OracleOfKimi()
+    menu = PersistentMenu(20, 110, 150)
+    menu.add_button("Terminar Turno", None)
+    projectiles = []
+    troop = units.get_troops_only()[0]
+    state = {'frame': 0}
+
+    def frame():
+        state['frame'] += 1
+        if combat:
+            n = state['frame']
+            if n % 10 == 0:
+                x, y = random.uniform(200, 1200), random.uniform(200, 700)
+                particles.spawn_attack(x, y, "player")
+                if len(projectiles) < 6:
+                    proj = TracerProjectile(x, y, _Target(), 10, (255, 200, 50),
+                                            "player", particles)
+                    projectiles.append(proj)
+            for proj in projectiles:
+                proj.update(DT)
+                if proj.x > SCREEN_WIDTH or proj.y > SCREEN_HEIGHT:
+                    proj.x, proj.y, proj.trail = random.uniform(200, 1200), 150, []
+            # La tropa va y viene entre dos casillas
+            if not troop.is_moving:
+                tile = grid.get_unit_tile(troop)
+                target = next(t for t in grid.get_neighbors(tile) if t.is_empty())
+                grid.move_unit(tile, target)
+                troop.move_to(target.x, target.y)
+
+        units.update(DT, grass)
+        grass.update(DT)
+        particles.update(DT)
+
+        renderer.clear_screen()
+        renderer.draw_background(grass, grid)
+        renderer.draw_grid(grid)
+        renderer.draw_units_and_towers(grid)
+        renderer.draw_effects(projectiles, particles)
+        renderer.draw_ui(turns, units, None, oracle, menu)
+        renderer.flip_display()
+
+    return frame, renderer
+
+
+def bench_dirty_rects():
+    """Flip completo vs display.update(rects) en reposo y en combate."""
+    print_header("BENCH: dirty rects (ms de CPU por frame)")
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    screen_area = SCREEN_WIDTH * SCREEN_HEIGHT
+
+    print(f"{'escena':>8} {'flip ms':>8} {'dirty ms':>9} {'x':>5} {'pantalla volcada':>17}")
+    for label, combat in (("reposo", False), ("combate", True)):
+        full, _ = _make_frame(screen, False, combat)
+        dirty, renderer = _make_frame(screen, True, combat)
+        for _ in range(30):
+            full()
+            dirty()
+        before = measure(full, number=FRAMES, repeat=3) / 1000
+
+        area = 0
+        def counted():
+            nonlocal area
+            dirty()
+            area += renderer.dirty.last_area
+        after = measure(counted, number=FRAMES, repeat=3) / 1000
+        share = area / (FRAMES * 3) / screen_area
+        print(f"{label:>8} {before:8.2f} {after:9.2f} {before / after:5.1f} {share:16.0%}")
+
+
+if __name__ == '__main__':
+    bench_dirty_rects()
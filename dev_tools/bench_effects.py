@@ -0,0 +1,172 @@
+"""
+Benchmark de efectos
+====================
+Coste por frame de partículas con glow, proyectiles y glows radiales, y
+superficies SRCALPHA creadas por frame, sin caché de glows (como antes)
+y con la caché compartida; y update de 10k partículas vivas con la lista
+de objetos Particle (como antes) y con los arrays de NumPy; y draw de
+N partículas con una llamada de pygame por círculo frente al lote de
+sellos con un solo Surface.blits.
+Ejecutar: python dev_tools/bench_effects.py             # todo
+         python dev_tools/bench_effects.py --update    # solo update de partículas
+         python dev_tools/bench_effects.py --draw      # solo draw por número de partículas
+"""
+import random
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dev_tools.bench_utils import measure, print_header, setup_headless
+setup_headless()
+
+import pygame
+from config.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from entities.projectile import TracerProjectile
+from systems.geometry import GeometryRenderer
+from systems.glow_cache import glow_cache, GLOW_CACHE_SIZE
+from systems.particles import Particle, ParticleSystem
+
+PROJECTILES = 10
+BURSTS = 10   # spawn_attack + spawn_spark por ráfaga
+LIVE_PARTICLES = 10000
+DRAW_COUNTS = (250, 1000, 4000)
+UPDATE_BUDGET_MS = 1.0
+
+
+class _Target:
+    """Objetivo inmóvil lejano: los proyectiles no llegan a impactar."""
+    x, y = SCREEN_WIDTH * 10, SCREEN_HEIGHT * 10
+
+    def is_alive(self):
+        return True
+
+    def take_damage(self, damage):
+        pass
+
+
+def _make_scene(seed=0):
+    """Partículas y proyectiles de un combate intenso."""
+    rng = random.Random(seed)
+    random.seed(seed)
+    particles = ParticleSystem()
+    for _ in range(BURSTS):
+        x, y = rng.uniform(100, SCREEN_WIDTH - 100), rng.uniform(100, SCREEN_HEIGHT - 100)
+        particles.spawn_attack(x, y, "player")
+        particles.spawn_spark(x, y, (255, 255, 200), 8)
+    # Que no caduquen durante la medición
+    particles.lifetime[:particles.count] = 1e9
+    particles.max_lifetime[:particles.count] = 1e9
+    projectiles = []
+    for _ in range(PROJECTILES):
+        proj = TracerProjectile(rng.uniform(0, 400), rng.uniform(0, 400), _Target(),
+                                10, (255, 200, 50), "player", particles)
+        proj.trail = [(proj.x - i * 4, proj.y - i * 4) for i in range(proj.max_trail)]
+        projectiles.append(proj)
+    return particles, projectiles
+
+
+def bench_frame():
+    """Frame de efectos: sin caché vs con caché."""
+    print_header("BENCH: efectos por frame (partículas, proyectiles, glows)")
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    particles, projectiles = _make_scene()
+    print(f"[INFO] {len(particles)} partículas, {len(projectiles)} proyectiles")
+
+    def frame():
+        particles.draw(screen)
+        for proj in projectiles:
+            proj.draw(screen)
+        for i in range(10):
+            GeometryRenderer.draw_glow(screen, 100 + i * 40, 100, 10, (100, 150, 255), 3)
+
+    print(f"{'caché':>8} {'ms/frame':>9} {'superficies/frame':>18}")
+    for label, size in (("sin", 0), ("con", GLOW_CACHE_SIZE)):
+        glow_cache.clear()
+        glow_cache.max_entries = size
+        frame()
+        misses = glow_cache.misses
+        cost = measure(frame, number=50, repeat=3) / 1000
+        allocations = (glow_cache.misses - misses) / (50 * 3)
+        print(f"{label:>8} {cost:9.2f} {allocations:18.1f}")
+    glow_cache.max_entries = GLOW_CACHE_SIZE
+
+
+def bench_update():
+    """update() con LIVE_PARTICLES vivas: lista de Particle vs arrays."""
+    print_header(f"BENCH: update de {LIVE_PARTICLES} partículas vivas")
+    dt = 1 / 60
+
+    # Antes: una instancia de Particle por partícula, update en Python
+    random.seed(0)
+    objects = [Particle(0, 0, (255, 255, 255), (random.uniform(-50, 50), random.uniform(-50, 50)),
+                        1e9, 3) for _ in range(LIVE_PARTICLES)]
+
+    def update_objects():
+        for p in objects:
+            p.update(dt)
+        objects[:] = [p for p in objects if p.is_alive()]
+
+    # Después: ParticleSystem con arrays de NumPy
+    random.seed(0)
+    particles = ParticleSystem()
+    for _ in range(LIVE_PARTICLES // 8):
+        particles.spawn_dust(0, 0)  # 8 partículas por llamada
+    particles.lifetime[:particles.count] = 1e9
+    particles.max_lifetime[:particles.count] = 1e9
+
+    before = measure(update_objects, number=20, repeat=3) / 1000
+    after = measure(lambda: particles.update(dt), number=200, repeat=5) / 1000
+    print(f"{'lista de Particle':<22} {before:8.3f} ms/update")
+    print(f"{'arrays (SoA)':<22} {after:8.3f} ms/update  ({before / after:.0f}x)")
+    assert len(particles) == LIVE_PARTICLES
+    status = "OK" if after < UPDATE_BUDGET_MS else "SOBRE PRESUPUESTO"
+    print(f"[{status}] presupuesto {UPDATE_BUDGET_MS:.1f} ms")
+    return after < UPDATE_BUDGET_MS
+
+
+def _draw_one_by_one(screen, particles):
+    """Dibujado anterior: un blit de glow y un draw.circle por partícula."""
+    for i in range(particles.count):
+        x, y = float(particles.x[i]), float(particles.y[i])
+        size = int(particles.size[i])
+        color = tuple(particles.color[i].tolist())
+        alpha = int(255 * (particles.lifetime[i] / particles.max_lifetime[i]))
+        if particles.glow[i]:
+            screen.blit(glow_cache.circle(size * 2, color, alpha // 2),
+                        (x - size * 2, y - size * 2))
+        pygame.draw.circle(screen, color, (int(x), int(y)), size)
+
+
+def bench_draw():
+    """draw() de N partículas: llamadas sueltas vs un Surface.blits."""
+    print_header("BENCH: draw de partículas (llamadas sueltas vs lote de sellos)")
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    print(f"{'partículas':>10} {'sueltas ms':>11} {'lote ms':>8} {'µs/partícula':>13} {'x':>5}")
+    for count in DRAW_COUNTS:
+        random.seed(count)
+        particles = ParticleSystem()
+        while len(particles) < count:
+            x, y = random.uniform(50, SCREEN_WIDTH - 50), random.uniform(50, SCREEN_HEIGHT - 50)
+            particles.spawn_attack(x, y, "player")
+            particles.spawn_dust(x, y)
+        particles.count = count
+        particles.lifetime[:count] = particles.max_lifetime[:count] * random.random()
+
+        number = max(2, 4000 // count)
+        before = measure(lambda: _draw_one_by_one(screen, particles), number=number, repeat=3) / 1000
+        after = measure(lambda: particles.draw(screen), number=number, repeat=3) / 1000
+        print(f"{count:>10} {before:11.2f} {after:8.2f} {after * 1000 / count:13.2f} "
+              f"{before / after:5.1f}")
+
+
+if __name__ == '__main__':
+    ok = True
+    if '--draw' not in sys.argv:
+        ok = bench_update()
+    if '--update' not in sys.argv:
+        bench_draw()
+    if not {'--update', '--draw'} & set(sys.argv):
+        bench_frame()
+    sys.exit(0 if ok else 1)
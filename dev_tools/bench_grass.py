@@ -0,0 +1,160 @@
+"""
+Benchmark del pasto
+===================
+GrassSystem.update vectorizado (NumPy) frente a la versión anterior con
+un dict por brizna, con 0, 5 y 50 ondas de pisadas activas, y coste de
+draw en modo live frente al modo con fotogramas precalculados, con y sin
+oclusión de la zona de juego.
+Ejecutar: python dev_tools/bench_grass.py
+"""
+import math
+import random
+import sys
+import time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dev_tools.bench_utils import measure, print_header, setup_headless
+setup_headless()
+
+import pygame
+from config.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from core.background_compositor import BackgroundCompositor
+from core.grid_manager import GridManager
+from core.renderer import GameRenderer
+from systems.grass import GrassSystem, LOOP_FRAMES
+
+WAVE_COUNTS = [0, 5, 50]
+
+
+def _legacy_blades(grass):
+    """Briznas como dicts, igual que la implementación anterior."""
+    blades = []
+    for i in range(grass.blade_count):
+        c, r = divmod(i, grass.x.shape[1])
+        blades.append({
+            'x': float(grass.x[c, r]),
+            'y': float(grass.y[c, r]),
+            'base_angle': float(grass.base_angle[c, r]),
+            'angle': float(grass.base_angle[c, r]),
+            'sway_speed': float(grass.sway_speed[c, r]),
+        })
+    return blades
+
+
+def _legacy_update(blades, waves, t):
+    """Bucle por brizna de la implementación anterior (sin decaimiento)."""
+    for blade in blades:
+        wind = math.sin(t * blade['sway_speed'] + blade['x'] * 0.01) * 0.15
+        wave_effect = 0
+
+        for wave in waves:
+            dist = math.sqrt((blade['x'] - wave['x'])**2 + (blade['y'] - wave['y'])**2)
+            if dist < wave['radius']:
+                wave_intensity = (1 - dist / wave['radius']) * wave['strength']
+                wave_effect += math.sin(t * 10 - dist * 0.2) * wave_intensity * 0.5
+
+        blade['angle'] = blade['base_angle'] + wind + wave_effect
+
+
+def _legacy_construct(width, height):
+    """Construcción anterior: ~20k llamadas a random por brizna."""
+    blades = []
+    for x in range(0, width, 8):
+        for y in range(0, height, 8):
+            height_var = random.uniform(0.7, 1.3)
+            angle_var = random.uniform(-0.2, 0.2)
+            blades.append({
+                'x': x + random.uniform(-3, 3),
+                'y': y + random.uniform(-3, 3),
+                'height': 12 * height_var,
+                'angle': angle_var,
+                'base_angle': angle_var,
+                'sway_speed': random.uniform(1.5, 2.5),
+                'color': random.choice([(1, 1, 1), (2, 2, 2), (3, 3, 3)]),
+                'width': random.randint(2, 4)
+            })
+    return blades
+
+
+def _make_waves(count, seed=1):
+    """Ondas que no caducan durante la medición."""
+    rng = random.Random(seed)
+    return [{'x': rng.uniform(0, SCREEN_WIDTH), 'y': rng.uniform(0, SCREEN_HEIGHT),
+             'radius': 60, 'strength': 1.0, 'decay': 0.0}
+            for _ in range(count)]
+
+
+def bench_update():
+    """update: antes / después para cada número de ondas."""
+    print_header(f"BENCH: GrassSystem.update ({SCREEN_WIDTH}x{SCREEN_HEIGHT})")
+    grass = GrassSystem(SCREEN_WIDTH, SCREEN_HEIGHT, seed=0, baked=False)
+    blades = _legacy_blades(grass)
+    print(f"[INFO] {grass.blade_count} briznas")
+    print(f"{'ondas':>6} {'antes ms':>10} {'después ms':>11} {'mejora':>8}")
+
+    for count in WAVE_COUNTS:
+        waves = _make_waves(count)
+        grass.waves = [dict(w) for w in waves]
+        before = measure(lambda: _legacy_update(blades, waves, 1.0), number=1, repeat=3) / 1000
+        after = measure(lambda: grass.update(1 / 60), number=20, repeat=5) / 1000
+        print(f"{count:>6} {before:10.2f} {after:11.3f} {before / after:7.0f}x")
+
+
+def bench_construct():
+    """Construcción del sistema (arranque del juego)."""
+    print_header("BENCH: construcción de GrassSystem")
+    start = time.perf_counter()
+    _legacy_construct(SCREEN_WIDTH, SCREEN_HEIGHT)
+    before = (time.perf_counter() - start) * 1000
+    after = measure(lambda: GrassSystem(SCREEN_WIDTH, SCREEN_HEIGHT), number=1, repeat=5) / 1000
+    print(f"antes {before:.1f} ms | después {after:.2f} ms")
+
+
+def bench_draw():
+    """update + draw por frame: en vivo vs precalculado, con y sin oclusión."""
+    print_header("BENCH: GrassSystem update + draw (ms por frame, 60 FPS = 16.7)")
+    pygame.init()
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    # Misma capa opaca que tapa el pasto en el juego
+    renderer = GameRenderer(screen, None, None, None)
+    compositor = BackgroundCompositor()
+    compositor.set_occluder('play_area', renderer._play_area_rect(GridManager()))
+
+    variants = []
+    for baked in (False, True):
+        for occluded in (False, True):
+            grass = GrassSystem(SCREEN_WIDTH, SCREEN_HEIGHT, seed=0, baked=baked)
+            if occluded:
+                compositor.draw(screen, grass)
+            variants.append((grass, occluded))
+    start = time.perf_counter()
+    variants[2][0].draw(screen)
+    print(f"[INFO] precálculo de {LOOP_FRAMES} fotogramas: "
+          f"{(time.perf_counter() - start) * 1000:.0f} ms")
+    stats = compositor.get_stats(variants[1][0])
+    print(f"[INFO] oclusión: {stats['culled_blades']} de {variants[1][0].blade_count} "
+          f"briznas y {stats['culled_pixels']} px descartados")
+    print(f"{'ondas':>6} {'live':>8} {'live+oc':>8} {'baked':>8} {'baked+oc':>9}")
+
+    for count in WAVE_COUNTS:
+        costs = []
+        for grass, occluded in variants:
+            grass.waves = _make_waves(count)
+            def frame():
+                grass.update(1 / 60)
+                if occluded:
+                    compositor.draw(screen, grass)
+                else:
+                    grass.draw(screen)
+            costs.append(measure(frame, number=1 if not grass.baked else 10, repeat=3) / 1000)
+        print(f"{count:>6} {costs[0]:8.1f} {costs[1]:8.2f} {costs[2]:8.2f} {costs[3]:9.2f}")
+
+
+if __name__ == '__main__':
+    bench_construct()
+    print()
+    bench_update()
+    print()
+    bench_draw()
@@ -0,0 +1,319 @@
+"""
+Benchmark del grid hexagonal
+============================
+Mide el coste de GridManager al crecer el mapa.
+Ejecutar: python dev_tools/bench_grid.py [--lookup | --scaling | --path | --los | --layer]
+"""
+import random
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dev_tools.bench_utils import measure, print_header, setup_headless
+setup_headless()
+
+import pygame
+from config.constants import HEX_RADIUS, SCREEN_WIDTH, SCREEN_HEIGHT
+from core.grid_manager import GridManager
+from core.unit_manager import UnitManager
+from core.renderer import GameRenderer
+from systems.pathfinding import PathfindingService
+from systems.line_of_sight import LineOfSight
+
+# (columnas, filas por zona) -> el mapa visible tiene cols x 2*rows tiles
+LOOKUP_SIZES = [(8, 6), (32, 16), (64, 32), (128, 64), (200, 100)]
+SCALING_SIZES = [(8, 6), (32, 16), (64, 32), (128, 64)]
+
+# Presupuesto por operación: (tamaño de referencia, factor máximo permitido).
+# Las operaciones por frame no pueden crecer más allá del factor respecto a
+# la referencia; el dibujado se compara con 32x32, el primer mapa que ya
+# llena la pantalla. None = operación por evento, solo se informa.
+BUDGETS = {
+    'lookup': ((8, 6), 2.5),
+    'neighbors': ((8, 6), 2.5),
+    'hover': ((8, 6), 2.5),
+    'draw': ((32, 16), 1.5),
+    'order': ((8, 6), 2.5),
+    'valid_moves': None,
+}
+
+# Por encima de este tamaño el barrido lineal es demasiado lento para medirlo
+LINEAR_MAX_TILES = 64 * 64
+
+
+def _find_tile_linear(grid_manager, pos):
+    """Implementación anterior de find_tile: recorre todos los tiles."""
+    for tile in grid_manager.grid.values():
+        dx = pos[0] - tile.x
+        dy = pos[1] - tile.y
+        if (dx**2 + dy**2)**0.5 <= HEX_RADIUS * 0.9:
+            return tile
+    return None
+
+
+def _sample_points(grid_manager, count=512):
+    """Puntos aleatorios dentro del rectángulo que ocupa el grid."""
+    xs = [t.x for t in grid_manager.grid.values()]
+    ys = [t.y for t in grid_manager.grid.values()]
+    rng = random.Random(42)
+    return [(rng.uniform(min(xs), max(xs)), rng.uniform(min(ys), max(ys)))
+            for _ in range(count)]
+
+
+def bench_find_tile():
+    """find_tile O(1) vs barrido lineal, de 8x12 a 200x200."""
+    print_header("BENCH: GridManager.find_tile")
+    print(f"{'mapa':>10} {'tiles':>7} {'O(1) us':>9} {'lineal us':>10}")
+
+    results = []
+    for cols, rows in LOOKUP_SIZES:
+        grid = GridManager(cols, rows)
+        points = _sample_points(grid)
+        it = iter(points * 1000)
+
+        fast = measure(lambda: grid.find_tile(next(it)), number=len(points))
+
+        linear = None
+        if len(grid.grid) <= LINEAR_MAX_TILES:
+            it_lin = iter(points * 10)
+            linear = measure(lambda: _find_tile_linear(grid, next(it_lin)),
+                             number=64, repeat=3)
+
+        results.append(fast)
+        linear_txt = f"{linear:10.1f}" if linear is not None else f"{'-':>10}"
+        print(f"{cols:>4}x{rows * 2:<5} {len(grid.grid):>7} {fast:9.2f} {linear_txt}")
+
+    ratio = max(results) / min(results)
+    print(f"\n[INFO] Variación O(1) entre tamaños: x{ratio:.2f}")
+    return results
+
+
+def _make_renderer(screen):
+    """GameRenderer con fuentes por defecto (sin depender de fuentes del sistema)."""
+    pygame.font.init()
+    return GameRenderer(screen, pygame.font.Font(None, 36),
+                        pygame.font.Font(None, 28), pygame.font.Font(None, 20))
+
+
+def _bench_size(cols, rows, screen):
+    """Mide todas las operaciones del grid para un tamaño de mapa."""
+    grid = GridManager(cols, rows)
+    units = UnitManager(grid)
+    units.setup_initial_units()
+    renderer = _make_renderer(screen)
+
+    points = _sample_points(grid)
+    tiles = list(grid.grid.values())
+    hero_tile = grid.get_unit_tile(units.hero)
+
+    it_lookup = iter(points * 2000)
+    it_hover = iter(points * 2000)
+    it_tiles = iter(tiles * (20000 // len(tiles) + 1))
+
+    def draw_frame():
+        renderer.draw_grid(grid)
+        renderer.draw_units_and_towers(grid)
+
+    return {
+        'lookup': measure(lambda: grid.find_tile(next(it_lookup)), number=500),
+        'neighbors': measure(lambda: grid.get_neighbors(next(it_tiles)), number=2000),
+        'hover': measure(lambda: grid.update_hover(next(it_hover)), number=500),
+        'valid_moves': measure(lambda: grid.update_valid_moves(hero_tile), number=20, repeat=3),
+        'draw': measure(draw_frame, number=5, repeat=3),
+        'order': measure(grid.get_all_units_and_towers, number=2000),
+    }
+
+
+def bench_scaling():
+    """Suite de escalado: 8x12, 32x32, 64x64 y 128x128 con presupuestos."""
+    print_header("BENCH: escalado del grid (us por llamada)")
+    pygame.init()
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    results = {}
+    for cols, rows in SCALING_SIZES:
+        results[(cols, rows)] = _bench_size(cols, rows, screen)
+
+    ops = list(BUDGETS)
+    print(f"{'mapa':>10} " + " ".join(f"{op:>12}" for op in ops))
+    for (cols, rows), row in results.items():
+        print(f"{cols:>4}x{rows * 2:<5} " + " ".join(f"{row[op]:12.2f}" for op in ops))
+
+    failures = []
+    for op, budget in BUDGETS.items():
+        if budget is None:
+            continue
+        ref_size, factor = budget
+        limit = results[ref_size][op] * factor
+        worst = max(row[op] for row in results.values())
+        status = "OK" if worst <= limit else "FALLO"
+        if worst > limit:
+            failures.append(op)
+        print(f"[{status}] {op}: peor {worst:.2f}us / límite {limit:.2f}us "
+              f"(x{factor} de {ref_size[0]}x{ref_size[1] * 2})")
+    return failures
+
+
+def bench_pathfinding():
+    """A* sin caché vs con caché, y coste de invalidar al mover una unidad."""
+    print_header("BENCH: PathfindingService.find_path")
+    print(f"{'mapa':>10} {'A* us':>9} {'caché us':>9} {'mover us':>9}")
+
+    for cols, rows in SCALING_SIZES:
+        grid = GridManager(cols, rows)
+        pathfinder = PathfindingService(grid)
+        rng = random.Random(11)
+        pairs = [tuple(rng.sample(grid.tiles, 2)) for _ in range(64)]
+
+        it_cold = iter(pairs * 100)
+        def cold():
+            start, goal = next(it_cold)
+            pathfinder.clear()
+            pathfinder.find_path(start, goal)
+        uncached = measure(cold, number=32, repeat=3)
+
+        for start, goal in pairs:
+            pathfinder.find_path(start, goal)
+        it_warm = iter(pairs * 2000)
+        cached = measure(lambda: pathfinder.find_path(*next(it_warm)), number=len(pairs))
+
+        # Mover una unidad de ida y vuelta: solo se invalida lo afectado
+        unit = object()
+        a, b = grid.tiles[0], grid.tiles[1]
+        grid.place_unit(a, unit)
+        toggle = [a, b]
+        def move():
+            toggle.reverse()
+            grid.place_unit(toggle[0], unit)
+        moved = measure(move, number=100, repeat=3)
+
+        print(f"{cols:>4}x{rows * 2:<5} {uncached:9.1f} {cached:9.2f} {moved:9.2f}")
+
+    bench_horde()
+
+
+def bench_horde(cols=32, rows=16, enemy_counts=(5, 20, 60)):
+    """Turno enemigo completo: A* por enemigo vs un campo de flujo compartido."""
+    print()
+    print_header(f"BENCH: turno de horda en {cols}x{rows * 2} (us por turno)")
+    print(f"{'enemigos':>9} {'A* x N':>10} {'flujo':>10}")
+
+    rng = random.Random(5)
+    for count in enemy_counts:
+        grid = GridManager(cols, rows)
+        pathfinder = PathfindingService(grid)
+        player = [t for t in grid.tiles if t.owner == "player"]
+        enemy = [t for t in grid.tiles if t.owner == "enemy"]
+        sources = rng.sample(player, 6)
+        for tile in sources:
+            grid.place_unit(tile, object())
+        horde = rng.sample(enemy, count)
+        for tile in horde:
+            grid.place_unit(tile, object())
+
+        def per_enemy():
+            pathfinder.clear()
+            for tile in horde:
+                for goal in sources:
+                    pathfinder.find_path(tile, goal, zones=("enemy",), closest=True)
+
+        def flow():
+            pathfinder.clear()
+            field = pathfinder.get_flow_field(sources)
+            for tile in horde:
+                field.next_step(tile, zones=("enemy",))
+
+        astar = measure(per_enemy, number=1, repeat=3)
+        flowed = measure(flow, number=3, repeat=3)
+        print(f"{count:>9} {astar:10.0f} {flowed:10.0f}")
+
+
+def bench_line_of_sight():
+    """Línea de visión: trazado en frío, resultado cacheado y tras un cambio."""
+    print_header("BENCH: LineOfSight.has_line_of_sight (us por consulta)")
+    print(f"{'mapa':>10} {'frío':>8} {'caché':>8} {'tras mover':>11}")
+
+    for cols, rows in SCALING_SIZES:
+        grid = GridManager(cols, rows)
+        los = LineOfSight(grid)
+        rng = random.Random(2)
+        pairs = [tuple(rng.sample(grid.tiles, 2)) for _ in range(256)]
+
+        it_cold = iter(pairs * 100)
+        def cold():
+            los.clear()
+            los.has_line_of_sight(*next(it_cold))
+        uncached = measure(cold, number=64, repeat=3)
+
+        for a, b in pairs:
+            los.has_line_of_sight(a, b)
+        it_warm = iter(pairs * 2000)
+        cached = measure(lambda: los.has_line_of_sight(*next(it_warm)), number=len(pairs))
+
+        # Una unidad se mueve entre consultas: solo caen los rayos que cruza
+        unit = object()
+        toggle = [grid.tiles[len(grid.tiles) // 2], grid.tiles[len(grid.tiles) // 2 + 1]]
+        it_move = iter(pairs * 2000)
+        def after_move():
+            toggle.reverse()
+            grid.place_unit(toggle[0], unit)
+            los.has_line_of_sight(*next(it_move))
+        moved = measure(after_move, number=len(pairs))
+
+        print(f"{cols:>4}x{rows * 2:<5} {uncached:8.2f} {cached:8.2f} {moved:11.2f}")
+
+
+def bench_grid_layer():
+    """Tablero: dibujar todos los tiles vs capa cacheada (quieto y con hover)."""
+    print_header("BENCH: GameRenderer.draw_grid (us por frame)")
+    print(f"{'mapa':>10} {'tiles':>8} {'capa':>8} {'+hover':>8} {'redibuj.':>9}")
+    pygame.init()
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    for cols, rows in SCALING_SIZES:
+        grid = GridManager(cols, rows)
+        units = UnitManager(grid)
+        units.setup_initial_units()
+        hero_tile = grid.get_unit_tile(units.hero)
+        grid.set_selected(hero_tile)
+        grid.update_valid_moves(hero_tile)
+        renderer = _make_renderer(screen)
+
+        visible = grid.get_visible_tiles(screen.get_rect())
+        def per_tile():
+            for tile in visible:
+                tile.draw(screen)
+        direct = measure(per_tile, number=5, repeat=3)
+
+        renderer.draw_grid(grid)
+        idle = measure(lambda: renderer.draw_grid(grid), number=50, repeat=3)
+
+        # El ratón cruza un tile distinto cada frame
+        points = [(t.x, t.y) for t in visible]
+        it_hover = iter(points * 1000)
+        def hover_frame():
+            grid.update_hover(next(it_hover))
+            renderer.draw_grid(grid)
+        hovered = measure(hover_frame, number=50, repeat=3)
+
+        print(f"{cols:>4}x{rows * 2:<5} {direct:8.0f} {idle:8.0f} {hovered:8.0f} "
+              f"{renderer.grid_layer.tiles_redrawn:>9}")
+
+
+if __name__ == '__main__':
+    failures = []
+    if '--layer' in sys.argv:
+        bench_grid_layer()
+        sys.exit(0)
+    if '--path' in sys.argv:
+        bench_pathfinding()
+        sys.exit(0)
+    if '--los' in sys.argv:
+        bench_line_of_sight()
+        sys.exit(0)
+    if '--scaling' not in sys.argv:
+        bench_find_tile()
+        print()
+    if '--lookup' not in sys.argv:
+        failures = bench_scaling()
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,52 @@
+"""
+Benchmark del profiler por etapas
+=================================
+Coste del profiler: una vuelta suelta (lap) apagado y encendido, y un
+frame headless completo con el profiler apagado, en modo FPS y en modo
+completo (con HUD).
+Ejecutar: python dev_tools/bench_profiler.py
+"""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dev_tools.bench_utils import measure, print_header, setup_headless
+setup_headless()
+
+from core.frame_profiler import FrameProfiler, PROFILER_OFF, PROFILER_FPS, PROFILER_FULL
+from core.headless import HeadlessRunner
+
+FRAMES = 120
+MODES = (("apagado", PROFILER_OFF), ("FPS", PROFILER_FPS), ("completo", PROFILER_FULL))
+
+
+def bench_lap():
+    """Coste de un frame de 13 vueltas sin trabajo entre medias."""
+    print_header("BENCH: profiler - frame de 13 vueltas vacías (µs)")
+    for label, mode in MODES:
+        profiler = FrameProfiler(mode)
+
+        def frame():
+            profiler.begin_frame()
+            for _ in range(13):
+                profiler.lap('etapa')
+            profiler.end_frame()
+        print(f"{label:>9}: {measure(frame, number=2000):7.2f} µs")
+
+
+def bench_frame():
+    """Frame headless completo con cada modo del profiler."""
+    print_header("BENCH: profiler - frame headless completo (ms)")
+    runner = HeadlessRunner(seed=0)
+    try:
+        runner.step(30)
+        for label, mode in MODES:
+            runner.game.profiler.mode = mode
+            print(f"{label:>9}: {measure(runner.step, number=FRAMES, repeat=3) / 1000:7.2f} ms")
+    finally:
+        runner.close()
+
+
+if __name__ == '__main__':
+    bench_lap()
+    bench_frame()
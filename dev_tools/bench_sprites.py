@@ -0,0 +1,143 @@
+"""
+Benchmark de sprites geométricos
+================================
+Coste por figura de GeometricUnit / GeometricTower dibujadas primitiva a
+primitiva frente al blit del sprite cacheado, del héroe (HeroRenderer)
+figura a figura frente a capas cacheadas, y memoria que ocupa la caché
+con todas las fases de animación.
+Con --lod: batalla grande dibujada a cada nivel de detalle.
+Ejecutar: python dev_tools/bench_sprites.py [--lod]
+"""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dev_tools.bench_utils import measure, print_header, setup_headless
+setup_headless()
+
+import pygame
+from config.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from core.grid_manager import GridManager
+from core.renderer import GameRenderer
+from entities import Hero, UltraUnit, UltraTower
+from entities.hero import HeroRenderer
+from systems.geometry import GeometricUnit, GeometricTower
+from systems.lod import LOD_NAMES, LOD_COUNT_THRESHOLDS
+from systems.sprite_cache import SpriteCache, SPRITE_PHASES
+
+UNIT_TYPES = ["berserker", "assault", "ranger", "sniper", "tank", "mage"]
+UNIT_SCALE = 0.55   # escala de entities/unit.py
+TOWER_SCALE = 0.5   # escala de entities/tower.py
+HERO_SCALE = 0.6    # escala de entities/hero.py
+
+
+def _figures():
+    """(nombre, figura, función de dibujado) con las escalas del juego."""
+    figures = []
+    for unit_type in UNIT_TYPES:
+        unit = GeometricUnit(unit_type, "player")
+        figures.append((unit_type, unit,
+                        lambda screen, f=unit: f.draw(screen, 400, 300, scale=UNIT_SCALE)))
+    tower = GeometricTower("player")
+    figures.append(("tower", tower,
+                    lambda screen, f=tower: f.draw(screen, 400, 300, scale=TOWER_SCALE,
+                                                   anim_time=0.3)))
+    hero = HeroRenderer()
+    figures.append(("hero", hero,
+                    lambda screen, f=hero: f.draw(screen, 400, 300, scale=HERO_SCALE,
+                                                  anim_time=0.3)))
+    return figures
+
+
+def bench_draw():
+    """Coste por figura: antes (primitivas) / después (blit cacheado)."""
+    print_header("BENCH: dibujado por figura (µs)")
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    print(f"{'figura':>10} {'antes':>9} {'después':>9} {'mejora':>8}")
+
+    for name, figure, draw in _figures():
+        figure.sprite_cache = None
+        before = measure(lambda: draw(screen), number=200)
+        figure.sprite_cache = SpriteCache()
+        draw(screen)
+        after = measure(lambda: draw(screen), number=2000)
+        print(f"{name:>10} {before:9.1f} {after:9.1f} {before / after:7.1f}x")
+
+
+def bench_memory():
+    """Memoria de la caché con todas las figuras, facciones y fases."""
+    print_header("BENCH: memoria de la caché (todas las fases)")
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    cache = SpriteCache()
+
+    for owner in ("player", "enemy"):
+        for unit_type in UNIT_TYPES:
+            unit = GeometricUnit(unit_type, owner)
+            unit.sprite_cache = cache
+            period = unit.ANIM_PERIODS.get(unit_type, 1.0)
+            for phase in range(SPRITE_PHASES):
+                ticks = period * phase / SPRITE_PHASES
+                cache.get(('unit', unit_type, owner, UNIT_SCALE, phase),
+                          lambda surface, x, y, u=unit, t=ticks:
+                              u._draw_figure(surface, x, y, UNIT_SCALE, t),
+                          unit.SPRITE_EXTENT * UNIT_SCALE)
+                if unit_type not in unit.ANIM_PERIODS:
+                    break
+        tower = GeometricTower(owner)
+        tower.sprite_cache = cache
+        for phase in range(SPRITE_PHASES):
+            tower.draw(screen, 400, 300, scale=TOWER_SCALE,
+                       anim_time=tower.ANIM_PERIOD * (phase + 0.5) / SPRITE_PHASES)
+
+    stats = cache.get_stats()
+    print(f"sprites {stats['entries']} | {stats['bytes'] / 1024:.0f} KiB "
+          f"(tope {cache.max_bytes / 1024 / 1024:.0f} MiB) | descartes {stats['evictions']}")
+
+
+def bench_lod(counts=(40, 120, 300)):
+    """draw_units_and_towers de una batalla grande a cada nivel de detalle."""
+    print_header("BENCH: niveles de detalle (ms por frame)")
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    font = pygame.font.Font(None, 24)
+    print(f"{'figuras':>8} " + " ".join(f"{name:>9}" for name in LOD_NAMES) + f" {'auto':>9}")
+
+    for count in counts:
+        grid = GridManager(24, 8)
+        renderer = GameRenderer(screen, font, font, font)
+        # Solo las casillas a la vista, repartidas entre tropas, torres y héroe
+        tiles = grid.get_visible_tiles((0, 0, SCREEN_WIDTH, SCREEN_HEIGHT))
+        step = max(1, len(tiles) // count)
+        for i, tile in enumerate(tiles[::step][:count]):
+            owner = "player" if tile.owner == "player" else "enemy"
+            if i == 0:
+                grid.place_unit(tile, Hero())
+            elif i % 10 == 0:
+                grid.place_tower(tile, UltraTower(owner))
+            else:
+                grid.place_unit(tile, UltraUnit(UNIT_TYPES[i % 4], owner))
+        placed = len(grid.draw_order)
+
+        costs = []
+        for level in range(len(LOD_NAMES)):
+            renderer.lod.level = level
+            renderer.draw_units_and_towers(grid)
+            costs.append(measure(lambda: renderer.draw_units_and_towers(grid),
+                                 number=20, repeat=3) / 1000)
+        renderer.lod.level = None
+        renderer.draw_units_and_towers(grid)
+        auto = LOD_NAMES[renderer.lod.tier]
+        print(f"{placed:>8} " + " ".join(f"{cost:9.2f}" for cost in costs) + f" {auto:>9}")
+    print(f"(automático por número de figuras: silueta desde {LOD_COUNT_THRESHOLDS[0]}, "
+          f"ficha desde {LOD_COUNT_THRESHOLDS[1]}; además baja si el frame pasa del presupuesto)")
+
+
+if __name__ == '__main__':
+    if '--lod' in sys.argv:
+        bench_lod()
+        sys.exit(0)
+    bench_draw()
+    print()
+    bench_memory()
@@ -0,0 +1,91 @@
+"""
+Benchmark de la interfaz
+========================
+Coste por frame del HUD (panel superior, ayuda, info de unidad, oráculo
+y menú de acciones) rasterizando los textos en cada frame, como antes,
+frente a la caché de textos, y recomponiendo el panel superior y el menú
+cada frame frente a sus capas retenidas.
+Ejecutar: python dev_tools/bench_ui.py
+"""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dev_tools.bench_utils import measure, print_header, setup_headless
+setup_headless()
+
+import pygame
+from config.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from core.grid_manager import GridManager
+from core.renderer import GameRenderer
+from core.unit_manager import UnitManager
+from systems.alternating_turn_system import AlternatingTurnSystem
+from systems.text_cache import text_cache, TEXT_CACHE_SIZE
+from ui import OracleOfKimi, PersistentMenu
+
+
+def _make_hud(screen):
+    """Renderer y estado de UI de un turno del héroe con menú abierto."""
+    grid = GridManager()
+    units = UnitManager(grid)
+    units.setup_initial_units()
+    turns = AlternatingTurnSystem()
+    turns.setup(units.hero, units.get_troops_only(), units.enemy_units)
+
+    renderer = GameRenderer(screen, pygame.font.Font(None, 52),
+                            pygame.font.Font(None, 28), pygame.font.Font(None, 22))
+    oracle = OracleOfKimi()
+    oracle.advice = "¡Mueve a la casilla DORADA!"
+    menu = PersistentMenu(20, 100, 160)
+    for text in ("Mover", "Ataque (2 AP)", "Golpe Fuerte (4 AP)", "Curar (3 AP)",
+                 "Terminar Turno"):
+        menu.add_button(text, None)
+    selected = grid.get_unit_tile(units.hero)
+    frame = lambda: renderer.draw_ui(turns, units, selected, oracle, menu)
+    frame.layers = (renderer.top_panel, menu.layer)
+    return frame
+
+
+def bench_hud():
+    """HUD por frame: sin caché de textos vs con caché."""
+    print_header("BENCH: HUD por frame")
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    frame = _make_hud(screen)
+
+    print(f"{'caché':>8} {'ms/frame':>9} {'textos rasterizados/frame':>26}")
+    for label, size in (("sin", 0), ("con", TEXT_CACHE_SIZE)):
+        text_cache.clear()
+        text_cache.max_entries = size
+        frame()
+        misses = text_cache.misses
+        cost = measure(frame, number=100, repeat=3) / 1000
+        renders = (text_cache.misses - misses) / 300
+        print(f"{label:>8} {cost:9.3f} {renders:26.1f}")
+    text_cache.max_entries = TEXT_CACHE_SIZE
+
+
+def bench_layers():
+    """HUD por frame: panel superior y menú recompuestos vs capas retenidas."""
+    print_header("BENCH: capas retenidas de la interfaz")
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    frame = _make_hud(screen)
+
+    def recompose():
+        for layer in frame.layers:
+            layer.invalidate()
+        frame()
+
+    print(f"{'capas':>10} {'ms/frame':>9} {'composiciones/frame':>20}")
+    for label, fn in (("sin", recompose), ("retenidas", frame)):
+        fn()
+        before = sum(layer.renders for layer in frame.layers)
+        cost = measure(fn, number=100, repeat=3) / 1000
+        renders = (sum(layer.renders for layer in frame.layers) - before) / 300
+        print(f"{label:>10} {cost:9.3f} {renders:20.1f}")
+
+
+if __name__ == '__main__':
+    bench_hud()
+    bench_layers()
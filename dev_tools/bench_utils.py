@@ -0,0 +1,39 @@
+"""
+Utilidades de benchmark
+=======================
+Helpers compartidos por los scripts bench_*.py de dev_tools.
+"""
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+def setup_headless():
+    """Configura SDL sin ventana ni audio (build boxes sin display)."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+def measure(fn, number=1000, repeat=5):
+    """
+    Mide el coste de fn().
+    Returns: microsegundos por llamada (mejor de `repeat` rondas).
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+    return best / number * 1e6
+
+
+def print_header(title):
+    """Imprime una cabecera de sección."""
+    print("=" * 60)
+    print(title)
+    print("=" * 60)
@@ -0,0 +1,181 @@
+"""
+Tests del modo dirty-rect
+=========================
+Ejecutar: python dev_tools/test_dirty_rects.py  (o pytest)
+"""
+import hashlib
+import os
+import random
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from config.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from core.dirty_rects import DirtyRectTracker
+from core.grid_manager import GridManager
+from core.renderer import GameRenderer
+from core.unit_manager import UnitManager
+from entities.projectile import TracerProjectile
+from systems.alternating_turn_system import AlternatingTurnSystem
+from systems.geometry import GeometricUnit
+from systems.grass import GrassSystem
+from systems.particles import ParticleSystem
+from ui import OracleOfKimi, PersistentMenu
+
+
+def test_tracker_merges_cells():
+    """Las zonas se agrupan en franjas de celdas; el primer frame es completo."""
+    tracker = DirtyRectTracker(enabled=True, cell=10)
+    tracker.begin_frame((100, 100))
+    tracker.mark((5, 5, 10, 3))
+    assert tracker.end_frame() is None  # primer frame: flip
+    assert tracker.previous == [pygame.Rect(0, 0, 20, 10)]
+
+    tracker.begin_frame((100, 100))
+    tracker.mark((30, 0, 5, 5))
+    tracker.mark((95, 95, 20, 20))
+    update = tracker.end_frame()
+    # Zona anterior (a borrar) + las nuevas, recortadas a la pantalla
+    assert update == [pygame.Rect(0, 0, 20, 10), pygame.Rect(30, 0, 10, 10),
+                      pygame.Rect(90, 90, 10, 10)]
+
+    tracker.begin_frame((120, 100))
+    assert not tracker.partial  # cambio de tamaño
+    tracker.end_frame()
+    tracker.begin_frame((120, 100))
+    tracker.invalidate()
+    assert tracker.end_frame() is None
+    assert tracker.get_stats()['full_redraws'] == 3
+
+    disabled = DirtyRectTracker()
+    disabled.begin_frame((100, 100))
+    disabled.mark((0, 0, 10, 10))
+    assert disabled.end_frame() is None and not disabled.previous
+
+
+def test_draw_bounds_cover_objects():
+    """DRAW_BOUNDS contiene todo lo que pinta cada unidad, torre y el héroe."""
+    pygame.init()
+    grid = GridManager()
+    units = UnitManager(grid)
+    units.setup_initial_units()
+    for _, obj, _ in grid.get_all_units_and_towers():
+        dx, dy, w, h = obj.DRAW_BOUNDS
+        bounds = pygame.Rect(200 + dx, 200 + dy, w, h)
+        for step in range(60):
+            t = step * 0.11
+            for attr in ('animation_time', '_anim_time'):
+                if hasattr(obj, attr):
+                    setattr(obj, attr, t)
+            if hasattr(obj, 'bounce_offset'):
+                obj.bounce_offset = -8 if step % 2 else 1.5
+            canvas = pygame.Surface((400, 400), pygame.SRCALPHA)
+            obj.draw(canvas, 200, 200)
+            painted = canvas.get_bounding_rect()
+            assert bounds.contains(painted), (obj.unit_type if hasattr(obj, 'unit_type') else obj, painted)
+
+
+class _Target:
+    x, y = 5000, 5000
+
+    def is_alive(self):
+        return True
+
+
+class _Scene:
+    """Escena de juego reproducible dibujada con GameRenderer."""
+
+    def __init__(self, dirty_rects):
+        random.seed(7)
+        pygame.font.init()
+        self.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        font = pygame.font.Font(None, 24)
+        self.renderer = GameRenderer(self.screen, font, font, font, dirty_rects=dirty_rects)
+        self.grid = GridManager()
+        self.units = UnitManager(self.grid)
+        self.units.setup_initial_units()
+        self.grass = GrassSystem(SCREEN_WIDTH, SCREEN_HEIGHT, seed=7)
+        self.particles = ParticleSystem()
+        self.projectiles = []
+        self.turns = AlternatingTurnSystem()
+        self.turns.setup(self.units.hero, self.units.get_troops_only(), self.units.enemy_units)
+        self.oracle = OracleOfKimi()
+        self.menu = PersistentMenu(x=20, y=110, width=150)
+        self.selected = None
+
+    def step(self, frame, dt=1 / 30):
+        grid = self.grid
+        if frame == 3:
+            self.particles.spawn_attack(600, 400, "player")
+            self.particles.spawn_dust(300, 500)
+            self.projectiles.append(TracerProjectile(500, 300, _Target(), 10, (255, 200, 50),
+                                                     "player", self.particles))
+        if frame == 5:
+            troop = self.units.get_troops_only()[0]
+            from_tile = grid.get_unit_tile(troop)
+            to_tile = next(t for t in grid.get_neighbors(from_tile) if t.is_empty())
+            grid.move_unit(from_tile, to_tile)
+            troop.move_to(to_tile.x, to_tile.y)
+        if frame == 8:
+            self.selected = grid.get_unit_tile(self.units.hero)
+            grid.set_selected(self.selected)
+            self.oracle.advice = "¡Mueve a la casilla DORADA!"
+            self.menu.add_button("Atacar", None)
+        if frame == 12:
+            self.menu.clear()
+            self.oracle.advice = ""
+        tile = grid.tiles[(frame * 7) % len(grid.tiles)]
+        grid.update_hover((tile.x, tile.y))
+
+        self.units.update(dt, self.grass)
+        self.grass.update(dt)
+        self.particles.update(dt)
+        for proj in self.projectiles:
+            proj.update(dt)
+
+        renderer = self.renderer
+        renderer.clear_screen()
+        renderer.draw_background(self.grass, grid)
+        renderer.draw_grid(grid)
+        renderer.draw_units_and_towers(grid)
+        renderer.draw_effects(self.projectiles, self.particles)
+        renderer.draw_ui(self.turns, self.units, self.selected, self.oracle, self.menu)
+        return renderer.dirty.end_frame()
+
+
+def test_dirty_frames_match_full_frames():
+    """Componer solo las zonas sucias deja la pantalla igual que redibujarla entera."""
+    frames = 16
+    # Las figuras animadas leen el reloj: se congelan en la fase 0
+    periods = GeometricUnit.ANIM_PERIODS
+    GeometricUnit.ANIM_PERIODS = {unit_type: 1e15 for unit_type in periods}
+    try:
+        full = _Scene(dirty_rects=False)
+        expected = []
+        for frame in range(frames):
+            assert full.step(frame) is None
+            expected.append(hashlib.md5(pygame.image.tobytes(full.screen, 'RGB')).hexdigest())
+
+        dirty = _Scene(dirty_rects=True)
+        partial_frames = 0
+        for frame in range(frames):
+            update = dirty.step(frame)
+            if update is not None:
+                partial_frames += 1
+                area = sum(r.width * r.height for r in update)
+                assert area < SCREEN_WIDTH * SCREEN_HEIGHT
+            digest = hashlib.md5(pygame.image.tobytes(dirty.screen, 'RGB')).hexdigest()
+            assert digest == expected[frame], f"frame {frame}"
+        assert partial_frames == frames - 1
+    finally:
+        GeometricUnit.ANIM_PERIODS = periods
+
+
+if __name__ == '__main__':
+    test_tracker_merges_cells()
+    test_draw_bounds_cover_objects()
+    test_dirty_frames_match_full_frames()
+    print("[DONE] tests de dirty rects OK")
@@ -0,0 +1,73 @@
+"""
+Tests de la caché de glows
+==========================
+Ejecutar: python dev_tools/test_glow_cache.py  (o pytest)
+"""
+import os
+import random
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from systems.glow_cache import GlowCache, alpha_bucket, glow_cache
+from systems.geometry import GeometryRenderer
+from systems.particles import ParticleSystem
+
+
+def test_circle_matches_direct_surface():
+    """El círculo cacheado es el mismo que se creaba a mano (alpha cuantizado)."""
+    assert alpha_bucket(0) == 0 and alpha_bucket(255) == 255
+    assert alpha_bucket(150) == 152 and alpha_bucket(3) == 0
+
+    cache = GlowCache()
+    surface = cache.circle(10, (255, 200, 50), 150)
+    expected = pygame.Surface((20, 20), pygame.SRCALPHA)
+    pygame.draw.circle(expected, (255, 200, 50, alpha_bucket(150)), (10, 10), 10)
+    assert pygame.image.tobytes(surface, 'RGBA') == pygame.image.tobytes(expected, 'RGBA')
+
+    assert cache.circle(10, (255, 200, 50, 99), 149) is surface
+    assert cache.get_stats()['hits'] == 1 and cache.get_stats()['misses'] == 1
+
+
+def test_lru_is_bounded():
+    """No se guardan más superficies que max_entries."""
+    cache = GlowCache(max_entries=4)
+    for radius in range(1, 7):
+        cache.circle(radius, (255, 255, 255), 100)
+    stats = cache.get_stats()
+    assert stats['entries'] == 4 and stats['evictions'] == 2
+    cache.circle(6, (255, 255, 255), 100)
+    assert cache.get_stats()['hits'] == 1
+
+
+def _effects_frames(screen, frames=40):
+    """Chispas, ataques y glows durante unos frames (misma semilla)."""
+    random.seed(3)
+    particles = ParticleSystem()
+    for frame in range(frames):
+        if frame % 10 == 0:
+            particles.spawn_spark(200, 150, (255, 200, 50), 10)
+            particles.spawn_attack(300, 150, "enemy")
+        particles.update(1 / 60)
+        particles.draw(screen)
+        GeometryRenderer.draw_glow(screen, 100, 100, 12, (100, 150, 255), 3)
+
+
+def test_steady_state_allocates_nothing():
+    """Repetir los mismos efectos no crea superficies nuevas."""
+    screen = pygame.Surface((400, 300))
+    _effects_frames(screen)
+    misses = glow_cache.misses
+    hits = glow_cache.hits
+    _effects_frames(screen)
+    assert glow_cache.misses == misses
+    assert glow_cache.hits > hits
+
+
+if __name__ == '__main__':
+    test_circle_matches_direct_surface()
+    test_lru_is_bounded()
+    test_steady_state_allocates_nothing()
+    print("[DONE] Tests de la caché de glows completados!")
@@ -0,0 +1,119 @@
+"""
+Tests del pasto vectorizado
+===========================
+Ejecutar: python dev_tools/test_grass.py  (o pytest)
+"""
+import math
+import os
+import random
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+import pygame
+from systems.grass import GrassSystem
+from core.background_compositor import BackgroundCompositor, subtract_rect
+
+
+def _scalar_angle(grass, c, r):
+    """Referencia: fórmula por brizna de la implementación con dicts."""
+    x, y = grass.x[c, r], grass.y[c, r]
+    angle = grass.base_angle[c, r]
+    angle += math.sin(grass.time * grass.sway_speed[c, r] + x * 0.01) * 0.15
+    for wave in grass.waves:
+        dist = math.sqrt((x - wave['x'])**2 + (y - wave['y'])**2)
+        if dist < wave['radius']:
+            intensity = (1 - dist / wave['radius']) * wave['strength']
+            angle += math.sin(grass.time * 10 - dist * 0.2) * intensity * 0.5
+    return angle
+
+
+def test_update_matches_scalar_formula():
+    """Viento + ondas vectorizados coinciden con el cálculo brizna a brizna."""
+    rng = random.Random(4)
+    grass = GrassSystem(400, 300, seed=1, baked=False)
+    for _ in range(6):
+        grass.add_footstep_wave(rng.uniform(-20, 420), rng.uniform(-20, 320),
+                                radius=rng.choice([30, 60]))
+    grass.update(0.1)
+    grass.update(0.05)
+
+    nx, ny = grass.x.shape
+    for c in range(nx):
+        for r in range(ny):
+            assert abs(grass.angle[c, r] - _scalar_angle(grass, c, r)) < 1e-9
+
+
+def test_waves_expire():
+    """Las ondas decaen y desaparecen como antes."""
+    grass = GrassSystem(100, 100, seed=2, baked=False)
+    grass.add_footstep_wave(50, 50)
+    grass.update(0.3)
+    assert len(grass.waves) == 1
+    grass.update(0.3)
+    assert not grass.waves
+
+
+def test_baked_patch_tiles_and_wave_regions():
+    """El campo repite el parche y las ondas solo redibujan su zona."""
+    grass = GrassSystem(1400, 900, seed=3)
+    pc = grass.patch_size[0] // 8
+    pr = grass.patch_size[1] // 8
+    assert np.array_equal(grass.color_idx[pc:2 * pc, :pr], grass.color_idx[:pc, :pr])
+    assert np.allclose(grass.x[pc:2 * pc, :pr] - grass.patch_size[0], grass.x[:pc, :pr])
+
+    screen = pygame.Surface((1400, 900))
+    grass.update(0.01)
+    grass.draw(screen)
+    still = screen.copy()
+
+    grass.add_footstep_wave(700, 450)
+    grass.update(0.001)
+    grass.draw(screen)
+    diff = [(x, y) for x in range(0, 1400, 4) for y in range(0, 900, 4)
+            if screen.get_at((x, y)) != still.get_at((x, y))]
+    assert diff
+    assert all(abs(x - 700) < 110 and abs(y - 450) < 110 for x, y in diff)
+
+
+def test_occluded_grass_matches_full_draw():
+    """Con una capa opaca encima, el resultado visible no cambia."""
+    play_area = pygame.Rect(0, 50, 1400, 760)
+    assert subtract_rect([pygame.Rect(0, 0, 1400, 900)], play_area) == [
+        pygame.Rect(0, 0, 1400, 50), pygame.Rect(0, 810, 1400, 90)]
+
+    for baked in (True, False):
+        full = GrassSystem(1400, 900, seed=5, baked=baked)
+        culled = GrassSystem(1400, 900, seed=5, baked=baked)
+        compositor = BackgroundCompositor()
+        compositor.set_occluder('play_area', play_area)
+
+        expected = pygame.Surface((1400, 900))
+        result = pygame.Surface((1400, 900))
+        compositor.draw(result, culled)
+        for grass in (full, culled):
+            grass.add_footstep_wave(300, 40)
+            grass.add_footstep_wave(700, 450)
+            grass.update(0.05)
+        for surface in (expected, result):
+            surface.fill(full.background)
+        full.draw(expected)
+        compositor.draw(result, culled)
+        for surface in (expected, result):
+            surface.fill((30, 40, 35), play_area)
+
+        assert pygame.image.tobytes(expected, 'RGB') == pygame.image.tobytes(result, 'RGB')
+        stats = compositor.get_stats(culled)
+        assert stats['culled_pixels'] == play_area.width * play_area.height
+        assert 0 < stats['culled_blades'] < culled.blade_count
+        assert stats['culled_waves'] == 1
+
+
+if __name__ == '__main__':
+    test_update_matches_scalar_formula()
+    test_waves_expire()
+    test_baked_patch_tiles_and_wave_regions()
+    test_occluded_grass_matches_full_draw()
+    print("[DONE] Tests del pasto completados!")
@@ -0,0 +1,262 @@
+"""
+Tests del grid hexagonal
+========================
+Ejecutar: python dev_tools/test_grid.py  (o pytest)
+"""
+import os
+import random
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from config.constants import HEX_RADIUS, HEX_HEIGHT, SCREEN_WIDTH, SCREEN_HEIGHT
+from core.grid_manager import GridManager
+from core.unit_manager import UnitManager
+
+
+def _find_tile_brute(grid_manager, pos):
+    """Referencia: tile más cercano cuyo círculo de click contiene pos."""
+    best = None
+    best_dist = (HEX_RADIUS * 0.9) ** 2
+    for tile in grid_manager.grid.values():
+        dist = (pos[0] - tile.x) ** 2 + (pos[1] - tile.y) ** 2
+        if dist <= best_dist:
+            best_dist = dist
+            best = tile
+    return best
+
+
+def test_layout_centers():
+    """Cada tile está en el centro que indica el layout y viceversa."""
+    grid = GridManager()
+    for (col, row), tile in grid.grid.items():
+        assert grid.layout.center(col, row) == (tile.x, tile.y)
+        assert grid.layout.pixel_to_key(tile.x, tile.y) == (col, row)
+        assert grid.find_tile((tile.x, tile.y)) is tile
+
+
+def test_find_tile_matches_brute_force():
+    """find_tile O(1) coincide con el barrido completo (incluye bordes)."""
+    rng = random.Random(7)
+    for cols, rows in [(8, 6), (9, 5), (16, 12)]:
+        grid = GridManager(cols, rows)
+        xs = [t.x for t in grid.grid.values()]
+        ys = [t.y for t in grid.grid.values()]
+        for _ in range(3000):
+            pos = (rng.uniform(min(xs) - 60, max(xs) + 60),
+                   rng.uniform(min(ys) - 60, max(ys) + 60))
+            assert grid.find_tile(pos) is _find_tile_brute(grid, pos), pos
+
+
+def test_neighbor_table_matches_geometry():
+    """
+    La tabla de adyacencia coincide con la geometría en píxeles: vecinos
+    son exactamente los tiles a menos de ~1.2 filas de distancia, también
+    a través del hueco entre la zona enemiga (espejada) y la del jugador.
+    """
+    max_dist_sq = (HEX_HEIGHT * 1.2) ** 2
+    for cols, rows in [(8, 6), (9, 5)]:
+        grid = GridManager(cols, rows)
+        for tile in grid.tiles:
+            expected = {other.index for other in grid.tiles
+                        if other is not tile and
+                        (other.x - tile.x) ** 2 + (other.y - tile.y) ** 2 <= max_dist_sq}
+            table = {n.index for n in grid.get_neighbors(tile)}
+            assert table == expected, (tile.col, tile.row)
+            assert table == {n.index for n in tile.get_neighbors(grid.grid)}
+
+
+def test_visible_tiles():
+    """
+    get_visible_tiles devuelve en orden de Y todo lo que toca la pantalla,
+    y en mapas grandes no crece con el tamaño del mapa.
+    """
+    screen = (0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+    grid = GridManager()
+    visible = grid.get_visible_tiles(screen)
+    assert set(visible) == set(grid.tiles)
+    assert [t.y for t in visible] == sorted(t.y for t in visible)
+
+    big = GridManager(128, 64)
+    visible = big.get_visible_tiles(screen)
+    on_screen = {t for t in big.tiles
+                 if -HEX_RADIUS <= t.x <= SCREEN_WIDTH + HEX_RADIUS and
+                 -HEX_RADIUS <= t.y <= SCREEN_HEIGHT + HEX_RADIUS}
+    assert on_screen <= set(visible)
+    assert len(visible) < 2 * len(on_screen)
+    assert [t.y for t in visible] == sorted(t.y for t in visible)
+
+
+def _assert_index_consistent(grid):
+    """El índice de ocupación refleja exactamente tile.unit / tile.tower."""
+    for tile in grid.grid.values():
+        if tile.unit is not None:
+            assert grid.get_unit_tile(tile.unit) is tile
+        if tile.tower is not None:
+            assert grid.get_tower_tile(tile.tower) is tile
+    units = [t.unit for t in grid.grid.values() if t.unit is not None]
+    towers = [t.tower for t in grid.grid.values() if t.tower is not None]
+    assert len(grid._unit_tiles) == len(units)
+    assert len(grid._tower_tiles) == len(towers)
+
+
+def test_occupancy_index():
+    """move_unit y clear_dead_units mantienen el índice unidad -> tile."""
+    grid = GridManager()
+    units = UnitManager(grid)
+    units.setup_initial_units()
+    _assert_index_consistent(grid)
+
+    hero_tile = grid.get_unit_tile(units.hero)
+    target = next(n for n in grid.get_neighbors(hero_tile) if n.is_empty())
+    grid.move_unit(hero_tile, target)
+    assert hero_tile.unit is None
+    assert grid.get_unit_tile(units.hero) is target
+    _assert_index_consistent(grid)
+
+    victim = units.enemy_units[0]
+    victim.health = 0
+    grid.clear_dead_units()
+    assert grid.get_unit_tile(victim) is None
+    _assert_index_consistent(grid)
+
+
+def _assert_draw_order(grid):
+    """Mismas entradas que reconstruir y ordenar la lista (lo de antes)."""
+    items = grid.get_all_units_and_towers()
+    reference = [(u.visual_y if u.is_moving else t.y, u, t) for u, t in grid._unit_tiles.items()]
+    reference += [(t.y, tower, t) for tower, t in grid._tower_tiles.items()]
+    # A igual Y el orden no importa (no se solapan)
+    assert [y for y, _, _ in items] == sorted(y for y, _, _ in reference)
+    assert {id(obj) for _, obj, _ in items} == {id(obj) for _, obj, _ in reference}
+
+
+def test_draw_order_is_incremental():
+    """La lista de dibujado sigue ordenada sin reordenar cada frame."""
+    grid = GridManager()
+    units = UnitManager(grid)
+    units.setup_initial_units()
+    order = grid.draw_order
+    _assert_draw_order(grid)
+    # Sin cambios: la misma lista, nada que insertar
+    inserts = order.inserts
+    assert grid.get_all_units_and_towers() is grid.get_all_units_and_towers()
+    assert order.inserts == inserts
+
+    # En movimiento la unidad va según su Y visual; al llegar se inserta una vez
+    hero_tile = grid.get_unit_tile(units.hero)
+    target = max((n for n in grid.get_neighbors(hero_tile) if n.is_empty()), key=lambda t: t.y)
+    grid.move_unit(hero_tile, target)
+    while units.hero.is_moving:
+        _assert_draw_order(grid)
+        units.hero.update(1 / 60)
+    _assert_draw_order(grid)
+    assert order.inserts == inserts + 1
+
+    # Las muertas salen de la lista
+    victim = units.enemy_units[0]
+    victim.health = 0
+    grid.clear_dead_units()
+    assert all(obj is not victim for _, obj, _ in grid.get_all_units_and_towers())
+    assert len(order) == len(grid._unit_tiles) + len(grid._tower_tiles)
+    assert grid.get_tiles_sorted_by_y() is grid.get_tiles_sorted_by_y()
+
+
+def test_highlight_sets_are_incremental():
+    """Seleccionar/limpiar solo toca (y ensucia) los tiles que cambian."""
+    grid = GridManager()
+    units = UnitManager(grid)
+    units.setup_initial_units()
+    hero_tile = grid.get_unit_tile(units.hero)
+    grid.pop_dirty_tiles()
+
+    grid.set_selected(hero_tile)
+    grid.update_valid_moves(hero_tile)
+    expected = {n for n in grid.get_neighbors(hero_tile) if n.is_empty()}
+    assert grid.valid_move_tiles == expected
+    assert {t for t in grid.tiles if t.valid_move} == expected
+    assert grid.pop_dirty_tiles() == expected | {hero_tile}
+
+    # Repetir la misma selección no cambia nada
+    grid.update_valid_moves(hero_tile)
+    assert not grid.pop_dirty_tiles()
+
+    recommended = next(iter(expected))
+    grid.set_oracle_recommended(recommended)
+    assert grid.pop_dirty_tiles() == {recommended}
+
+    grid.clear_selections()
+    grid.set_oracle_recommended(None)
+    assert grid.pop_dirty_tiles() == expected | {hero_tile}
+    assert not any(t.selected or t.valid_move or t.oracle_recommended
+                   for t in grid.tiles)
+    assert not (grid.selected_tiles or grid.valid_move_tiles or grid.oracle_tiles)
+
+
+def test_hover_marks_only_changed_tiles():
+    """El hover ensucia el tile anterior y el nuevo, y nada si no cambia."""
+    grid = GridManager()
+    a, b = grid.grid[(2, 1)], grid.grid[(3, 1)]
+
+    grid.update_hover((a.x, a.y))
+    assert grid.hovered_tile is a and a.hovered
+    assert grid.pop_dirty_tiles() == {a}
+
+    grid.update_hover((a.x + 3, a.y - 2))
+    assert not grid.pop_dirty_tiles()
+
+    grid.update_hover((b.x, b.y))
+    assert b.hovered and not a.hovered
+    assert grid.pop_dirty_tiles() == {a, b}
+
+    grid.update_hover((-500, -500))
+    assert grid.hovered_tile is None and not b.hovered
+    assert grid.pop_dirty_tiles() == {b}
+
+
+def test_grid_layer_matches_full_redraw():
+    """Recomponer solo los tiles sucios deja la capa igual que redibujarla entera."""
+    from core.renderer import GameRenderer
+    pygame.font.init()
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    font = pygame.font.Font(None, 24)
+    renderer = GameRenderer(screen, font, font, font)
+
+    grid = GridManager()
+    units = UnitManager(grid)
+    units.setup_initial_units()
+    renderer.draw_grid(grid)
+    layer = renderer.grid_layer
+
+    rng = random.Random(9)
+    hero_tile = grid.get_unit_tile(units.hero)
+    for step in range(40):
+        tile = rng.choice(grid.tiles)
+        grid.update_hover((tile.x, tile.y))
+        if step % 5 == 0:
+            grid.clear_selections()
+            grid.set_selected(tile)
+            grid.update_valid_moves(hero_tile)
+            grid.set_oracle_recommended(rng.choice(grid.tiles))
+        renderer.draw_grid(grid)
+        assert layer.tiles_redrawn < len(grid.tiles)
+
+    incremental = pygame.image.tostring(layer.surface, "RGB")
+    layer.rebuild()
+    assert pygame.image.tostring(layer.surface, "RGB") == incremental
+
+
+if __name__ == '__main__':
+    test_layout_centers()
+    test_find_tile_matches_brute_force()
+    test_neighbor_table_matches_geometry()
+    test_visible_tiles()
+    test_occupancy_index()
+    test_draw_order_is_incremental()
+    test_highlight_sets_are_incremental()
+    test_hover_marks_only_changed_tiles()
+    test_grid_layer_matches_full_redraw()
+    print("[DONE] Tests del grid completados!")
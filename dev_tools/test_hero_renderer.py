@@ -0,0 +1,69 @@
+"""
+Tests del renderizado del héroe por capas
+=========================================
+Ejecutar: python dev_tools/test_hero_renderer.py  (o pytest)
+"""
+import os
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from entities.hero import HeroRenderer
+from systems.sprite_cache import SpriteCache
+
+
+def _frame(renderer, anim_time, selected=False):
+    screen = pygame.Surface((200, 200))
+    screen.fill((30, 40, 35))
+    renderer.draw(screen, 100, 110, scale=0.6, anim_time=anim_time, selected=selected)
+    return pygame.image.tobytes(screen, 'RGB')
+
+
+def _pair():
+    direct = HeroRenderer()
+    direct.sprite_cache = None
+    cached = HeroRenderer()
+    cached.sprite_cache = SpriteCache()
+    return direct, cached
+
+
+def test_layers_match_direct_drawing():
+    """Capas cacheadas + partes animadas = dibujado figura a figura."""
+    direct, cached = _pair()
+    for renderer in (direct, cached):
+        renderer.body_parts['halo'] = renderer.body_parts['wings'] = True
+    for anim_time in (0.0, 0.4, 1.7, 3.2):
+        assert _frame(direct, anim_time, selected=True) == _frame(cached, anim_time, selected=True)
+
+    stats = cached.sprite_cache.get_stats()
+    assert stats['misses'] == 3 and stats['hits'] == 9
+
+
+def test_palette_and_parts_invalidate_layers():
+    """Cambiar colores o partes re-renderiza; volver atrás reutiliza."""
+    direct, cached = _pair()
+    before = _frame(cached, 0.0)
+
+    for renderer in (direct, cached):
+        renderer.colors['metal'] = (90, 200, 90)
+    recolored = _frame(cached, 0.0)
+    assert recolored != before
+    assert recolored == _frame(direct, 0.0)
+
+    for renderer in (direct, cached):
+        renderer.body_parts['weapon_offhand'] = False
+    assert _frame(cached, 0.0) == _frame(direct, 0.0)
+
+    cached.colors['metal'] = (180, 180, 190)
+    cached.body_parts['weapon_offhand'] = True
+    misses = cached.sprite_cache.misses
+    assert _frame(cached, 0.0) == before
+    assert cached.sprite_cache.misses == misses
+
+
+if __name__ == '__main__':
+    test_layers_match_direct_drawing()
+    test_palette_and_parts_invalidate_layers()
+    print("[DONE] Tests del renderizado del héroe completados!")
@@ -0,0 +1,107 @@
+"""
+Tests de línea de visión
+========================
+Ejecutar: python dev_tools/test_line_of_sight.py  (o pytest)
+"""
+import random
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.grid_manager import GridManager
+from core.unit_manager import UnitManager
+from systems.line_of_sight import LineOfSight
+from systems.combat_dayr import TargetingSystem
+
+
+class _Dummy:
+    """Ocupante mínimo para marcar tiles."""
+
+
+def _key(tile):
+    return (tile.col, tile.row)
+
+
+def test_lines_are_contiguous():
+    """Cada línea tiene distancia+1 tiles y avanza de vecino en vecino."""
+    rng = random.Random(1)
+    grid = GridManager(10, 6)
+    los = LineOfSight(grid)
+    for _ in range(500):
+        a, b = rng.sample(grid.tiles, 2)
+        line = los.line(a, b)
+        assert line[0] is a and line[-1] is b
+        assert len(line) == grid.layout.distance(_key(a), _key(b)) + 1
+        for prev, nxt in zip(line, line[1:]):
+            assert nxt in grid.get_neighbors(prev)
+
+
+def test_blocking_by_units_and_towers():
+    """Torres y unidades intermedias bloquean; los extremos no."""
+    grid = GridManager()
+    los = LineOfSight(grid)
+    a, b = grid.grid[(0, 2)], grid.grid[(6, 2)]
+    grid.place_unit(a, _Dummy())
+    grid.place_unit(b, _Dummy())
+    assert los.has_line_of_sight(a, b)
+
+    middle = los.line(a, b)[2]
+    grid.place_tower(middle, _Dummy())
+    assert not los.has_line_of_sight(a, b)
+    grid.remove_tower(middle)
+    grid.place_unit(middle, _Dummy())
+    assert not los.has_line_of_sight(a, b)
+    grid.remove_unit(middle)
+    assert los.has_line_of_sight(a, b)
+
+
+def test_cache_invalidates_only_crossed_rays():
+    """Un cambio fuera del rayo conserva el resultado; dentro lo descarta."""
+    grid = GridManager()
+    los = LineOfSight(grid)
+    a, b = grid.grid[(0, 0)], grid.grid[(7, 4)]
+    line = los.line(a, b)
+
+    assert los.has_line_of_sight(a, b)
+    assert los.has_line_of_sight(a, b)
+    assert los.hits == 1 and los.misses == 1
+
+    off_ray = next(t for t in grid.tiles if t not in line)
+    grid.place_tower(off_ray, _Dummy())
+    assert los.has_line_of_sight(a, b)
+    assert los.hits == 2 and los.invalidations == 0
+
+    grid.place_tower(line[1], _Dummy())
+    assert not los.has_line_of_sight(a, b)
+    assert los.misses == 2 and los.invalidations == 1
+
+
+def test_targeting_uses_line_of_sight():
+    """TargetingSystem filtra objetivos tapados cuando se pide visión."""
+    grid = GridManager()
+    units = UnitManager(grid)
+    units.setup_initial_units()
+    los = LineOfSight(grid)
+    targeting = TargetingSystem(los)
+
+    hero = units.hero
+    enemies = units.enemy_units
+    visible = targeting.get_valid_targets(hero, enemies, "any",
+                                          require_line_of_sight=True)
+    expected = [e for e in enemies
+                if los.has_line_of_sight(grid.get_unit_tile(hero),
+                                         grid.get_unit_tile(e))]
+    assert visible == expected
+    assert len(visible) < len(enemies)
+
+    # Sin motor de visión no se filtra nada
+    assert TargetingSystem().get_valid_targets(
+        hero, enemies, "any", require_line_of_sight=True) == enemies
+
+
+if __name__ == '__main__':
+    test_lines_are_contiguous()
+    test_blocking_by_units_and_towers()
+    test_cache_invalidates_only_crossed_rays()
+    test_targeting_uses_line_of_sight()
+    print("[DONE] Tests de línea de visión completados!")
@@ -0,0 +1,96 @@
+"""
+Tests de los niveles de detalle
+===============================
+Ejecutar: python dev_tools/test_lod.py  (o pytest)
+"""
+import os
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from entities import Hero, UltraTower, UltraUnit
+from systems.lod import (LodSelector, LOD_FULL, LOD_SILHOUETTE, LOD_TOKEN,
+                         LOD_COUNT_THRESHOLDS, LOD_DEGRADE_FRAMES, LOD_RECOVER_FRAMES)
+
+
+def test_selector_count_scale_and_level():
+    """El nivel sale del número de figuras, la escala o un nivel fijo."""
+    lod = LodSelector(budget_ms=None)
+    assert lod.select(LOD_COUNT_THRESHOLDS[0] - 1) == LOD_FULL
+    assert lod.select(LOD_COUNT_THRESHOLDS[0]) == LOD_SILHOUETTE
+    assert lod.select(LOD_COUNT_THRESHOLDS[1]) == LOD_TOKEN
+    assert lod.select(10, scale=0.5) == LOD_SILHOUETTE
+    assert lod.select(10, scale=0.3) == LOD_TOKEN
+
+    levels = []
+    for _ in range(4):
+        lod.cycle_level()
+        levels.append(lod.level)
+    assert levels == [LOD_FULL, LOD_SILHOUETTE, LOD_TOKEN, None]
+    lod.level = LOD_FULL
+    assert lod.select(LOD_COUNT_THRESHOLDS[1]) == LOD_FULL
+
+
+def test_selector_frame_budget():
+    """Baja tras varios frames sobre el presupuesto y sube solo con holgura."""
+    lod = LodSelector(budget_ms=10)
+    for _ in range(LOD_DEGRADE_FRAMES - 1):
+        lod.report_frame(12)
+    lod.report_frame(8)   # dentro del presupuesto: se reinicia la cuenta
+    assert lod.select(10) == LOD_FULL
+    for _ in range(LOD_DEGRADE_FRAMES * 2):
+        lod.report_frame(12)
+    assert lod.select(10) == LOD_TOKEN
+    for _ in range(LOD_RECOVER_FRAMES):
+        lod.report_frame(8)   # sin holgura suficiente: no sube
+    assert lod.select(10) == LOD_TOKEN
+    for _ in range(LOD_RECOVER_FRAMES):
+        lod.report_frame(3)
+    assert lod.select(10) == LOD_SILHOUETTE
+    assert lod.changes == 2
+
+
+def test_tiers_stay_inside_draw_bounds():
+    """Cada nivel pinta dentro de DRAW_BOUNDS (modo dirty-rect) y es distinto."""
+    pygame.init()
+    hero = Hero()
+    unit = UltraUnit("ranger", "player")
+    figures = [(hero, {'selected': True}), (unit, {}), (UltraTower("enemy"), {})]
+    for figure, kwargs in figures:
+        dx, dy, w, h = figure.DRAW_BOUNDS
+        drawings = []
+        for lod in (LOD_FULL, LOD_SILHOUETTE, LOD_TOKEN):
+            surface = pygame.Surface((300, 300), pygame.SRCALPHA)
+            figure.draw(surface, 150, 150, lod=lod, **kwargs)
+            painted = surface.get_bounding_rect()
+            assert painted.width and pygame.Rect(150 + dx, 150 + dy, w, h).contains(painted)
+            drawings.append(pygame.image.tobytes(surface, 'RGBA'))
+        assert len(set(drawings)) == 3
+
+
+def test_renderer_degrades_large_battles():
+    """Con muchas figuras el renderer pasa solo a fichas."""
+    from config.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+    from core.grid_manager import GridManager
+    from core.renderer import GameRenderer
+
+    pygame.init()
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    font = pygame.font.Font(None, 24)
+    renderer = GameRenderer(screen, font, font, font, headless=True)
+    assert renderer.lod.budget_ms is None
+    grid = GridManager(24, 8)
+    for tile in grid.tiles[:LOD_COUNT_THRESHOLDS[1]]:
+        grid.place_unit(tile, UltraUnit("assault", tile.owner))
+    renderer.draw_units_and_towers(grid)
+    assert renderer.lod.tier == LOD_TOKEN
+
+
+if __name__ == '__main__':
+    test_selector_count_scale_and_level()
+    test_selector_frame_budget()
+    test_tiers_stay_inside_draw_bounds()
+    test_renderer_degrades_large_battles()
+    print("[DONE] tests de niveles de detalle OK")
@@ -0,0 +1,97 @@
+"""
+Tests del sistema de partículas (arrays NumPy)
+==============================================
+Ejecutar: python dev_tools/test_particles.py  (o pytest)
+"""
+import os
+import random
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from systems.particles import Particle, ParticleSystem
+
+
+def test_spawn_counts():
+    """Cada spawn_* añade las mismas partículas que la versión con objetos."""
+    particles = ParticleSystem()
+    particles.spawn_spark(0, 0, (255, 255, 255), 5)
+    assert len(particles) == 5 and particles.glow[:5].all()
+    particles.spawn_dust(0, 0)
+    assert len(particles) == 13 and not particles.glow[5:13].any()
+    particles.spawn_attack(0, 0, "player")
+    assert len(particles) == 13 + 12 + 8
+    particles.spawn_footstep(0, 0)
+    particles.spawn_magic_trail(0, 0, (100, 100, 255))
+    assert len(particles) == 33 + 3 + 1
+    assert tuple(particles.color[13]) == (255, 200, 50)
+    particles.clear()
+    assert len(particles) == 0
+
+
+def test_update_matches_particle():
+    """La integración vectorizada da lo mismo que Particle.update."""
+    random.seed(3)
+    particles = ParticleSystem()
+    particles.spawn_spark(100, 200, (255, 200, 50), 10)
+    reference = [Particle(100, 200, (255, 200, 50), (vx, vy), life, size)
+                 for vx, vy, life, size in zip(particles.vx.tolist(), particles.vy.tolist(),
+                                                particles.lifetime[:10].tolist(),
+                                                particles.size[:10].tolist())]
+    for _ in range(5):
+        particles.update(0.05)
+        for p in reference:
+            p.update(0.05)
+    alive = [p for p in reference if p.is_alive()]
+    assert len(particles) == len(alive) == 10
+    for i, p in enumerate(reference):
+        assert abs(particles.x[i] - p.x) < 1e-9 and abs(particles.y[i] - p.y) < 1e-9
+        assert abs(particles.lifetime[i] - p.lifetime) < 1e-9
+
+
+def test_swap_remove_keeps_live_particles():
+    """Al compactar quedan exactamente las vivas, con todos sus campos."""
+    particles = ParticleSystem(capacity=8)
+    lifetimes = [0.1, 1.0, 0.1, 2.0, 0.1, 0.1, 3.0, 0.1, 4.0, 0.1]
+    for i, life in enumerate(lifetimes):
+        particles._spawn(i, -i, (i, 0, 0), [i * 10], [0], life, [i], i % 2 == 0)
+    assert particles.capacity >= len(lifetimes)
+
+    particles.update(0.5)
+    survivors = {i for i, life in enumerate(lifetimes) if life > 0.5}
+    n = len(particles)
+    assert n == len(survivors)
+    for k in range(n):
+        i = int(particles.color[k][0])
+        assert i in survivors
+        survivors.discard(i)
+        assert particles.x[k] == i + i * 10 * 0.5 and particles.y[k] == -i
+        assert particles.size[k] == i and particles.glow[k] == (i % 2 == 0)
+        assert abs(particles.lifetime[k] - (lifetimes[i] - 0.5)) < 1e-9
+        assert particles.max_lifetime[k] == lifetimes[i]
+    assert not survivors
+
+    particles.update(10)
+    assert len(particles) == 0
+
+
+def test_draw_smoke():
+    """draw() pinta partículas con y sin glow sin fallar."""
+    pygame.init()
+    screen = pygame.Surface((200, 200))
+    particles = ParticleSystem()
+    particles.spawn_attack(100, 100, "enemy")
+    particles.spawn_dust(50, 50)
+    particles.update(0.1)
+    particles.draw(screen)
+    assert screen.get_at((100, 100))[:3] != (0, 0, 0)
+
+
+if __name__ == '__main__':
+    test_spawn_counts()
+    test_update_matches_particle()
+    test_swap_remove_keeps_live_particles()
+    test_draw_smoke()
+    print("[DONE] tests de partículas OK")
@@ -0,0 +1,174 @@
+"""
+Tests del servicio de pathfinding
+=================================
+Ejecutar: python dev_tools/test_pathfinding.py  (o pytest)
+"""
+import heapq
+import random
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.grid_manager import GridManager
+from systems.pathfinding import PathfindingService
+
+
+class _Dummy:
+    """Ocupante mínimo para marcar tiles."""
+
+
+def _dijkstra_cost(grid, start, goal, zones=None):
+    """Referencia: Dijkstra sin heurística ni caché."""
+    dist = {start: 0}
+    frontier = [(0, start.index, start)]
+    while frontier:
+        cost, _, tile = heapq.heappop(frontier)
+        if tile is goal:
+            return cost
+        if cost > dist[tile]:
+            continue
+        for n in grid.get_neighbors(tile):
+            if zones is not None and n.owner not in zones:
+                continue
+            if not n.is_empty() and n is not goal:
+                continue
+            new_cost = cost + 1 + n.movement_cost
+            if new_cost < dist.get(n, float('inf')):
+                dist[n] = new_cost
+                heapq.heappush(frontier, (new_cost, n.index, n))
+    return None
+
+
+def _assert_valid_path(grid, path, start, goal):
+    assert path[0] is start and path[-1] is goal
+    for a, b in zip(path, path[1:]):
+        assert b in grid.get_neighbors(a)
+
+
+def test_astar_matches_dijkstra():
+    """A* devuelve caminos válidos de coste óptimo con obstáculos y costes."""
+    rng = random.Random(3)
+    for cols, rows in [(8, 6), (12, 8)]:
+        grid = GridManager(cols, rows)
+        for tile in grid.tiles:
+            if rng.random() < 0.2:
+                grid.place_tower(tile, _Dummy())
+            elif rng.random() < 0.3:
+                grid.set_movement_cost(tile, rng.randint(1, 3))
+        pathfinder = PathfindingService(grid)
+
+        for _ in range(200):
+            start, goal = rng.sample(grid.tiles, 2)
+            zones = rng.choice([None, ("player",), ("enemy",)])
+            path = pathfinder.find_path(start, goal, zones=zones)
+            expected = _dijkstra_cost(grid, start, goal, zones)
+            if expected is None:
+                assert path is None
+                continue
+            _assert_valid_path(grid, path, start, goal)
+            assert pathfinder.path_cost(path) == expected
+            for tile in path[1:-1]:
+                assert tile.is_empty()
+                assert zones is None or tile.owner in zones
+
+
+def test_blocked_and_closest():
+    """Tiles bloqueados se evitan y closest llega lo más cerca posible."""
+    grid = GridManager()
+    pathfinder = PathfindingService(grid)
+    start = grid.grid[(0, -6)]
+    goal = grid.grid[(7, 5)]
+
+    # Sin salir de la zona enemiga el jugador es inalcanzable
+    assert pathfinder.find_path(start, goal, zones=("enemy",)) is None
+    path = pathfinder.find_path(start, goal, zones=("enemy",), closest=True)
+    assert path[-1].owner == "enemy"
+    assert grid.layout.distance((path[-1].col, path[-1].row), (7, 5)) == \
+        min(grid.layout.distance((t.col, t.row), (7, 5))
+            for t in grid.tiles if t.owner == "enemy")
+
+    free = pathfinder.find_path(start, goal)
+    wall = free[len(free) // 2]
+    detour = pathfinder.find_path(start, goal, blocked=[wall])
+    _assert_valid_path(grid, detour, start, goal)
+    assert wall not in detour
+
+
+def test_cache_invalidation_is_selective():
+    """Solo se recalculan las búsquedas que toca un cambio de ocupación."""
+    grid = GridManager()
+    pathfinder = PathfindingService(grid)
+    start = grid.grid[(0, 0)]
+    goal = grid.grid[(7, 5)]
+
+    path = pathfinder.find_path(start, goal)
+    assert pathfinder.find_path(start, goal) == path
+    assert pathfinder.hits == 1 and pathfinder.misses == 1
+
+    # Ocupar un tile fuera del camino no invalida
+    off_path = next(t for t in grid.tiles if t not in path)
+    grid.place_tower(off_path, _Dummy())
+    assert pathfinder.find_path(start, goal) == path
+    assert pathfinder.invalidations == 0
+
+    # Ocupar un tile del camino obliga a rodearlo
+    on_path = path[len(path) // 2]
+    grid.place_tower(on_path, _Dummy())
+    assert pathfinder.invalidations == 1
+    detour = pathfinder.find_path(start, goal)
+    assert on_path not in detour
+    _assert_valid_path(grid, detour, start, goal)
+
+    # Liberarlo invalida la búsqueda que lo encontró ocupado
+    grid.remove_tower(on_path)
+    assert pathfinder.find_path(start, goal) == path
+
+    # Un cambio de coste en un tile examinado también invalida
+    before = pathfinder.invalidations
+    grid.set_movement_cost(path[1], 5)
+    assert pathfinder.invalidations == before + 1
+    assert pathfinder.path_cost(pathfinder.find_path(start, goal)) == \
+        _dijkstra_cost(grid, start, goal)
+
+
+def test_flow_field_matches_nearest_source():
+    """El campo de flujo da la distancia al origen más cercano (torres bloquean)."""
+    rng = random.Random(5)
+    grid = GridManager(10, 6)
+    for tile in rng.sample(grid.tiles, 15):
+        grid.place_tower(tile, _Dummy())
+    for tile in rng.sample(grid.tiles, 20):
+        if tile.is_empty():
+            grid.set_movement_cost(tile, rng.randint(1, 2))
+    sources = [t for t in rng.sample(grid.tiles, 4) if t.is_empty()]
+    pathfinder = PathfindingService(grid)
+    field = pathfinder.get_flow_field(sources)
+
+    for tile in grid.tiles:
+        if tile.tower is not None:
+            continue
+        # Referencia: caminar del tile al origen (entrar en el origen cuesta 1)
+        best = float('inf')
+        for source in sources:
+            path = pathfinder.find_path(tile, source)
+            if path is not None:
+                cost = pathfinder.path_cost(path) - source.movement_cost
+                best = min(best, cost)
+        assert field.get_distance(tile) == best, (tile.col, tile.row)
+
+        for step, dist in field.ranked_steps(tile):
+            assert step.is_empty() and dist < field.get_distance(tile)
+
+    # Mismos orígenes -> se reutiliza; cambiar un coste -> se recalcula
+    assert pathfinder.get_flow_field(list(reversed(sources))) is field
+    grid.set_movement_cost(next(t for t in grid.tiles if t.is_empty()), 7)
+    assert pathfinder.get_flow_field(sources) is not field
+    assert pathfinder.flow_builds == 2
+
+
+if __name__ == '__main__':
+    test_astar_matches_dijkstra()
+    test_blocked_and_closest()
+    test_cache_invalidation_is_selective()
+    test_flow_field_matches_nearest_source()
+    print("[DONE] Tests de pathfinding completados!")
@@ -0,0 +1,111 @@
+"""
+Tests del profiler por etapas
+=============================
+Ejecutar: python dev_tools/test_profiler.py  (o pytest)
+"""
+import os
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from core.frame_profiler import FrameProfiler, PROFILER_OFF, PROFILER_FPS, PROFILER_FULL
+
+
+class _FakeClock:
+    """Reloj manual (segundos)."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _frame(profiler, clock, laps):
+    profiler.begin_frame()
+    for stage, ms in laps:
+        clock.now += ms / 1000
+        profiler.lap(stage)
+    profiler.end_frame()
+
+
+def test_laps_and_percentiles():
+    """Cada vuelta suma a su etapa; media y percentiles de la ventana."""
+    clock = _FakeClock()
+    profiler = FrameProfiler(PROFILER_FULL, window=100, clock=clock)
+    for i in range(100):
+        laps = [('fondo', 2), ('figuras', 1), ('fondo', 1)]
+        if i == 99:
+            laps.append(('flip', 10))
+        _frame(profiler, clock, laps)
+        clock.now += 0.005   # espera del reloj: fuera del frame
+
+    stats = profiler.get_stats()
+    assert abs(stats['fondo'][0] - 3) < 1e-6 and abs(stats['figuras'][0] - 1) < 1e-6
+    # Una etapa nueva cuenta como 0 ms en los frames anteriores
+    assert len(profiler.stages['flip']) == 100
+    flip_avg, flip_p95, flip_p99 = stats['flip']
+    assert abs(flip_avg - 0.1) < 1e-6 and flip_p95 == 0 and abs(flip_p99 - 10) < 1e-6
+    assert abs(stats['frame'][1] - 4) < 1e-6
+    # FPS según el intervalo entre frames (4 ms + 5 ms de espera)
+    assert abs(profiler.get_fps() - 1000 / 9) < 0.5
+
+
+def test_disabled_is_noop():
+    """Apagado no lee el reloj ni guarda nada, ni dibuja."""
+    reads = []
+    profiler = FrameProfiler(PROFILER_OFF, clock=lambda: reads.append(1) or 0.0)
+    for _ in range(10):
+        profiler.begin_frame()
+        profiler.lap('fondo')
+        profiler.end_frame()
+    assert not reads and not profiler.stages and not profiler.frame_ms
+    assert profiler.draw(pygame.Surface((400, 300))) is None
+
+
+def test_hud_modes():
+    """F3 recorre los modos; el HUD completo es más alto que el de FPS."""
+    pygame.init()
+    clock = _FakeClock()
+    profiler = FrameProfiler(PROFILER_FPS, clock=clock)
+    screen = pygame.Surface((800, 600))
+    for _ in range(5):
+        _frame(profiler, clock, [('fondo', 2), ('tablero', 3)])
+    small = profiler.draw(screen)
+    assert small.right == 790
+
+    profiler.cycle_mode()
+    assert profiler.mode == PROFILER_FULL
+    for _ in range(5):
+        _frame(profiler, clock, [('fondo', 2), ('tablero', 3)])
+    full = profiler.draw(screen)
+    assert full.height > small.height
+    profiler.cycle_mode()
+    assert profiler.mode == PROFILER_OFF and profiler.draw(screen) is None
+
+
+def test_game_stages():
+    """En una partida cada etapa de update y draw queda medida."""
+    from core.headless import HeadlessRunner
+    runner = HeadlessRunner(seed=0)
+    try:
+        profiler = runner.game.profiler
+        assert profiler.mode == PROFILER_OFF
+        profiler.mode = PROFILER_FULL
+        runner.run(5)
+    finally:
+        runner.close()
+    expected = {'turnos', 'unidades', 'animaciones', 'pasto', 'partículas', 'fondo',
+                'tablero', 'figuras', 'efectos', 'interfaz', 'hud', 'flip'}
+    assert expected <= set(profiler.stages)
+    assert len(profiler.frame_ms) == 5
+
+
+if __name__ == '__main__':
+    test_laps_and_percentiles()
+    test_disabled_is_noop()
+    test_hud_modes()
+    test_game_stages()
+    print("[DONE] tests del profiler OK")
@@ -0,0 +1,98 @@
+"""
+Tests de la caché de sprites
+============================
+Ejecutar: python dev_tools/test_sprite_cache.py  (o pytest)
+"""
+import os
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from systems.geometry import GeometricUnit, GeometricTower
+from systems.sprite_cache import SpriteCache
+
+UNIT_TYPES = ["berserker", "assault", "ranger", "sniper", "tank", "mage"]
+
+
+def _canvas():
+    return pygame.Surface((300, 300), pygame.SRCALPHA)
+
+
+def _same(a, b):
+    return pygame.image.tobytes(a, 'RGBA') == pygame.image.tobytes(b, 'RGBA')
+
+
+def _mismatch(a, b):
+    """Fracción de píxeles pintados que difieren entre dos superficies."""
+    painted = [(x, y) for x in range(a.get_width()) for y in range(a.get_height())
+               if a.get_at((x, y)).a or b.get_at((x, y)).a]
+    return sum(a.get_at(p) != b.get_at(p) for p in painted) / len(painted)
+
+
+def test_cached_figures_match_direct_drawing():
+    """El blit del sprite reproduce exactamente el dibujado directo."""
+    for owner in ("player", "enemy"):
+        for unit_type in UNIT_TYPES:
+            unit = GeometricUnit(unit_type, owner)
+            unit.sprite_cache = SpriteCache()
+            # Ciclos enormes: la fase 0 corresponde al instante 0
+            unit.ANIM_PERIODS = {unit_type: 1e15}
+            expected, result = _canvas(), _canvas()
+            unit._draw_figure(expected, 150, 160, 0.55, 0)
+            unit.draw(result, 150, 160, scale=0.55)
+            if unit_type == "mage":
+                # Los glows colocan sus superficies con int() de coordenadas
+                # fraccionarias: según el origen alguno cae a 1 px
+                assert _mismatch(expected, result) < 0.05
+            else:
+                assert _same(expected, result), unit_type
+            unit.draw(_canvas(), 150, 160, scale=0.55)
+            assert unit.sprite_cache.get_stats()['hits'] == 1
+
+        tower = GeometricTower(owner)
+        tower.sprite_cache = SpriteCache()
+        expected, result = _canvas(), _canvas()
+        tower._draw_figure(expected, 150, 150, 0.5, 0)
+        tower.draw(result, 150, 150, scale=0.5, anim_time=0)
+        assert _same(expected, result)
+
+
+def test_anim_phase_is_quantized():
+    """Instantes de la misma fase comparten sprite; otra fase crea otro."""
+    tower = GeometricTower("player")
+    tower.sprite_cache = cache = SpriteCache()
+    screen = _canvas()
+    tower.draw(screen, 150, 150, scale=0.5, anim_time=0.0)
+    tower.draw(screen, 150, 150, scale=0.5, anim_time=0.01)
+    assert cache.get_stats()['entries'] == 1
+    tower.draw(screen, 150, 150, scale=0.5, anim_time=1.0)
+    tower.draw(screen, 150, 150, scale=0.5, anim_time=1.0 + tower.ANIM_PERIOD)
+    assert cache.get_stats()['entries'] == 2
+    assert cache.get_stats()['hits'] == 2
+
+
+def test_lru_eviction_respects_memory_cap():
+    """Al superar el tope se descartan los sprites menos usados."""
+    cache = SpriteCache(max_bytes=3 * 21 * 21 * 4)
+
+    def render(surface, x, y):
+        pygame.draw.circle(surface, (255, 0, 0), (x, y), 10)
+
+    for key in "abc":
+        cache.get(key, render, 10)
+    cache.get("a", render, 10)
+    cache.get("d", render, 10)
+
+    stats = cache.get_stats()
+    assert stats['bytes'] <= cache.max_bytes
+    assert stats['evictions'] == 1
+    assert "b" not in cache._sprites and "a" in cache._sprites
+
+
+if __name__ == '__main__':
+    test_cached_figures_match_direct_drawing()
+    test_anim_phase_is_quantized()
+    test_lru_eviction_respects_memory_cap()
+    print("[DONE] Tests de la caché de sprites completados!")
@@ -0,0 +1,101 @@
+"""
+Tests del lote de sellos (partículas y proyectiles)
+===================================================
+Ejecutar: python dev_tools/test_stamp_batch.py  (o pytest)
+"""
+import os
+import random
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from entities.projectile import TracerProjectile
+from systems.glow_cache import glow_cache
+from systems.particles import ParticleSystem
+from systems.stamp_batch import StampBatch
+
+
+class _Target:
+    x, y = 5000, 5000
+
+    def is_alive(self):
+        return True
+
+
+def _pixels(surface):
+    return pygame.image.tobytes(surface, 'RGB')
+
+
+def _draw_particles_one_by_one(screen, particles):
+    """Dibujado anterior: un blit de glow y un draw.circle por partícula."""
+    for i in range(particles.count):
+        x, y = float(particles.x[i]), float(particles.y[i])
+        size = int(particles.size[i])
+        color = tuple(particles.color[i].tolist())
+        alpha = int(255 * (particles.lifetime[i] / particles.max_lifetime[i]))
+        if particles.glow[i]:
+            screen.blit(glow_cache.circle(size * 2, color, alpha // 2),
+                        (x - size * 2, y - size * 2))
+        pygame.draw.circle(screen, color, (int(x), int(y)), size)
+
+
+def test_add_circle_matches_draw_circle():
+    """Un sello copiado equivale a pygame.draw.circle en cualquier radio."""
+    for radius in range(0, 12):
+        expected = pygame.Surface((40, 40))
+        pygame.draw.circle(expected, (200, 100, 50), (20, 17), radius)
+        batched = pygame.Surface((40, 40))
+        batch = StampBatch()
+        batch.add_circle((200, 100, 50), 20, 17, radius)
+        batch.flush(batched)
+        assert _pixels(batched) == _pixels(expected)
+
+
+def test_particles_match_individual_draws():
+    """El lote de partículas da los mismos píxeles que dibujar una a una."""
+    pygame.init()
+    random.seed(5)
+    particles = ParticleSystem()
+    for i in range(6):
+        particles.spawn_attack(50 + i * 37.3, 80 + i * 11.7, "player" if i % 2 else "enemy")
+        particles.spawn_dust(120 + i * 13.1, 60 + i * 21.9)
+    particles.update(0.13)
+
+    expected = pygame.Surface((320, 240))
+    _draw_particles_one_by_one(expected, particles)
+    batched = pygame.Surface((320, 240))
+    batch = StampBatch()
+    particles.collect(batch)
+    glows = int(particles.glow[:particles.count].sum())
+    assert len(batch) == particles.count + glows
+    batch.flush(batched)
+    assert len(batch) == 0 and batch.last_count == particles.count + glows
+    assert _pixels(batched) == _pixels(expected)
+
+
+def test_projectile_matches_individual_draws():
+    """Estela, cabeza y glow del proyectil salen iguales que antes."""
+    particles = ParticleSystem()
+    proj = TracerProjectile(100.6, 90.2, _Target(), 10, (150, 255, 150), "player", particles)
+    proj.trail = [(proj.x - i * 5.5, proj.y - i * 3.3) for i in range(proj.max_trail)]
+
+    expected = pygame.Surface((200, 200))
+    for i, (tx, ty) in enumerate(proj.trail):
+        size = proj.radius * (i / len(proj.trail))
+        if size > 0:
+            pygame.draw.circle(expected, proj.color, (int(tx), int(ty)), int(size))
+    pygame.draw.circle(expected, (255, 255, 255), (int(proj.x), int(proj.y)), proj.radius)
+    expected.blit(glow_cache.circle(10, proj.color, 150), (int(proj.x) - 10, int(proj.y) - 10))
+
+    batched = pygame.Surface((200, 200))
+    proj.draw(batched)
+    assert _pixels(batched) == _pixels(expected)
+
+
+if __name__ == '__main__':
+    test_add_circle_matches_draw_circle()
+    test_particles_match_individual_draws()
+    test_projectile_matches_individual_draws()
+    print("[DONE] tests del lote de sellos OK")
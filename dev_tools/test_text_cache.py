@@ -0,0 +1,92 @@
+"""
+Tests de la caché de textos
+===========================
+Ejecutar: python dev_tools/test_text_cache.py  (o pytest)
+"""
+import os
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+pygame.font.init()
+
+from core.grid_manager import GridManager
+from core.renderer import GameRenderer
+from core.unit_manager import UnitManager
+from systems.alternating_turn_system import AlternatingTurnSystem
+from systems.text_cache import TextCache, get_font, text_cache
+from ui import OracleOfKimi, PersistentMenu
+
+
+def _legacy_fit(font, text, max_width):
+    """Bucle de truncado anterior de StyledButton.draw (con render)."""
+    display_text = text
+    if font.render(display_text, True, (255, 255, 255)).get_width() > max_width:
+        while len(display_text) > 3 and font.render(display_text + "...", True,
+                                                    (255, 255, 255)).get_width() > max_width:
+            display_text = display_text[:-1]
+        display_text = display_text + "..."
+    return display_text
+
+
+def test_render_is_cached_and_identical():
+    """Misma superficie para la misma clave e idéntica a font.render."""
+    cache = TextCache(max_entries=2)
+    font = pygame.font.Font(None, 22)
+    surface = cache.render(font, "Aliados: 6", (100, 255, 100))
+    expected = font.render("Aliados: 6", True, (100, 255, 100))
+    assert pygame.image.tobytes(surface, 'RGBA') == pygame.image.tobytes(expected, 'RGBA')
+    assert cache.render(font, "Aliados: 6", (100, 255, 100)) is surface
+
+    cache.render(font, "Aliados: 5", (100, 255, 100))
+    cache.render(font, "Enemigos: 6", (255, 100, 100))
+    stats = cache.get_stats()
+    assert stats['hits'] == 1 and stats['misses'] == 3 and stats['evictions'] == 1
+
+    assert get_font("arial", 14, bold=True) is get_font("arial", 14, bold=True)
+
+
+def test_fit_matches_legacy_truncation():
+    """El recorte medido con font.size da el mismo texto que el bucle anterior."""
+    cache = TextCache()
+    font = pygame.font.Font(None, 22)
+    for text in ("Mover", "Golpe Fuerte (4 AP)", "Terminar Turno con un texto largo"):
+        for width in (10, 40, 80, 120, 400):
+            assert cache.fit(font, text, width) == _legacy_fit(font, text, width)
+
+
+def test_steady_state_hud_does_not_rasterize():
+    """Un segundo frame del HUD igual que el anterior no renderiza texto."""
+    grid = GridManager()
+    units = UnitManager(grid)
+    units.setup_initial_units()
+    turns = AlternatingTurnSystem()
+    turns.setup(units.hero, units.get_troops_only(), units.enemy_units)
+
+    screen = pygame.Surface((1400, 900))
+    renderer = GameRenderer(screen, pygame.font.Font(None, 52),
+                            pygame.font.Font(None, 28), pygame.font.Font(None, 22))
+    oracle = OracleOfKimi()
+    oracle.advice = "¡Mueve a la casilla DORADA!"
+    menu = PersistentMenu(20, 100, 160)
+    menu.add_button("Golpe Fuerte (4 AP) con texto largo", None)
+    hero_tile = grid.get_unit_tile(units.hero)
+    grid.set_oracle_recommended(hero_tile)
+
+    def frame():
+        hero_tile.draw(screen)
+        renderer.draw_ui(turns, units, hero_tile, oracle, menu)
+
+    frame()
+    misses = text_cache.misses
+    frame()
+    assert text_cache.misses == misses
+
+
+if __name__ == '__main__':
+    test_render_is_cached_and_identical()
+    test_fit_matches_legacy_truncation()
+    test_steady_state_hud_does_not_rasterize()
+    print("[DONE] Tests de la caché de textos completados!")
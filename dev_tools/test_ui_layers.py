@@ -0,0 +1,108 @@
+"""
+Tests de las capas retenidas de la interfaz
+===========================================
+Ejecutar: python dev_tools/test_ui_layers.py  (o pytest)
+"""
+import os
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from config.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from core.grid_manager import GridManager
+from core.renderer import GameRenderer
+from core.unit_manager import UnitManager
+from systems.alternating_turn_system import AlternatingTurnSystem
+from ui import OracleOfKimi, PersistentMenu, RetainedLayer, StyledButton
+
+
+def _hud():
+    pygame.init()
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    font = pygame.font.Font(None, 24)
+    renderer = GameRenderer(screen, pygame.font.Font(None, 52), font, font)
+    grid = GridManager()
+    units = UnitManager(grid)
+    units.setup_initial_units()
+    turns = AlternatingTurnSystem()
+    turns.setup(units.hero, units.get_troops_only(), units.enemy_units)
+    menu = PersistentMenu(20, 110, 150)
+    menu.add_button("Mover", None)
+    menu.add_button("Terminar Turno", None)
+    return renderer, units, turns, menu
+
+
+def test_layer_renders_on_key_change():
+    """Solo se recompone cuando cambia la clave."""
+    layer = RetainedLayer()
+    calls = []
+
+    def render():
+        calls.append(1)
+        return pygame.Surface((4, 4))
+    first = layer.get(('ronda', 1), render)
+    assert layer.get(('ronda', 1), render) is first and len(calls) == 1
+    layer.get(('ronda', 2), render)
+    layer.invalidate()
+    layer.get(('ronda', 2), render)
+    assert len(calls) == 3 and layer.get_stats() == {'hits': 1, 'renders': 3}
+
+
+def test_top_panel_and_menu_are_retained():
+    """Frames sin cambios no recomponen; AP, recuentos y hover sí."""
+    renderer, units, turns, menu = _hud()
+    oracle = OracleOfKimi()
+
+    def frame():
+        renderer.draw_ui(turns, units, None, oracle, menu)
+    for _ in range(5):
+        frame()
+        menu.update((0, 0), 1 / 60)
+    assert renderer.top_panel.renders == 1 and menu.layer.renders == 1
+
+    units.hero.action_points.spend(2)
+    frame()
+    units.enemy_units[0].health = 0
+    frame()
+    assert renderer.top_panel.renders == 3
+
+    # El hover anima el botón unos frames y luego se estabiliza
+    button = menu.buttons[0]
+    for _ in range(120):
+        menu.update(button.rect.center, 1 / 60)
+        frame()
+    assert button.visual_state()[3]
+    animated = menu.layer.renders
+    assert 2 < animated < 120
+    for _ in range(10):
+        menu.update(button.rect.center, 1 / 60)
+        frame()
+    assert menu.layer.renders == animated
+
+
+def test_button_draw_in_layer_matches_screen():
+    """Un botón dibujado en una capa sale igual que en pantalla."""
+    pygame.init()
+    font = pygame.font.Font(None, 24)
+    button = StyledButton(40, 30, 120, 38, "Atacar")
+    button.hover_anim = button.press_anim = 0.5
+
+    screen = pygame.Surface((200, 100))
+    button.draw(screen, font)
+
+    layer = pygame.Surface((200, 100), pygame.SRCALPHA)
+    button.draw(layer, font, (-10, -5))
+    composed = pygame.Surface((200, 100))
+    composed.blit(layer, (-10, -5))
+    rect = button.rect.inflate(12, 12)
+    assert (pygame.image.tobytes(screen.subsurface(rect), 'RGB')
+            == pygame.image.tobytes(composed.subsurface(rect), 'RGB'))
+
+
+if __name__ == '__main__':
+    test_layer_renders_on_key_change()
+    test_top_panel_and_menu_are_retained()
+    test_button_draw_in_layer_matches_screen()
+    print("[DONE] tests de capas retenidas OK")
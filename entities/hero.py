@@ -13,6 +13,9 @@ import pygame
 import math
 import random
 from systems.combat_dayr import ActionPointsSystem
+from systems.sprite_cache import sprite_cache
+from systems.glow_cache import glow_cache
+from systems.lod import LOD_FULL, LOD_SILHOUETTE, silhouette_render, draw_token, draw_bar
 
 
 class HeroPowers:
@@ -118,8 +121,20 @@ class HeroRenderer:
     """
     Renderizador geométrico avanzado para el héroe.
     Incluye 25+ figuras geométricas combinables.
+
+    Las figuras estáticas se agrupan en capas (fondo, cuerpo, frente) que
+    se guardan como sprites en la caché compartida con clave paleta +
+    partes activas + escala: cambiar self.colors o self.body_parts genera
+    otra clave, así que la caché se invalida sola. Cada frame solo se
+    dibujan las partes animadas (halo, brillos, núcleo, runas, aura y
+    selección) entre esas capas, respetando el orden original.
     """
     
+    # Capas pre-renderizadas (None = dibujar figura a figura)
+    sprite_cache = sprite_cache
+    # Distancia máxima (px a escala 1) a la que pinta una capa estática
+    LAYER_EXTENT = 60
+    
     def __init__(self):
         self.animation_time = 0
         self.breathing_offset = 0
@@ -162,70 +177,112 @@ class HeroRenderer:
         
         base_x, base_y = int(x), int(y + self.breathing_offset)
         s = scale
+        parts = self.body_parts
         
-        # 1. SOMBRA (Elipse)
-        if self.body_parts['particles']:
-            self._draw_shadow(screen, base_x, base_y + 35 * s, 25 * s, 10 * s)
-        
-        # 2. CAPA (Polígono triangular curvo)
-        if self.body_parts['cape']:
-            self._draw_cape(screen, base_x, base_y, s)
+        # 1-2. SOMBRA y CAPA
+        self._draw_layer(screen, 'back', self._draw_back_layer, base_x, base_y, s)
         
         # 3. HALO/AURA (Círculos concéntricos)
-        if self.body_parts['halo']:
+        if parts['halo']:
             self._draw_halo(screen, base_x, base_y - 45 * s, 30 * s)
         
-        # 4. ALAS (Curvas de Bézier simuladas con polígonos)
-        if self.body_parts['wings']:
-            self._draw_wings(screen, base_x, base_y - 20 * s, s)
-        
-        # 5. NÚCLEO - Hexágono principal
-        if self.body_parts['core']:
-            self._draw_hexagon_filled(
-                screen, base_x, base_y, 20 * s,
-                self.colors['primary'], self.colors['dark']
-            )
-        
-        # 6. ARMADURA DE PECHO (Rectángulos redondeados + Triángulos)
-        if self.body_parts['armor_chest']:
-            self._draw_chest_armor(screen, base_x, base_y - 5 * s, s)
-        
-        # 7. HOMBRERAS (Círculos + Rectángulos)
-        if self.body_parts['armor_shoulders']:
-            self._draw_shoulders(screen, base_x, base_y - 15 * s, s)
-        
-        # 8. CASCO (Forma compleja: Hexágono + Círculo + Rectángulos)
-        if self.body_parts['helmet']:
-            self._draw_helmet(screen, base_x, base_y - 25 * s, s)
-        
-        # 9. VISOR (Elipse + Líneas)
-        if self.body_parts['visor']:
-            self._draw_visor(screen, base_x, base_y - 28 * s, s)
+        # 4-9. ALAS, NÚCLEO, ARMADURA, HOMBRERAS, CASCO y VISOR
+        self._draw_layer(screen, 'body', self._draw_body_layer, base_x, base_y, s)
+        if parts['visor']:
+            self._draw_visor_glow(screen, base_x, base_y - 28 * s, s)
         
         # 10. NÚCLEO DE ENERGÍA (Círculo brillante + Glow)
-        if self.body_parts['energy_core']:
+        if parts['energy_core']:
             self._draw_energy_core(screen, base_x, base_y, 8 * s)
         
-        # 11. ARMA PRINCIPAL (Rectángulos + Círculos + Triángulos)
-        if self.body_parts['weapon_main']:
-            self._draw_main_weapon(screen, base_x + 25 * s, base_y - 10 * s, s)
-        
-        # 12. ESCUDO/ARMA SECUNDARIA (Forma de escudo geométrica)
-        if self.body_parts['weapon_offhand']:
-            self._draw_offhand(screen, base_x - 25 * s, base_y - 5 * s, s)
+        # 11-12. ARMA PRINCIPAL y ESCUDO
+        self._draw_layer(screen, 'front', self._draw_front_layer, base_x, base_y, s)
+        if parts['weapon_main']:
+            self._draw_blade_shine(screen, base_x + 25 * s, base_y - 10 * s, s)
         
         # 13. RUNAS FLOTANTES (Pequeños polígonos orbitando)
-        if self.body_parts['runes']:
+        if parts['runes']:
             self._draw_runes(screen, base_x, base_y - 35 * s, 35 * s, anim_time)
         
         # 14. PARTÍCULAS DE AURA (Círculos pequeños flotantes)
-        if self.body_parts['particles']:
+        if parts['particles']:
             self._draw_aura_particles(screen, base_x, base_y, s, anim_time)
         
         # 15. SELECCIÓN (Brillo exterior si está seleccionado)
         if selected:
             self._draw_selection_glow(screen, base_x, base_y, 45 * s)
     
+    def draw_silhouette(self, screen, x, y, scale=1.0, selected=False):
+        """Nivel de detalle medio: silueta plana de las capas estáticas."""
+        cache = self.sprite_cache
+        if cache is None:
+            self.draw_token(screen, x, y, scale)
+            return
+        key = ('hero-silhouette', tuple(self.colors.items()),
+               tuple(self.body_parts.items()), scale)
+        
+        def render(surface, cx, cy):
+            self._draw_back_layer(surface, cx, cy, scale)
+            self._draw_body_layer(surface, cx, cy, scale)
+            self._draw_front_layer(surface, cx, cy, scale)
+        cache.draw(screen, key,
+                   silhouette_render(render, self.colors['primary'], self.colors['secondary']),
+                   self.LAYER_EXTENT * scale, x, y)
+        if selected:
+            self._draw_selection_glow(screen, int(x), int(y), 45 * scale)
+    
+    def draw_token(self, screen, x, y, scale=1.0):
+        """Nivel de detalle mínimo: ficha con los colores del héroe."""
+        draw_token(screen, int(x), int(y), int(26 * scale),
+                   self.colors['primary'], self.colors['secondary'])
+    
+    # === CAPAS ESTÁTICAS ===
+    
+    def _draw_layer(self, screen, name, draw_layer, x, y, s):
+        """Dibuja una capa estática desde la caché (o figura a figura)."""
+        cache = self.sprite_cache
+        if cache is None:
+            draw_layer(screen, x, y, s)
+            return
+        key = ('hero', name, tuple(self.colors.items()),
+               tuple(self.body_parts.items()), s)
+        cache.draw(screen, key,
+                   lambda surface, cx, cy: draw_layer(surface, cx, cy, s),
+                   self.LAYER_EXTENT * s, x, y)
+    
+    def _draw_back_layer(self, screen, x, y, s):
+        """Sombra y capa."""
+        if self.body_parts['particles']:
+            self._draw_shadow(screen, x, y + 35 * s, 25 * s, 10 * s)
+        if self.body_parts['cape']:
+            self._draw_cape(screen, x, y, s)
+    
+    def _draw_body_layer(self, screen, x, y, s):
+        """Alas, núcleo hexagonal, armadura, hombreras, casco y visor."""
+        parts = self.body_parts
+        if parts['wings']:
+            self._draw_wings(screen, x, y - 20 * s, s)
+        if parts['core']:
+            self._draw_hexagon_filled(
+                screen, x, y, 20 * s,
+                self.colors['primary'], self.colors['dark']
+            )
+        if parts['armor_chest']:
+            self._draw_chest_armor(screen, x, y - 5 * s, s)
+        if parts['armor_shoulders']:
+            self._draw_shoulders(screen, x, y - 15 * s, s)
+        if parts['helmet']:
+            self._draw_helmet(screen, x, y - 25 * s, s)
+        if parts['visor']:
+            self._draw_visor(screen, x, y - 28 * s, s)
+    
+    def _draw_front_layer(self, screen, x, y, s):
+        """Arma principal y escudo."""
+        if self.body_parts['weapon_main']:
+            self._draw_main_weapon(screen, x + 25 * s, y - 10 * s, s)
+        if self.body_parts['weapon_offhand']:
+            self._draw_offhand(screen, x - 25 * s, y - 5 * s, s)
+    
     # === MÉTODOS DE DIBUJO DE FIGURAS ===
     
     def _draw_shadow(self, screen, x, y, w, h):
@@ -334,8 +391,9 @@ class HeroRenderer:
         rect = pygame.Rect(x - 10 * s, y - 3 * s, 20 * s, 8 * s)
         pygame.draw.ellipse(screen, (20, 30, 50), rect)
         pygame.draw.ellipse(screen, (100, 150, 255), rect, 1)
-        
-        # Brillo del visor
+    
+    def _draw_visor_glow(self, screen, x, y, s):
+        """Figura 9b: Brillo animado del visor."""
         glow_x = x + 3 * s * math.sin(self.animation_time * 2)
         pygame.draw.ellipse(screen, (150, 200, 255), 
                            (glow_x - 3 * s, y - 1 * s, 6 * s, 3 * s))
@@ -370,8 +428,9 @@ class HeroRenderer:
         ]
         pygame.draw.polygon(screen, (220, 220, 230), blade_points)
         pygame.draw.polygon(screen, (150, 150, 160), blade_points, 2)
-        
-        # Brillo de la hoja
+    
+    def _draw_blade_shine(self, screen, x, y, s):
+        """Figura 11b: Brillo animado de la hoja."""
         shine_y = y - 20 * s + 5 * s * math.sin(self.animation_time * 3)
         pygame.draw.line(screen, (255, 255, 255), 
                         (x - 2 * s, shine_y), (x - 2 * s, shine_y - 8 * s), 2)
@@ -423,9 +482,9 @@ class HeroRenderer:
             size = 2 + math.sin(anim_time * 4 + i) * 1
             alpha = int(100 + 50 * math.sin(anim_time * 3 + i))
             
-            particle_surf = pygame.Surface((int(size*4), int(size*4)), pygame.SRCALPHA)
-            pygame.draw.circle(particle_surf, (100, 200, 255, alpha), 
-                            (int(size*2), int(size*2)), int(size))
+            particle_surf = glow_cache.circle(int(size), (100, 200, 255), alpha,
+                                              size=int(size*4),
+                                              center=(int(size*2), int(size*2)))
             screen.blit(particle_surf, (int(px - size*2), int(py - size*2)))
     
     def _draw_selection_glow(self, screen, x, y, r):
@@ -442,6 +501,10 @@ class Hero:
     Única unidad que consume Puntos de Acción.
     """
     
+    # Caja (dx, dy, ancho, alto) que pinta draw() respecto a x, y: figura
+    # con glow de selección, barras, indicador y rebote (modo dirty-rect)
+    DRAW_BOUNDS = (-44, -76, 88, 124)
+    
     def __init__(self, name="Comandante"):
         self.name = name
         self.unit_type = "hero"
@@ -631,19 +694,35 @@ class Hero:
         from config.constants import HEX_WIDTH
         return self.range * HEX_WIDTH * 0.9
     
-    def draw(self, screen, x, y, selected=False):
-        """Dibuja el héroe con renderizado geométrico avanzado."""
+    def draw(self, screen, x, y, selected=False, lod=LOD_FULL):
+        """
+        Dibuja el héroe con renderizado geométrico avanzado.
+        
+        Args:
+            lod: nivel de detalle (systems.lod)
+        """
         base_x = int(self.visual_x if self.is_moving else x)
         base_y = int(self.visual_y + self.bounce_offset if self.is_moving else y + self.bounce_offset)
         
-        self.renderer.draw(screen, base_x, base_y, scale=0.6, 
-                          anim_time=self.animation_time, selected=selected)
-        
-        # Barra de vida
-        self._draw_health_bar(screen, base_x, base_y - 45)
-        
-        # Indicador de AP (solo para héroe)
-        self._draw_ap_bar(screen, base_x, base_y - 55)
+        if lod == LOD_FULL:
+            self.renderer.draw(screen, base_x, base_y, scale=0.6, 
+                              anim_time=self.animation_time, selected=selected)
+            
+            # Barra de vida
+            self._draw_health_bar(screen, base_x, base_y - 45)
+            
+            # Indicador de AP (solo para héroe)
+            self._draw_ap_bar(screen, base_x, base_y - 55)
+        else:
+            if lod == LOD_SILHOUETTE:
+                self.renderer.draw_silhouette(screen, base_x, base_y, scale=0.6, selected=selected)
+            else:
+                self.renderer.draw_token(screen, base_x, base_y - 15, scale=0.6)
+            ap = self.action_points
+            draw_bar(screen, base_x, base_y - 45, 35, 5, self.health / self.max_health,
+                     (50, 0, 0), (0, 255, 0))
+            draw_bar(screen, base_x, base_y - 55, 25, 3, ap.current / ap.maximum,
+                     (50, 50, 0), (255, 215, 0))
         
         # Indicador de unidad activa
         if self.can_act():
@@ -3,6 +3,7 @@ Proyectiles del juego
 """
 import pygame
 import random
+from systems.stamp_batch import StampBatch
 
 
 class TracerProjectile:
@@ -70,16 +71,30 @@ class TracerProjectile:
             self.active = False
     
     def draw(self, screen):
+        batch = StampBatch()
+        self.collect(batch)
+        batch.flush(screen)
+    
+    def get_rect(self):
+        """Zona que pinta draw() (None si no pinta nada)."""
+        if not self.active or len(self.trail) < 2:
+            return None
+        xs = [tx for tx, _ in self.trail] + [self.x]
+        ys = [ty for _, ty in self.trail] + [self.y]
+        left, top = int(min(xs)) - 11, int(min(ys)) - 11
+        return pygame.Rect(left, top, int(max(xs)) + 12 - left, int(max(ys)) + 12 - top)
+    
+    def collect(self, batch):
+        """Añade la estela, la cabeza y el glow a un StampBatch."""
         if not self.active or len(self.trail) < 2:
             return
         
         for i, (tx, ty) in enumerate(self.trail):
             size = self.radius * (i / len(self.trail))
             if size > 0:
-                pygame.draw.circle(screen, self.color, (int(tx), int(ty)), int(size))
+                batch.add_circle(self.color, int(tx), int(ty), int(size))
         
-        pygame.draw.circle(screen, (255, 255, 255), (int(self.x), int(self.y)), self.radius)
+        batch.add_circle((255, 255, 255), int(self.x), int(self.y), self.radius)
         
-        glow_surf = pygame.Surface((20, 20), pygame.SRCALPHA)
-        pygame.draw.circle(glow_surf, (*self.color[:3], 150), (10, 10), 10)
-        screen.blit(glow_surf, (int(self.x) - 10, int(self.y) - 10))
+        glow_surf = batch.stamp(10, self.color, 150)
+        batch.add(glow_surf, (int(self.x) - 10, int(self.y) - 10))
@@ -4,11 +4,15 @@ Torres del juego
 import pygame
 import math
 from systems.geometry import GeometricTower
+from systems.lod import LOD_FULL, LOD_SILHOUETTE
 
 
 class UltraTower:
     """Torre defensiva"""
     
+    # Caja (dx, dy, ancho, alto) que pinta draw() respecto a x, y
+    DRAW_BOUNDS = (-36, -32, 72, 56)
+    
     def __init__(self, owner):
         self.owner = owner
         self.max_health = 600
@@ -61,8 +65,17 @@ class UltraTower:
         from config.constants import HEX_WIDTH
         return self.range * HEX_WIDTH * 0.9
     
-    def draw(self, screen, x, y):
+    def draw(self, screen, x, y, lod=LOD_FULL):
+        """
+        Args:
+            lod: nivel de detalle (systems.lod)
+        """
         self.set_position(x, y)
         
         # Usar el renderer geométrico detallado con escala 0.5 para que quepa en el hex
-        self._geo_renderer.draw(screen, x, y, scale=0.5, anim_time=self._anim_time)
+        if lod == LOD_FULL:
+            self._geo_renderer.draw(screen, x, y, scale=0.5, anim_time=self._anim_time)
+        elif lod == LOD_SILHOUETTE:
+            self._geo_renderer.draw_silhouette(screen, x, y, scale=0.5)
+        else:
+            self._geo_renderer.draw_token(screen, x, y - 4, scale=0.5)
@@ -5,11 +5,16 @@ import pygame
 import random
 import math
 from systems.geometry import GeometricUnit
+from systems.lod import LOD_FULL, LOD_SILHOUETTE, draw_bar
 
 
 class UltraUnit:
     """Unidad del juego con sistema visual avanzado"""
     
+    # Caja (dx, dy, ancho, alto) que pinta draw() respecto a x, y: figura,
+    # barra de vida, indicador y rebote (modo dirty-rect)
+    DRAW_BOUNDS = (-32, -56, 64, 80)
+    
     def __init__(self, unit_type, owner, name=""):
         self.unit_type = unit_type
         self.owner = owner
@@ -125,7 +130,11 @@ class UltraUnit:
         from config.constants import HEX_WIDTH
         return self.range * HEX_WIDTH * 0.9
     
-    def draw(self, screen, x, y):
+    def draw(self, screen, x, y, lod=LOD_FULL):
+        """
+        Args:
+            lod: nivel de detalle (systems.lod)
+        """
         # Usar siempre las coordenadas pasadas, actualizando la posición visual
         if self.visual_x == 0:
             self.set_position(x, y)
@@ -139,15 +148,24 @@ class UltraUnit:
         base_y = int(self.visual_y + self.bounce_offset)
         
         # Usar el renderer geométrico detallado con escala 0.55 para que quepa en el hex
-        self._geo_renderer.draw(screen, base_x, base_y, scale=0.55, anim_time=self.animation_time)
-        
-        # Barra de vida
-        self._draw_health_bar_ultra(screen, base_x, base_y - 30)
+        if lod == LOD_FULL:
+            self._geo_renderer.draw(screen, base_x, base_y, scale=0.55, anim_time=self.animation_time)
+            
+            # Barra de vida
+            self._draw_health_bar_ultra(screen, base_x, base_y - 30)
+        else:
+            if lod == LOD_SILHOUETTE:
+                self._geo_renderer.draw_silhouette(screen, base_x, base_y, scale=0.55)
+            else:
+                self._geo_renderer.draw_token(screen, base_x, base_y - 12, scale=0.55)
+            draw_bar(screen, base_x, base_y - 30, 30, 4, self.health / self.max_health,
+                     (50, 0, 0), (0, 255, 0))
         
-        # Indicador de unidad disponible
+        # Indicador de unidad disponible (sin contorno en los niveles bajos)
         if self.can_act and not self.has_moved and self.owner == "player":
             pygame.draw.circle(screen, (255, 255, 0), (base_x, base_y - 38), 6)
-            pygame.draw.circle(screen, (255, 140, 0), (base_x, base_y - 38), 6, 2)
+            if lod == LOD_FULL:
+                pygame.draw.circle(screen, (255, 140, 0), (base_x, base_y - 38), 6, 2)
     
     def _draw_health_bar_ultra(self, screen, x, y):
         bar_width = 30
@@ -19,6 +19,8 @@ from .combat_dayr import (
 )
 
 from .enemy_ai import EnemyAI
+from .pathfinding import PathfindingService
+from .line_of_sight import LineOfSight
 
 __all__ = [
     'GrassSystem', 'HoneycombTile', 'Particle', 'ParticleSystem',
@@ -34,4 +36,6 @@ __all__ = [
     'CombatState',
     # IA Enemiga
     'EnemyAI',
+    'PathfindingService',
+    'LineOfSight',
 ]
@@ -122,7 +122,7 @@ class CombatSystem:
     def end_combat(self, game):
         """Termina el combate y limpia"""
         game.projectiles.clear()
-        game.particles.particles.clear()
+        game.particles.clear()
         
         # Limpiar unidades y torres muertas
         for tile in game.grid.values():
@@ -40,11 +40,11 @@ class CombatManager:
     Gestor principal del sistema de combate Day R style.
     """
     
-    def __init__(self):
+    def __init__(self, line_of_sight: Any = None):
         # Sistemas especializados
         self.turn_queue = TurnQueue()
         self.damage_system = DamageSystem()
-        self.targeting = TargetingSystem()
+        self.targeting = TargetingSystem(line_of_sight)
         
         # Estado
         self.state = CombatState.INACTIVE
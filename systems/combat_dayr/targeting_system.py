@@ -19,8 +19,13 @@ class TargetingSystem:
     Sistema para encontrar y seleccionar objetivos.
     """
     
-    def __init__(self):
+    def __init__(self, line_of_sight: Any = None):
+        """
+        Args:
+            line_of_sight: Motor LineOfSight del grid (None = sin obstáculos)
+        """
         self._filter_chain: List[Callable] = []
+        self.line_of_sight = line_of_sight
     
     def get_valid_targets(
         self,
@@ -266,11 +271,12 @@ class TargetingSystem:
         target: Any
     ) -> bool:
         """
-        Verifica línea de visión (simplificado).
-        En una implementación completa verificaría obstáculos.
+        Verifica línea de visión: bloqueada por torres y unidades en los
+        tiles intermedios. Sin motor de visión siempre hay línea de visión.
         """
-        # Simplificado: siempre tiene línea de visión
-        return True
+        if self.line_of_sight is None:
+            return True
+        return self.line_of_sight.can_see(performer, target)
     
     def _get_distance(self, entity_a: Any, entity_b: Any) -> float:
         """Calcula distancia entre dos entidades."""
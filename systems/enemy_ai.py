@@ -5,6 +5,7 @@ Maneja toda la lógica de decisión y comportamiento de unidades enemigas.
 """
 import random
 from config.constants import ZONE_PLAYER_Y
+from .pathfinding import PathfindingService
 
 
 class EnemyAI:
@@ -15,6 +16,7 @@ class EnemyAI:
         self.units = unit_manager
         self.particles = particle_system
         self.projectiles = []
+        self.pathfinder = PathfindingService(grid_manager)
     
     def select_target(self, enemy, targets):
         """Selecciona el mejor objetivo para el enemigo."""
@@ -77,6 +79,18 @@ class EnemyAI:
         
         return best
     
+    def get_flow_field(self):
+        """
+        Campo de flujo hacia las unidades vivas del jugador.
+        Se recalcula solo si cambian sus tiles (una vez por turno como mucho).
+        """
+        sources = []
+        for unit in self.units.get_alive_player_units():
+            tile = self.grid.get_unit_tile(unit)
+            if tile is not None:
+                sources.append(tile)
+        return self.pathfinder.get_flow_field(sources)
+    
     def move_towards_target(self, enemy, target):
         """
         Mueve enemigo hacia objetivo.
@@ -92,21 +106,19 @@ class EnemyAI:
         if not enemy_tile or not target_tile:
             return False
         
-        # Buscar casillas adyacentes válidas
-        neighbors = enemy_tile.get_neighbors(self.grid.grid)
-        valid = [n for n in neighbors if n.owner == "enemy" and n.is_empty()]
+        # Siguiente paso por consulta al campo de flujo del turno: un único
+        # Dijkstra desde todas las unidades del jugador sirve a todos los enemigos
+        field = self.get_flow_field()
+        steps = field.ranked_steps(enemy_tile, zones=("enemy",))
+        if not steps:
+            return False  # Ningún vecino libre acerca al jugador
         
-        if not valid:
-            return False
-        
-        # Calcular distancia de cada vecino al objetivo
+        # A igual distancia, preferir el vecino más cercano al objetivo elegido
         scored = []
-        for n in valid:
+        for n, flow_dist in steps:
             dist = ((n.x - target_tile.x)**2 + (n.y - target_tile.y)**2)**0.5
-            scored.append((n, dist))
-        
-        # Ordenar por distancia
-        scored.sort(key=lambda x: x[1])
+            scored.append((n, flow_dist, dist))
+        scored.sort(key=lambda x: (x[1], x[2]))
         
         # 70% probabilidad de elegir el mejor, 30% el segundo
         if len(scored) >= 2 and random.random() < 0.3:
@@ -115,8 +127,7 @@ class EnemyAI:
             best = scored[0][0]
         
         # Ejecutar movimiento
-        enemy_tile.unit = None
-        best.unit = enemy
+        self.grid.place_unit(best, enemy)
         enemy.move_to(best.x, best.y)
         enemy.has_moved = True
         
@@ -249,10 +260,7 @@ class EnemyAI:
             neighbors = self.grid.get_empty_tiles_in_zone("enemy")
             if neighbors:
                 best = max(neighbors, key=lambda m: -abs(m.y - ZONE_PLAYER_Y))
-                unit_tile = self.grid.get_unit_tile(unit)
-                if unit_tile:
-                    unit_tile.unit = None
-                best.unit = unit
+                self.grid.place_unit(best, unit)
                 unit.move_to(best.x, best.y)
                 unit.has_moved = True
         
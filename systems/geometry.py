@@ -4,6 +4,9 @@ Renderizado geométrico detallado para unidades, torres y efectos
 import pygame
 import math
 import random
+from systems.sprite_cache import sprite_cache, quantize_phase
+from systems.glow_cache import glow_cache
+from systems.lod import silhouette_render, draw_token
 
 # ============================================================
 # COLORES BASE PARA FIGURAS GEOMÉTRICAS
@@ -105,9 +108,8 @@ class GeometryRenderer:
         """Efecto de brillo radial"""
         for i in range(intensity, 0, -1):
             alpha = int(100 / i)
-            glow_surf = pygame.Surface((radius*2*i, radius*2*i), pygame.SRCALPHA)
-            glow_color = (*color[:3], alpha)
-            pygame.draw.circle(glow_surf, glow_color, (radius*i, radius*i), radius*i)
+            glow_surf = glow_cache.circle(radius*i, color, alpha, size=radius*2*i,
+                                          center=(radius*i, radius*i))
             screen.blit(glow_surf, (int(x - radius*i), int(y - radius*i)))
     
     @staticmethod
@@ -134,6 +136,17 @@ class GeometryRenderer:
 # UNIDADES GEOMÉTRICAS DETALLADAS
 # ============================================================
 class GeometricUnit:
+    # Figuras pre-renderizadas (None = dibujar primitiva a primitiva)
+    sprite_cache = sprite_cache
+    # Distancia máxima (px a escala 1) a la que pinta una figura: el aura
+    # del mago llega a 4 veces su radio de 25 px
+    SPRITE_EXTENT = 110
+    # Ciclo (ms) de las figuras animadas; el resto son estáticas
+    ANIM_PERIODS = {
+        'ranger': 2 * math.pi / 0.003,       # viento de la capa
+        'mage': 2 * math.pi / 3 / 0.002,     # 3 orbes simétricos
+    }
+
     def __init__(self, unit_type, owner):
         self.unit_type = unit_type
         self.owner = owner  # "player" o "enemy"
@@ -151,6 +164,40 @@ class GeometricUnit:
     
     def draw(self, screen, x, y, scale=1.0, anim_time=0):
         self.anim_frame = anim_time
+        ticks = pygame.time.get_ticks()
+        
+        cache = self.sprite_cache
+        if cache is None:
+            self._draw_figure(screen, x, y, scale, ticks)
+            return
+        
+        phase = 0
+        period = self.ANIM_PERIODS.get(self.unit_type)
+        if period:
+            phase, ticks = quantize_phase(ticks, period)
+        key = ('unit', self.unit_type, self.owner, scale, phase)
+        cache.draw(screen, key,
+                   lambda surface, cx, cy: self._draw_figure(surface, cx, cy, scale, ticks),
+                   self.SPRITE_EXTENT * scale, x, y)
+    
+    def draw_silhouette(self, screen, x, y, scale=1.0):
+        """Nivel de detalle medio: silueta plana de la figura en reposo."""
+        cache = self.sprite_cache
+        if cache is None:
+            self.draw_token(screen, x, y, scale)
+            return
+        key = ('unit-silhouette', self.unit_type, self.owner, scale)
+        render = lambda surface, cx, cy: self._draw_figure(surface, cx, cy, scale, 0)
+        cache.draw(screen, key, silhouette_render(render, self.secondary, self.accent),
+                   self.SPRITE_EXTENT * scale, x, y)
+    
+    def draw_token(self, screen, x, y, scale=1.0):
+        """Nivel de detalle mínimo: ficha con el color de la facción."""
+        draw_token(screen, x, y, int(22 * scale), self.primary, self.accent)
+    
+    def _draw_figure(self, screen, x, y, scale, ticks):
+        """Dibuja la figura primitiva a primitiva en el instante ticks (ms)."""
+        self._ticks = ticks
         
         if self.unit_type == "berserker":
             self._draw_berserker(screen, x, y, scale)
@@ -314,7 +361,7 @@ class GeometricUnit:
         GR.draw_ellipse(screen, x, y+25*s, 28*s, 8*s, (0,0,0,60))
         
         # Capa con animación de viento
-        wind = math.sin(pygame.time.get_ticks() * 0.003) * 5 * s
+        wind = math.sin(self._ticks * 0.003) * 5 * s
         cape_points = [
             (x-5*s, y-20*s), (x-22*s+wind, y-8*s), (x-28*s+wind, y+12*s),
             (x-18*s+wind*0.5, y+22*s), (x-5*s, y+18*s), (x+5*s, y+18*s),
@@ -532,7 +579,7 @@ class GeometricUnit:
         GR.draw_glow(screen, x+25*s, y-42*s, 10*s, self.accent, 3)
         
         # Orbes flotantes
-        orbit_time = pygame.time.get_ticks() * 0.002
+        orbit_time = self._ticks * 0.002
         for i in range(3):
             angle = orbit_time + i * (2*math.pi/3)
             ox = x + math.cos(angle) * 25*s
@@ -545,6 +592,12 @@ class GeometricUnit:
 # TORRE GEOMÉTRICA DETALLADA
 # ============================================================
 class GeometricTower:
+    # Figuras pre-renderizadas (None = dibujar primitiva a primitiva)
+    sprite_cache = sprite_cache
+    SPRITE_EXTENT = 80
+    # Ciclo (s) del cañón; la luz parpadea 4 veces por ciclo
+    ANIM_PERIOD = math.pi
+
     def __init__(self, owner):
         self.owner = owner
         self.anim_time = 0
@@ -560,6 +613,35 @@ class GeometricTower:
     
     def draw(self, screen, x, y, scale=1.0, anim_time=0):
         self.anim_time = anim_time
+        
+        cache = self.sprite_cache
+        if cache is None:
+            self._draw_figure(screen, x, y, scale, anim_time)
+            return
+        
+        phase, anim_time = quantize_phase(anim_time, self.ANIM_PERIOD)
+        key = ('tower', self.owner, scale, phase)
+        cache.draw(screen, key,
+                   lambda surface, cx, cy: self._draw_figure(surface, cx, cy, scale, anim_time),
+                   self.SPRITE_EXTENT * scale, x, y)
+    
+    def draw_silhouette(self, screen, x, y, scale=1.0):
+        """Nivel de detalle medio: silueta plana de la torre."""
+        cache = self.sprite_cache
+        if cache is None:
+            self.draw_token(screen, x, y, scale)
+            return
+        key = ('tower-silhouette', self.owner, scale)
+        render = lambda surface, cx, cy: self._draw_figure(surface, cx, cy, scale, 0)
+        cache.draw(screen, key, silhouette_render(render, self.secondary, self.accent),
+                   self.SPRITE_EXTENT * scale, x, y)
+    
+    def draw_token(self, screen, x, y, scale=1.0):
+        """Nivel de detalle mínimo: ficha cuadrada con el color de la facción."""
+        draw_token(screen, x, y, int(30 * scale), self.primary, self.accent, square=True)
+    
+    def _draw_figure(self, screen, x, y, scale, anim_time):
+        """Dibuja la torre primitiva a primitiva."""
         GR = GeometryRenderer
         s = scale
         
@@ -0,0 +1,103 @@
+"""
+Glow Cache - Superficies con Alpha Compartidas
+==============================================
+Glows, partículas con brillo, proyectiles y paneles translúcidos creaban
+una pygame.Surface(SRCALPHA) nueva en cada frame. Esta caché guarda esas
+superficies por forma, color y alpha (cuantizado en ALPHA_STEP niveles)
+para que, en régimen estable, un frame no reserve ninguna superficie.
+
+Las superficies devueltas son compartidas: solo se deben copiar con blit.
+"""
+from collections import OrderedDict
+
+import pygame
+
+# Máximo de superficies guardadas (LRU)
+GLOW_CACHE_SIZE = 512
+# Granularidad del alpha: 8 -> 33 niveles en vez de 256
+ALPHA_STEP = 8
+
+
+def alpha_bucket(alpha):
+    """Cuantiza un alpha (0-255) al nivel más cercano de ALPHA_STEP."""
+    alpha = int(alpha + ALPHA_STEP / 2) // ALPHA_STEP * ALPHA_STEP
+    return max(0, min(255, alpha))
+
+
+class GlowCache:
+    """Caché LRU de superficies SRCALPHA (círculos suaves y paneles)."""
+
+    def __init__(self, max_entries=GLOW_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._surfaces = OrderedDict()
+
+        # Estadísticas (cada fallo es una superficie nueva)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def circle(self, radius, color, alpha, size=None, center=None):
+        """
+        Círculo relleno translúcido sobre una superficie transparente.
+
+        Args:
+            radius: radio del círculo
+            color: color RGB (se ignora un alpha incluido)
+            alpha: opacidad 0-255 (se cuantiza con alpha_bucket)
+            size: lado de la superficie (por defecto 2 * radius)
+            center: centro dentro de la superficie (por defecto size / 2)
+        """
+        if size is None:
+            size = radius * 2
+        if center is None:
+            center = (size / 2, size / 2)
+        alpha = alpha_bucket(alpha)
+        key = ('circle', radius, tuple(color[:3]), alpha, size, center)
+        surface = self._lookup(key)
+        if surface is None:
+            surface = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.circle(surface, (*color[:3], alpha), center, radius)
+            self._store(key, surface)
+        return surface
+
+    def panel(self, size, fill, border, border_width=2, border_radius=10):
+        """Rectángulo redondeado translúcido con borde."""
+        key = ('panel', tuple(size), tuple(fill), tuple(border), border_width, border_radius)
+        surface = self._lookup(key)
+        if surface is None:
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+            rect = (0, 0, size[0], size[1])
+            pygame.draw.rect(surface, fill, rect, border_radius=border_radius)
+            pygame.draw.rect(surface, border, rect, border_width, border_radius=border_radius)
+            self._store(key, surface)
+        return surface
+
+    def _lookup(self, key):
+        surface = self._surfaces.get(key)
+        if surface is None:
+            self.misses += 1
+            return None
+        self._surfaces.move_to_end(key)
+        self.hits += 1
+        return surface
+
+    def _store(self, key, surface):
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self._surfaces.clear()
+
+    def get_stats(self):
+        return {
+            'entries': len(self._surfaces),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+
+# Caché compartida por todos los efectos
+glow_cache = GlowCache()
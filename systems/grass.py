@@ -1,38 +1,188 @@
 """
 Sistema de pasto animado
 """
-import pygame
 import math
-import random
+import pygame
+import numpy as np
+
+# Separación entre briznas (px) y desplazamiento aleatorio máximo
+BLADE_SPACING = 8
+BLADE_JITTER = 3
+# Distancia máxima (px) a la que una brizna pinta desde su base
+BLADE_REACH = 14
+
+# Modo precalculado: un parche de pasto animado que se repite en pantalla.
+# 632 px ~ 2*pi / 0.01, así la fase del viento (x * 0.01) casi cierra el
+# ciclo en el borde del parche y las costuras no se notan.
+PATCH_SIZE = (632, 224)
+LOOP_FRAMES = 24
+LOOP_SPEED = 2.0  # rad/s: un ciclo de viento completo cada pi segundos
+# Si las zonas con ondas cubren más de esta fracción, se dibuja todo en vivo
+LIVE_FALLBACK = 0.5
 
 
 class GrassSystem:
-    """Sistema de pasto con ondas al caminar"""
-    
-    def __init__(self, width, height):
-        from config.constants import GRASS_LIGHT, GRASS_DARK, GRASS_BASE
-        
+    """
+    Sistema de pasto con ondas al caminar.
+
+    Las briznas viven en arrays NumPy de forma (columnas, filas) siguiendo
+    la rejilla de BLADE_SPACING px: el viento se calcula para todas con
+    unas pocas operaciones y cada onda solo toca el bloque de rejilla que
+    cubre su radio.
+
+    Modos de dibujado:
+    - baked (por defecto): el ciclo de viento se precalcula una vez en
+      LOOP_FRAMES fotogramas de un parche que se repite por la pantalla;
+      cada frame son unos pocos blits. Solo las zonas con ondas de pisadas
+      se redibujan brizna a brizna.
+    - live: todas las briznas se calculan y dibujan cada frame.
+
+    Oclusión: set_visible_rects() indica qué zonas de pantalla quedan a la
+    vista (el resto lo tapan capas opacas). Las briznas que no pintan en
+    ninguna de ellas no se simulan ni se dibujan, y las ondas ocultas no
+    se calculan; culled_blades / culled_pixels / culled_waves lo cuentan.
+    """
+
+    def __init__(self, width, height, seed=None, baked=True, background=None):
+        from config.constants import GRASS_LIGHT, GRASS_DARK, GRASS_BASE, COLOR_BG
+
         self.width = width
         self.height = height
-        self.blades = []
         self.waves = []
         self.time = 0
-        
-        for x in range(0, width, 8):
-            for y in range(0, height, 8):
-                height_var = random.uniform(0.7, 1.3)
-                angle_var = random.uniform(-0.2, 0.2)
-                self.blades.append({
-                    'x': x + random.uniform(-3, 3),
-                    'y': y + random.uniform(-3, 3),
-                    'height': 12 * height_var,
-                    'angle': angle_var,
-                    'base_angle': angle_var,
-                    'sway_speed': random.uniform(1.5, 2.5),
-                    'color': random.choice([GRASS_LIGHT, GRASS_DARK, GRASS_BASE]),
-                    'width': random.randint(2, 4)
-                })
-    
+        self.baked = baked
+        self.background = COLOR_BG if background is None else background
+
+        self.palette = [GRASS_LIGHT, GRASS_DARK, GRASS_BASE]
+        self.tip_palette = [tuple(min(255, c + 30) for c in color) for color in self.palette]
+
+        rng = np.random.default_rng(seed)
+        nx = len(range(0, width, BLADE_SPACING))
+        ny = len(range(0, height, BLADE_SPACING))
+
+        if baked:
+            pc = min(nx, PATCH_SIZE[0] // BLADE_SPACING)
+            pr = min(ny, PATCH_SIZE[1] // BLADE_SPACING)
+            self.patch_size = (pc * BLADE_SPACING, pr * BLADE_SPACING)
+            self._patch = self._generate_blades(rng, pc, pr)
+            # Ciclo cerrado: misma velocidad para todas y fase aleatoria
+            self._patch['sway_speed'][:] = LOOP_SPEED
+            self._patch['wind_phase'] += rng.uniform(0, 2 * math.pi, (pc, pr))
+            blades = self._tile_blades(self._patch, nx, ny)
+        else:
+            self.patch_size = None
+            self._patch = None
+            blades = self._generate_blades(rng, nx, ny)
+
+        self.x = blades['x']
+        self.y = blades['y']
+        self.height_px = blades['height']
+        self.base_angle = blades['base_angle']
+        self.sway_speed = blades['sway_speed']
+        self.color_idx = blades['color_idx']
+        self.blade_width = blades['width']
+        # Fase del viento que no depende del tiempo
+        self._wind_phase = blades['wind_phase']
+        # Ángulo actual (en modo baked solo se calcula en las zonas con ondas)
+        self.angle = self.base_angle.copy()
+
+        self._frames = None  # Fotogramas del parche (se generan al primer draw)
+
+        # Oclusión: zonas visibles (None = toda la pantalla) y bloques de
+        # la rejilla con las briznas que pintan en ellas
+        self._visible = None
+        self._visible_blocks = None
+        # Contadores de depuración
+        self.culled_blades = 0
+        self.culled_pixels = 0
+        self.culled_waves = 0
+
+    @property
+    def blade_count(self):
+        return self.x.size
+
+    # ============================================================
+    # CONSTRUCCIÓN
+    # ============================================================
+
+    def _generate_blades(self, rng, nx, ny):
+        """Briznas aleatorias sobre una rejilla de nx x ny."""
+        shape = (nx, ny)
+        gx = np.arange(nx, dtype=np.float64) * BLADE_SPACING
+        gy = np.arange(ny, dtype=np.float64) * BLADE_SPACING
+        x = gx[:, None] + rng.uniform(-BLADE_JITTER, BLADE_JITTER, shape)
+        return {
+            'x': x,
+            'y': gy[None, :] + rng.uniform(-BLADE_JITTER, BLADE_JITTER, shape),
+            'height': 12 * rng.uniform(0.7, 1.3, shape),
+            'base_angle': rng.uniform(-0.2, 0.2, shape),
+            'sway_speed': rng.uniform(1.5, 2.5, shape),
+            'color_idx': rng.integers(0, len(self.palette), shape, dtype=np.uint8),
+            'width': rng.integers(2, 5, shape).astype(np.float64),
+            'wind_phase': x * 0.01,
+        }
+
+    def _tile_blades(self, patch, nx, ny):
+        """Repite el parche hasta cubrir nx x ny (posiciones desplazadas)."""
+        pc, pr = patch['x'].shape
+        cols = np.arange(nx) % pc
+        rows = np.arange(ny) % pr
+        blades = {key: values[cols][:, rows] for key, values in patch.items()}
+        blades['x'] = blades['x'] + (np.arange(nx) // pc * self.patch_size[0])[:, None]
+        blades['y'] = blades['y'] + (np.arange(ny) // pr * self.patch_size[1])[None, :]
+        return blades
+
+    # ============================================================
+    # OCLUSIÓN
+    # ============================================================
+
+    def set_visible_rects(self, rects):
+        """
+        Fija las zonas de pantalla que quedan a la vista.
+
+        Args:
+            rects: rectángulos disjuntos visibles, o None para toda la pantalla
+        """
+        if rects is None:
+            self._visible = None
+            self._visible_blocks = None
+            self.culled_blades = 0
+            self.culled_pixels = 0
+            return
+
+        bounds = pygame.Rect(0, 0, self.width, self.height)
+        visible = [pygame.Rect(r).clip(bounds) for r in rects]
+        self._visible = [r for r in visible if r]
+
+        # Una brizna pinta hasta BLADE_REACH px desde su base
+        blocks = []
+        painted = np.zeros(self.x.shape, dtype=bool)
+        for rect in self._visible:
+            block = self._grid_block(rect.left - BLADE_REACH, rect.top - BLADE_REACH,
+                                     rect.right + BLADE_REACH, rect.bottom + BLADE_REACH)
+            if block is not None:
+                blocks.append(block)
+                painted[block] = True
+        self._visible_blocks = blocks
+        self.culled_blades = int(painted.size - painted.sum())
+        self.culled_pixels = bounds.width * bounds.height - sum(
+            r.width * r.height for r in self._visible)
+
+    def _wave_rect(self, wave):
+        """Zona de pantalla que altera una onda."""
+        reach = wave['radius'] + BLADE_JITTER + BLADE_REACH
+        return pygame.Rect(int(wave['x'] - reach), int(wave['y'] - reach),
+                           int(reach * 2) + 1, int(reach * 2) + 1)
+
+    def _wave_visible(self, wave):
+        if self._visible is None:
+            return True
+        return self._wave_rect(wave).collidelist(self._visible) != -1
+
+    # ============================================================
+    # SIMULACIÓN
+    # ============================================================
+
     def add_footstep_wave(self, x, y, radius=60):
         self.waves.append({
             'x': x,
@@ -41,51 +191,237 @@ class GrassSystem:
             'strength': 1.0,
             'decay': 2.0
         })
-    
+
+    def _wave_block(self, wave):
+        """Rango de la rejilla (slices de columnas y filas) que cubre una onda."""
+        reach = wave['radius'] + BLADE_JITTER
+        return self._grid_block(wave['x'] - reach, wave['y'] - reach,
+                                wave['x'] + reach, wave['y'] + reach)
+
+    def _grid_block(self, left, top, right, bottom):
+        """Slices de la rejilla con las briznas cuya base cae en el rectángulo."""
+        nx, ny = self.x.shape
+        c0 = max(0, int((left - BLADE_JITTER) // BLADE_SPACING))
+        c1 = min(nx, int((right + BLADE_JITTER) // BLADE_SPACING) + 2)
+        r0 = max(0, int((top - BLADE_JITTER) // BLADE_SPACING))
+        r1 = min(ny, int((bottom + BLADE_JITTER) // BLADE_SPACING) + 2)
+        if c0 >= c1 or r0 >= r1:
+            return None
+        return slice(c0, c1), slice(r0, r1)
+
+    @staticmethod
+    def _intersect(a, b):
+        """Intersección de dos bloques de rejilla (o None si no se tocan)."""
+        cols = slice(max(a[0].start, b[0].start), min(a[0].stop, b[0].stop))
+        rows = slice(max(a[1].start, b[1].start), min(a[1].stop, b[1].stop))
+        if cols.start >= cols.stop or rows.start >= rows.stop:
+            return None
+        return cols, rows
+
+    def _compute_angles(self, waves):
+        """Viento para todas las briznas + ondas en su bloque de rejilla."""
+        angle = np.sin(self.time * self.sway_speed + self._wind_phase)
+        angle *= 0.15
+        angle += self.base_angle
+
+        for wave in waves:
+            block = self._wave_block(wave)
+            if block is None:
+                continue
+            self._add_wave(angle, block, wave)
+        return angle
+
+    def _compute_visible_angles(self, waves):
+        """Como _compute_angles, pero solo en los bloques visibles."""
+        angle = self.angle
+        for block in self._visible_blocks:
+            wind = np.sin(self.time * self.sway_speed[block] + self._wind_phase[block])
+            wind *= 0.15
+            angle[block] = wind + self.base_angle[block]
+            for wave in waves:
+                wave_block = self._wave_block(wave)
+                if wave_block is None:
+                    continue
+                wave_block = self._intersect(wave_block, block)
+                if wave_block is not None:
+                    self._add_wave(angle, wave_block, wave)
+        return angle
+
+    def _add_wave(self, angle, block, wave):
+        """Suma el efecto de una onda a las briznas de un bloque."""
+        dist = np.hypot(self.x[block] - wave['x'], self.y[block] - wave['y'])
+        inside = dist < wave['radius']
+        intensity = (1 - dist / wave['radius']) * wave['strength']
+        effect = np.sin(self.time * 10 - dist * 0.2) * intensity * 0.5
+        angle[block] += np.where(inside, effect, 0.0)
+
     def update(self, dt):
         self.time += dt
-        
+
         for wave in self.waves[:]:
             wave['strength'] -= wave['decay'] * dt
             if wave['strength'] <= 0:
                 self.waves.remove(wave)
-        
-        for blade in self.blades:
-            wind = math.sin(self.time * blade['sway_speed'] + blade['x'] * 0.01) * 0.15
-            wave_effect = 0
-            
-            for wave in self.waves:
-                dist = math.sqrt((blade['x'] - wave['x'])**2 + (blade['y'] - wave['y'])**2)
-                if dist < wave['radius']:
-                    wave_intensity = (1 - dist / wave['radius']) * wave['strength']
-                    wave_effect += math.sin(self.time * 10 - dist * 0.2) * wave_intensity * 0.5
-            
-            blade['angle'] = blade['base_angle'] + wind + wave_effect
-    
-    def draw(self, screen):
-        grass_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        
-        for blade in self.blades:
-            tip_x = blade['x'] + math.sin(blade['angle']) * blade['height']
-            tip_y = blade['y'] - math.cos(blade['angle']) * blade['height'] * 0.7
-            ctrl_x = blade['x'] + math.sin(blade['angle']) * blade['height'] * 0.3
-            ctrl_y = blade['y'] - math.cos(blade['angle']) * blade['height'] * 0.2
-            
+
+        # Las ondas tapadas por capas opacas no se simulan
+        waves = [w for w in self.waves if self._wave_visible(w)]
+        self.culled_waves = len(self.waves) - len(waves)
+
+        # En modo baked el viento ya está en los fotogramas: sin ondas
+        # visibles no hace falta calcular nada
+        if self.baked and not waves:
+            return
+        if self._visible is None:
+            self.angle = self._compute_angles(waves)
+        else:
+            self.angle = self._compute_visible_angles(waves)
+
+    # ============================================================
+    # DIBUJADO
+    # ============================================================
+
+    def _draw_blades(self, surface, x, y, height, angle, width, color_idx):
+        """Dibuja briznas (arrays de igual forma) en el orden de la rejilla."""
+        sin_a = np.sin(angle).ravel()
+        cos_a = np.cos(angle).ravel()
+        x = x.ravel()
+        y = y.ravel()
+        h = height.ravel()
+        tip_x = x + sin_a * h
+        tip_y = y - cos_a * h * 0.7
+        ctrl_x = x + sin_a * h * 0.3
+        ctrl_y = y - cos_a * h * 0.2
+        half_w = (width / 2).ravel()
+        third_w = (width / 3).ravel()
+
+        palette = self.palette
+        tip_palette = self.tip_palette
+        polygon = pygame.draw.polygon
+        circle = pygame.draw.circle
+
+        for bx, by, tx, ty, cx, cy, hw, tw, ci in zip(
+                x.tolist(), y.tolist(), tip_x.tolist(), tip_y.tolist(),
+                ctrl_x.tolist(), ctrl_y.tolist(), half_w.tolist(),
+                third_w.tolist(), color_idx.ravel().tolist()):
             points = [
-                (blade['x'] - blade['width']/2, blade['y']),
-                (ctrl_x - blade['width']/3, ctrl_y),
-                (tip_x, tip_y),
-                (ctrl_x + blade['width']/3, ctrl_y),
-                (blade['x'] + blade['width']/2, blade['y'])
+                (bx - hw, by),
+                (cx - tw, cy),
+                (tx, ty),
+                (cx + tw, cy),
+                (bx + hw, by)
             ]
-            
-            pygame.draw.polygon(grass_surface, blade['color'], points)
-            
-            tip_color = (
-                min(255, blade['color'][0] + 30),
-                min(255, blade['color'][1] + 30),
-                min(255, blade['color'][2] + 30)
-            )
-            pygame.draw.circle(grass_surface, tip_color, (int(tip_x), int(tip_y)), 1)
-        
-        screen.blit(grass_surface, (0, 0))
+            polygon(surface, palette[ci], points)
+            circle(surface, tip_palette[ci], (int(tx), int(ty)), 1)
+
+    def _bake_frames(self):
+        """Renderiza el ciclo de viento del parche (bordes envueltos)."""
+        patch = self._patch
+        pw, ph = self.patch_size
+        x, y = patch['x'], patch['y']
+
+        # Briznas cerca del borde se dibujan también en el lado opuesto
+        copies = [(0, 0)]
+        for dx in (-pw, 0, pw):
+            for dy in (-ph, 0, ph):
+                if dx or dy:
+                    copies.append((dx, dy))
+
+        period = 2 * math.pi / LOOP_SPEED
+        frames = []
+        for k in range(LOOP_FRAMES):
+            t = period * k / LOOP_FRAMES
+            angle = np.sin(t * patch['sway_speed'] + patch['wind_phase']) * 0.15
+            angle += patch['base_angle']
+
+            frame = pygame.Surface(self.patch_size)
+            frame.fill(self.background)
+            for dx, dy in copies:
+                near = ((x + dx > -BLADE_REACH) & (x + dx < pw + BLADE_REACH) &
+                        (y + dy > -BLADE_REACH) & (y + dy < ph + BLADE_REACH))
+                if not near.any():
+                    continue
+                self._draw_blades(frame, x[near] + dx, y[near] + dy,
+                                  patch['height'][near], angle[near],
+                                  patch['width'][near], patch['color_idx'][near])
+            frames.append(frame)
+        self._frames = frames
+
+    def _current_frame(self):
+        """Fotograma del ciclo correspondiente a self.time."""
+        period = 2 * math.pi / LOOP_SPEED
+        index = int(self.time % period / period * LOOP_FRAMES) % LOOP_FRAMES
+        return self._frames[index]
+
+    def draw(self, screen):
+        visible = self._visible
+        if not self.baked:
+            if visible is None:
+                self._draw_blades(screen, self.x, self.y, self.height_px, self.angle,
+                                  self.blade_width, self.color_idx)
+            else:
+                for rect in visible:
+                    self._draw_region(screen, rect, fill=False)
+            return
+
+        if self._frames is None:
+            self._bake_frames()
+
+        frame = self._current_frame()
+        pw, ph = self.patch_size
+        if visible is None:
+            for ty in range(0, self.height, ph):
+                for tx in range(0, self.width, pw):
+                    screen.blit(frame, (tx, ty))
+        else:
+            # Solo los trozos de parche que caen en zonas visibles
+            for rect in visible:
+                for ty in range(rect.top // ph * ph, rect.bottom, ph):
+                    for tx in range(rect.left // pw * pw, rect.right, pw):
+                        area = rect.clip((tx, ty, pw, ph))
+                        screen.blit(frame, area.topleft, area.move(-tx, -ty))
+
+        # Zonas con ondas: se borran y se redibujan brizna a brizna
+        regions = self._wave_regions()
+        if visible is not None:
+            regions = [r.clip(v) for r in regions for v in visible if r.colliderect(v)]
+        screen_area = self.width * self.height - self.culled_pixels
+        if sum(r.width * r.height for r in regions) > screen_area * LIVE_FALLBACK:
+            if visible is None:
+                screen.fill(self.background, (0, 0, self.width, self.height))
+                self._draw_blades(screen, self.x, self.y, self.height_px, self.angle,
+                                  self.blade_width, self.color_idx)
+                return
+            regions = visible
+        for region in regions:
+            self._draw_region(screen, region)
+
+    def _wave_regions(self):
+        """Rectángulos de pantalla alterados por las ondas (solapados unidos)."""
+        bounds = pygame.Rect(0, 0, self.width, self.height)
+        regions = []
+        for wave in self.waves:
+            rect = self._wave_rect(wave).clip(bounds)
+            if not rect:
+                continue
+            # Unir con los que ya solapa (y con los que solape la unión)
+            hit = rect.collidelist(regions)
+            while hit != -1:
+                rect.union_ip(regions.pop(hit))
+                hit = rect.collidelist(regions)
+            regions.append(rect)
+        return regions
+
+    def _draw_region(self, screen, region, fill=True):
+        """Borra una zona y redibuja en vivo las briznas que pintan en ella."""
+        block = self._grid_block(region.left - BLADE_REACH, region.top - BLADE_REACH,
+                                 region.right + BLADE_REACH, region.bottom + BLADE_REACH)
+        if block is None:
+            return
+
+        previous_clip = screen.get_clip()
+        screen.set_clip(region.clip(previous_clip))
+        if fill:
+            screen.fill(self.background, region)
+        self._draw_blades(screen, self.x[block], self.y[block], self.height_px[block],
+                          self.angle[block], self.blade_width[block], self.color_idx[block])
+        screen.set_clip(previous_clip)
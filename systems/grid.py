@@ -3,6 +3,9 @@ Sistema de grilla hexagonal - Panal de abeja
 """
 import pygame
 import math
+from .hex_layout import NEIGHBOR_OFFSETS_EVEN, NEIGHBOR_OFFSETS_ODD
+from .glow_cache import glow_cache
+from .text_cache import text_cache, get_font
 
 
 class HoneycombTile:
@@ -20,6 +23,9 @@ class HoneycombTile:
         
         self.unit = None
         self.tower = None
+        self.movement_cost = 0  # Coste extra al entrar (MoveAction, pathfinding)
+        
+        self.index = -1  # Posición en GridManager.tiles / neighbor_table
         
         self.hovered = False
         self.selected = False
@@ -118,28 +124,24 @@ class HoneycombTile:
         # Glow effect
         if glow:
             from config.constants import HEX_RADIUS
-            glow_surf = pygame.Surface((HEX_RADIUS*3, HEX_RADIUS*3), pygame.SRCALPHA)
-            pygame.draw.circle(glow_surf, (255, 255, 100, 60), 
-                             (HEX_RADIUS*1.5, HEX_RADIUS*1.5), HEX_RADIUS)
+            glow_surf = glow_cache.circle(HEX_RADIUS, (255, 255, 100), 60, size=HEX_RADIUS*3)
             screen.blit(glow_surf, (self.x - HEX_RADIUS*1.5, self.y - HEX_RADIUS*1.5))
         
         # Indicador de oráculo
         if self.oracle_recommended:
             pygame.draw.circle(screen, COLOR_ORACLE, (self.x, self.y), 10)
             pygame.draw.circle(screen, (255, 255, 255), (self.x, self.y), 6)
-            font = pygame.font.SysFont("arial", 14, bold=True)
-            text = font.render("K", True, (0, 0, 0))
+            text = text_cache.render(get_font("arial", 14, bold=True), "K", (0, 0, 0))
             rect = text.get_rect(center=(self.x, self.y))
             screen.blit(text, rect)
     
     def get_neighbors(self, all_tiles):
+        """
+        Vecinos buscando en un dict de tiles. Dentro del juego usar
+        GridManager.get_neighbors, que lee la tabla precalculada.
+        """
         neighbors = []
-        directions = [(1, 0), (-1, 0), (0, -1), (0, 1)]
-        
-        if self.col % 2 == 0:
-            directions.extend([(-1, -1), (1, -1)])
-        else:
-            directions.extend([(-1, 1), (1, 1)])
+        directions = NEIGHBOR_OFFSETS_ODD if self.col % 2 else NEIGHBOR_OFFSETS_EVEN
         
         for dc, dr in directions:
             neighbor_key = (self.col + dc, self.row + dr)
@@ -0,0 +1,166 @@
+"""
+Hex Layout - Modelo de Coordenadas del Panal
+============================================
+Describe la disposición en píxeles del grid hexagonal (hexágonos con lado
+plano arriba, columnas impares desplazadas media fila hacia abajo) y su
+inversa: de una posición de pantalla a la clave (col, row) del tile.
+
+Convenciones:
+- Clave del tile: (col, row). Filas >= 0 son la zona del jugador y filas
+  negativas la zona enemiga (-1 es la fila enemiga más cercana al centro).
+- Fila global: g = row + rows. Las dos zonas forman un único panal "odd-q"
+  de 2*rows filas que crece hacia abajo; la zona enemiga está espejada
+  respecto a la numeración de claves, no respecto a la geometría.
+- Entre ambas zonas existe un pequeño hueco vertical (zone_gap píxeles).
+"""
+from config.constants import (
+    SCREEN_WIDTH, HEX_RADIUS, HEX_WIDTH, HEX_HEIGHT,
+    GRID_COLS, GRID_ROWS, ZONE_PLAYER_Y, ZONE_ENEMY_Y,
+)
+
+# Hueco vertical entre la última fila enemiga y la primera del jugador
+ZONE_GAP = ZONE_PLAYER_Y - (ZONE_ENEMY_Y + GRID_ROWS * HEX_HEIGHT)
+
+# Vecinos odd-q por paridad de columna (mismo orden que HoneycombTile)
+NEIGHBOR_OFFSETS_EVEN = ((1, 0), (-1, 0), (0, -1), (0, 1), (-1, -1), (1, -1))
+NEIGHBOR_OFFSETS_ODD = ((1, 0), (-1, 0), (0, -1), (0, 1), (-1, 1), (1, 1))
+
+
+class HexLayout:
+    """Geometría del panal: offset <-> cubo <-> píxel."""
+
+    def __init__(self, cols=GRID_COLS, rows=GRID_ROWS):
+        self.cols = cols
+        self.rows = rows
+
+        self.radius = HEX_RADIUS
+        self.col_step = HEX_WIDTH * 0.75
+        self.row_height = HEX_HEIGHT
+        self.half_row = HEX_HEIGHT // 2
+
+        total_width = cols * self.col_step
+        self.start_x = (SCREEN_WIDTH - total_width) // 2 + HEX_RADIUS
+        self.enemy_y = ZONE_ENEMY_Y
+        self.player_y = ZONE_ENEMY_Y + rows * HEX_HEIGHT + ZONE_GAP
+
+        # Radio de click/hover (mismo criterio que HoneycombTile.update)
+        self.hit_radius_sq = (HEX_RADIUS * 0.9) ** 2
+
+    # ============================================================
+    # CLAVES Y OFFSET
+    # ============================================================
+
+    def keys(self):
+        """Claves en orden de creación: zona jugador y luego zona enemiga."""
+        for row in range(self.rows):
+            for col in range(self.cols):
+                yield (col, row)
+        for row in range(self.rows):
+            for col in range(self.cols):
+                yield (col, -(row + 1))
+
+    def contains(self, col, row):
+        """True si la clave pertenece al grid."""
+        return 0 <= col < self.cols and -self.rows <= row < self.rows
+
+    def owner(self, row):
+        """Zona a la que pertenece una fila."""
+        return "player" if row >= 0 else "enemy"
+
+    def global_row(self, row):
+        """Fila global (0 = fila superior de la zona enemiga)."""
+        return row + self.rows
+
+    def neighbor_offsets(self, col):
+        """Desplazamientos (dc, dr) de los 6 vecinos según la paridad."""
+        return NEIGHBOR_OFFSETS_ODD if col & 1 else NEIGHBOR_OFFSETS_EVEN
+
+    def neighbor_keys(self, col, row):
+        """Claves vecinas (pueden caer fuera del grid)."""
+        return [(col + dc, row + dr) for dc, dr in self.neighbor_offsets(col)]
+
+    # ============================================================
+    # PÍXELES
+    # ============================================================
+
+    def center(self, col, row):
+        """Centro en píxeles de un tile (enteros, como los usa el tile)."""
+        x = self.start_x + col * self.col_step
+        if row >= 0:
+            y = self.player_y + row * self.row_height
+        else:
+            y = self.enemy_y + (row + self.rows) * self.row_height
+        if col % 2 == 1:
+            y += self.half_row
+        return int(x), int(y)
+
+    def pixel_to_key(self, px, py):
+        """
+        Clave del hexágono más cercano a un punto (sin validar límites).
+        Invierte center(): elimina el hueco entre zonas, pasa a
+        coordenadas axiales fraccionarias y redondea en espacio cúbico.
+        """
+        y = py - self.enemy_y
+        # Por debajo del centro del hueco se descuenta el desplazamiento extra
+        if py >= self.player_y - (self.half_row + ZONE_GAP / 2):
+            y -= ZONE_GAP
+
+        q = (px - self.start_x) / self.col_step
+        r = y / self.row_height - q / 2
+        cx, cy, cz = self.cube_round(q, -q - r, r)
+        return self.cube_to_offset(cx, cy, cz)
+
+    def visible_range(self, left, top, right, bottom, margin):
+        """
+        Rango de columnas y filas globales que pueden intersectar un
+        rectángulo de pantalla (conservador, ampliado en `margin` píxeles).
+        Returns: (col0, col1, g0, g1) inclusivos, o None si no hay ninguno.
+        """
+        col0 = max(0, int((left - margin - self.start_x) // self.col_step))
+        col1 = min(self.cols - 1, int((right + margin - self.start_x) // self.col_step) + 1)
+        
+        span = self.row_height
+        g0 = int((top - margin - self.enemy_y - self.half_row - ZONE_GAP) // span)
+        g1 = int((bottom + margin - self.enemy_y) // span) + 1
+        g0 = max(0, g0)
+        g1 = min(2 * self.rows - 1, g1)
+        
+        if col0 > col1 or g0 > g1:
+            return None
+        return col0, col1, g0, g1
+
+    # ============================================================
+    # COORDENADAS CÚBICAS
+    # ============================================================
+
+    def offset_to_cube(self, col, row):
+        """Clave (col, row) -> cubo (x, y, z) con x + y + z = 0."""
+        g = row + self.rows
+        x = col
+        z = g - (col - (col & 1)) // 2
+        return x, -x - z, z
+
+    def cube_to_offset(self, x, y, z):
+        """Cubo (x, y, z) -> clave (col, row)."""
+        col = x
+        g = z + (x - (x & 1)) // 2
+        return col, g - self.rows
+
+    @staticmethod
+    def cube_round(fx, fy, fz):
+        """Redondea coordenadas cúbicas fraccionarias al hexágono más cercano."""
+        rx, ry, rz = round(fx), round(fy), round(fz)
+        dx, dy, dz = abs(rx - fx), abs(ry - fy), abs(rz - fz)
+        if dx > dy and dx > dz:
+            rx = -ry - rz
+        elif dy > dz:
+            ry = -rx - rz
+        else:
+            rz = -rx - ry
+        return int(rx), int(ry), int(rz)
+
+    def distance(self, key_a, key_b):
+        """Distancia hexagonal (en pasos) entre dos claves."""
+        ax, ay, az = self.offset_to_cube(*key_a)
+        bx, by, bz = self.offset_to_cube(*key_b)
+        return max(abs(ax - bx), abs(ay - by), abs(az - bz))
@@ -0,0 +1,183 @@
+"""
+Line of Sight - Línea de Visión sobre el Panal
+==============================================
+Trazado de líneas hexagonales en coordenadas cúbicas: se interpola entre
+los centros de ambos tiles y se redondea cada muestra al hexágono más
+cercano. La visión queda bloqueada si algún tile intermedio tiene una
+unidad o una torre (los extremos nunca bloquean).
+
+Caché:
+- La geometría de cada rayo es fija, se calcula una vez por par de tiles.
+- El resultado (visible o no) depende de la ocupación. GridManager avisa de
+  cada tile modificado; los cambios se acumulan y, en la siguiente consulta
+  con una occupancy_version distinta, solo se descartan los resultados
+  cuyos rayos atraviesan esos tiles.
+"""
+from collections import OrderedDict
+
+# Máximo de rayos guardados (se descartan los menos usados)
+LOS_CACHE_SIZE = 8192
+
+# Desplazamiento para desempatar muestras que caen justo en una arista
+_NUDGE = (1e-6, 2e-6, -3e-6)
+
+
+class LineOfSight:
+    """Motor de línea de visión con caché de visibilidad por rayo."""
+
+    def __init__(self, grid_manager, cache_size=LOS_CACHE_SIZE):
+        self.grid = grid_manager
+        self.cache_size = cache_size
+
+        layout = grid_manager.layout
+        self._cubes = [layout.offset_to_cube(t.col, t.row) for t in grid_manager.tiles]
+        self._index_by_cube = {cube: i for i, cube in enumerate(self._cubes)}
+
+        # (origen, destino) -> índices intermedios del rayo
+        self._rays = OrderedDict()
+        # (origen, destino) -> bool, válido para self._version
+        self._visible = {}
+        # índice de tile -> rayos que lo atraviesan
+        self._through = {}
+
+        # Tiles modificados desde la última consulta
+        self._pending = set()
+        self._version = grid_manager.occupancy_version
+
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+        grid_manager.add_occupancy_listener(self._on_tile_changed)
+
+    # ============================================================
+    # CONSULTAS
+    # ============================================================
+
+    def line(self, tile_a, tile_b):
+        """Tiles de la línea entre dos tiles (ambos extremos incluidos)."""
+        tiles = self.grid.tiles
+        middle = self._get_ray(tile_a.index, tile_b.index)
+        return [tile_a] + [tiles[i] for i in middle] + [tile_b]
+
+    def has_line_of_sight(self, tile_a, tile_b):
+        """True si ningún tile intermedio está ocupado."""
+        self._sync()
+        key = (tile_a.index, tile_b.index)
+        visible = self._visible.get(key)
+        if visible is not None:
+            self.hits += 1
+            self._rays.move_to_end(key)
+            return visible
+
+        self.misses += 1
+        tiles = self.grid.tiles
+        ray = self._get_ray(*key)
+        visible = all(tiles[i].is_empty() for i in ray)
+        self._visible[key] = visible
+        return visible
+
+    def can_see(self, viewer, target):
+        """
+        Línea de visión entre dos entidades del grid (unidades o torres).
+        Si alguna no está en el grid no hay nada que la bloquee: True.
+        """
+        tile_a = self._entity_tile(viewer)
+        tile_b = self._entity_tile(target)
+        if tile_a is None or tile_b is None:
+            return True
+        return self.has_line_of_sight(tile_a, tile_b)
+
+    def clear(self):
+        """Vacía la caché."""
+        self._rays.clear()
+        self._visible.clear()
+        self._through.clear()
+        self._pending.clear()
+
+    def get_stats(self):
+        """Estadísticas de la caché (para depuración y benchmarks)."""
+        return {
+            'rays': len(self._rays),
+            'hits': self.hits,
+            'misses': self.misses,
+            'invalidations': self.invalidations,
+        }
+
+    # ============================================================
+    # TRAZADO
+    # ============================================================
+
+    def _entity_tile(self, entity):
+        """Tile que ocupa una unidad o torre."""
+        tile = self.grid.get_unit_tile(entity)
+        if tile is None:
+            tile = self.grid.get_tower_tile(entity)
+        return tile
+
+    def _trace(self, start, end):
+        """Índices intermedios de la línea cúbica entre dos tiles."""
+        ax, ay, az = self._cubes[start]
+        bx, by, bz = self._cubes[end]
+        steps = max(abs(ax - bx), abs(ay - by), abs(az - bz))
+
+        ax, ay, az = ax + _NUDGE[0], ay + _NUDGE[1], az + _NUDGE[2]
+        bx, by, bz = bx + _NUDGE[0], by + _NUDGE[1], bz + _NUDGE[2]
+
+        middle = []
+        for i in range(1, steps):
+            t = i / steps
+            cube = self.grid.layout.cube_round(ax + (bx - ax) * t,
+                                               ay + (by - ay) * t,
+                                               az + (bz - az) * t)
+            index = self._index_by_cube.get(cube)
+            if index is not None:
+                middle.append(index)
+        return tuple(middle)
+
+    def _get_ray(self, start, end):
+        """Rayo cacheado (lo traza y registra la primera vez)."""
+        key = (start, end)
+        ray = self._rays.get(key)
+        if ray is not None:
+            return ray
+
+        ray = self._trace(start, end)
+        self._rays[key] = ray
+        for index in ray:
+            self._through.setdefault(index, set()).add(key)
+
+        while len(self._rays) > self.cache_size:
+            self._evict(next(iter(self._rays)))
+        return ray
+
+    # ============================================================
+    # INVALIDACIÓN
+    # ============================================================
+
+    def _evict(self, key):
+        """Elimina un rayo y su resultado."""
+        ray = self._rays.pop(key)
+        self._visible.pop(key, None)
+        for index in ray:
+            keys = self._through.get(index)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._through[index]
+
+    def _on_tile_changed(self, tile):
+        """Oyente de GridManager: apunta el tile para la próxima consulta."""
+        self._pending.add(tile.index)
+
+    def _sync(self):
+        """Descarta los resultados de los rayos que cruzan tiles modificados."""
+        if self._version == self.grid.occupancy_version:
+            return
+        self._version = self.grid.occupancy_version
+
+        for index in self._pending:
+            for key in self._through.get(index, ()):
+                if self._visible.pop(key, None) is not None:
+                    self.invalidations += 1
+        self._pending.clear()
@@ -0,0 +1,160 @@
+"""
+LOD - Niveles de Detalle de las Figuras
+=======================================
+Unidades, torres y héroe tienen tres niveles de dibujado:
+
+- LOD_FULL: la figura completa con sus animaciones, barras e indicadores.
+- LOD_SILHOUETTE: la figura estática como silueta plana (máscara rellena
+  con el color de la facción y contorno), pre-renderizada en la caché de
+  sprites, más la barra de vida.
+- LOD_TOKEN: una ficha plana (círculo o cuadrado) con la barra de vida.
+
+Con las figuras ya cacheadas, lo que cuesta por figura es el número de
+llamadas a pygame: en los niveles bajos silueta, ficha y barras son un
+blit cada una (sprites cacheados por color y píxeles de vida) en vez de
+varios rectángulos y círculos.
+
+LodSelector elige el nivel de cada frame a partir del número de figuras
+en pantalla, la escala de la vista y el tiempo de frame: si los frames
+pasan del presupuesto varias veces seguidas baja un nivel, y solo vuelve
+a subir tras muchos frames holgados, para que las batallas grandes se
+degraden poco a poco en vez de perder frames.
+"""
+import pygame
+
+from systems.sprite_cache import sprite_cache
+
+LOD_FULL = 0
+LOD_SILHOUETTE = 1
+LOD_TOKEN = 2
+LOD_NAMES = ("completo", "silueta", "ficha")
+
+# Figuras en pantalla a partir de las que se pasa a silueta y a ficha
+LOD_COUNT_THRESHOLDS = (80, 200)
+# Escala de vista por debajo de la cual se pasa a silueta y a ficha
+LOD_SCALE_THRESHOLDS = (0.6, 0.35)
+# Presupuesto de CPU por frame (ms)
+LOD_FRAME_BUDGET_MS = 1000 / 60
+# Frames seguidos sobre el presupuesto para bajar un nivel
+LOD_DEGRADE_FRAMES = 10
+# Frames seguidos por debajo de LOD_RECOVER_RATIO del presupuesto para subir
+LOD_RECOVER_FRAMES = 180
+LOD_RECOVER_RATIO = 0.6
+# Píxeles mínimos de una pieza de la silueta para trazar su contorno
+SILHOUETTE_MIN_PIXELS = 12
+
+
+class LodSelector:
+    """Elige el nivel de detalle de cada frame."""
+
+    def __init__(self, level=None, budget_ms=LOD_FRAME_BUDGET_MS):
+        """
+        Args:
+            level: nivel fijo (None = automático)
+            budget_ms: presupuesto por frame (None = no mirar el tiempo)
+        """
+        self.level = level
+        self.budget_ms = budget_ms
+        # Nivel impuesto por el tiempo de frame
+        self.budget_tier = LOD_FULL
+        self._over = 0
+        self._under = 0
+
+        # Estadísticas
+        self.tier = LOD_FULL
+        self.changes = 0
+
+    def cycle_level(self):
+        """Automático -> completo -> silueta -> ficha -> automático."""
+        self.level = None if self.level == LOD_TOKEN else \
+            LOD_FULL if self.level is None else self.level + 1
+
+    def report_frame(self, frame_ms):
+        """Tiempo de CPU del último frame (ms)."""
+        if self.budget_ms is None:
+            return
+        if frame_ms > self.budget_ms:
+            self._over += 1
+            self._under = 0
+        elif frame_ms < self.budget_ms * LOD_RECOVER_RATIO:
+            self._under += 1
+            self._over = 0
+        else:
+            self._over = self._under = 0
+
+        if self._over >= LOD_DEGRADE_FRAMES and self.budget_tier < LOD_TOKEN:
+            self.budget_tier += 1
+            self._over = 0
+        elif self._under >= LOD_RECOVER_FRAMES and self.budget_tier > LOD_FULL:
+            self.budget_tier -= 1
+            self._under = 0
+
+    def select(self, count, scale=1.0):
+        """
+        Args:
+            count: figuras a dibujar este frame
+            scale: escala de la vista (1 = sin zoom)
+
+        Returns:
+            nivel de detalle para todas las figuras del frame
+        """
+        if self.level is not None:
+            tier = self.level
+        else:
+            tier = max(self.budget_tier,
+                       sum(count >= n for n in LOD_COUNT_THRESHOLDS),
+                       sum(scale < s for s in LOD_SCALE_THRESHOLDS))
+        if tier != self.tier:
+            self.tier = tier
+            self.changes += 1
+        return tier
+
+    def get_stats(self):
+        return {'tier': LOD_NAMES[self.tier], 'budget_tier': LOD_NAMES[self.budget_tier],
+                'changes': self.changes}
+
+
+def silhouette_render(render, fill, outline):
+    """
+    Envuelve el callback de una figura para la caché de sprites: la
+    dibuja y la convierte en su silueta plana (una vez por clave).
+    """
+    def draw(surface, x, y):
+        render(surface, x, y)
+        mask = pygame.mask.from_surface(surface)
+        mask.to_surface(surface, setcolor=fill, unsetcolor=(0, 0, 0, 0))
+        for part in mask.connected_components(SILHOUETTE_MIN_PIXELS):
+            points = part.outline()
+            if len(points) > 2:
+                pygame.draw.lines(surface, outline, True, points)
+    return draw
+
+
+def draw_token(screen, x, y, radius, fill, border, square=False):
+    """Ficha plana centrada en x, y: círculo (o cuadrado para torres) con borde."""
+    def render(surface, cx, cy):
+        if square:
+            rect = (cx - radius, cy - radius, radius * 2, radius * 2)
+            pygame.draw.rect(surface, fill, rect)
+            pygame.draw.rect(surface, border, rect, 2)
+        else:
+            pygame.draw.circle(surface, fill, (cx, cy), radius)
+            pygame.draw.circle(surface, border, (cx, cy), radius, 2)
+    sprite_cache.draw(screen, ('token', radius, fill, border, square), render,
+                      radius * 1.5, x, y)
+
+
+def draw_bar(screen, x, y, width, height, ratio, back, fill):
+    """
+    Barra (fondo, relleno y borde negro) con su borde superior en y y
+    centrada en x, como un blit: hay un sprite por píxel de relleno.
+    """
+    filled = int(width * max(0.0, min(1.0, ratio)))
+
+    def render(surface, cx, cy):
+        left = cx - width // 2
+        pygame.draw.rect(surface, back, (left, cy, width, height))
+        pygame.draw.rect(surface, fill, (left, cy, filled, height))
+        pygame.draw.rect(surface, (0, 0, 0), (left, cy, width, height), 1)
+    sprite_cache.draw(screen, ('bar', width, height, filled, back, fill), render,
+                      width, x, y)
@@ -4,6 +4,12 @@ Sistema de partículas
 import pygame
 import random
 import math
+import numpy as np
+from systems.glow_cache import glow_cache, ALPHA_STEP
+from systems.stamp_batch import StampBatch
+
+# Partículas preasignadas (los arrays se duplican si se llenan)
+PARTICLE_CAPACITY = 1024
 
 
 class Particle:
@@ -31,10 +37,8 @@ class Particle:
     
     def draw(self, screen):
         if self.glow:
-            glow_surf = pygame.Surface((self.size * 4, self.size * 4), pygame.SRCALPHA)
             alpha = int(255 * (self.lifetime / self.max_lifetime))
-            pygame.draw.circle(glow_surf, (*self.color, alpha // 2), 
-                            (self.size * 2, self.size * 2), self.size * 2)
+            glow_surf = glow_cache.circle(self.size * 2, self.color, alpha // 2)
             screen.blit(glow_surf, (self.x - self.size * 2, self.y - self.size * 2))
         
         alpha = int(255 * (self.lifetime / self.max_lifetime))
@@ -47,61 +51,219 @@ class Particle:
 
 
 class ParticleSystem:
-    """Sistema de partículas"""
+    """
+    Sistema de partículas.
+
+    Las partículas viven en arrays NumPy preasignados (estructura de
+    arrays): posición, velocidad, vida, tamaño, color y glow. update()
+    integra todas a la vez y compacta las muertas moviendo a sus huecos
+    las vivas del final (swap-remove), sin recorrer listas. La API
+    spawn_* no cambia; sus valores aleatorios siguen saliendo del módulo
+    random en el mismo orden.
+    """
+    
+    def __init__(self, capacity=PARTICLE_CAPACITY):
+        self.count = 0
+        self._allocate(capacity)
+    
+    def _allocate(self, capacity):
+        """Crea (o agranda conservando las vivas) los arrays."""
+        old = getattr(self, 'x', None)
+        arrays = {
+            'x': np.zeros(capacity),
+            'y': np.zeros(capacity),
+            'vx': np.zeros(capacity),
+            'vy': np.zeros(capacity),
+            'lifetime': np.zeros(capacity),
+            'max_lifetime': np.ones(capacity),
+            'size': np.zeros(capacity, dtype=np.int32),
+            'color': np.zeros((capacity, 3), dtype=np.uint8),
+            'glow': np.zeros(capacity, dtype=bool),
+        }
+        if old is not None:
+            n = self.count
+            for name, values in arrays.items():
+                values[:n] = getattr(self, name)[:n]
+        for name, values in arrays.items():
+            setattr(self, name, values)
+        self.capacity = capacity
+    
+    def __len__(self):
+        return self.count
     
-    def __init__(self):
-        self.particles = []
+    def clear(self):
+        self.count = 0
+    
+    # ============================================================
+    # SPAWN
+    # ============================================================
+    
+    def _spawn(self, x, y, color, vx, vy, lifetime, size, glow):
+        """Añade partículas (vx, vy, lifetime y size son listas de igual largo)."""
+        n = len(vx)
+        start = self.count
+        end = start + n
+        if end > self.capacity:
+            self._allocate(max(end, self.capacity * 2))
+        
+        self.x[start:end] = x
+        self.y[start:end] = y
+        self.vx[start:end] = vx
+        self.vy[start:end] = vy
+        self.lifetime[start:end] = lifetime
+        self.max_lifetime[start:end] = lifetime
+        self.size[start:end] = size
+        self.color[start:end] = color[:3]
+        self.glow[start:end] = glow
+        self.count = end
+    
+    @staticmethod
+    def _radial_velocity(min_speed, max_speed):
+        """Velocidad en una dirección aleatoria."""
+        angle = random.uniform(0, 2 * math.pi)
+        speed = random.uniform(min_speed, max_speed)
+        return math.cos(angle) * speed, math.sin(angle) * speed
     
     def spawn_spark(self, x, y, color, count=5):
+        vx, vy, lifetime, size = [], [], [], []
         for _ in range(count):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(50, 150)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            self.particles.append(Particle(x, y, color, (vx, vy), 
-                                         random.uniform(0.3, 0.8), 
-                                         random.randint(2, 5), glow=True))
+            pvx, pvy = self._radial_velocity(50, 150)
+            vx.append(pvx)
+            vy.append(pvy)
+            lifetime.append(random.uniform(0.3, 0.8))
+            size.append(random.randint(2, 5))
+        self._spawn(x, y, color, vx, vy, lifetime, size, True)
     
     def spawn_dust(self, x, y):
+        vx, vy, size = [], [], []
         for _ in range(8):
-            vx = random.uniform(-40, 40)
-            vy = random.uniform(-30, -80)
-            color = (139, 125, 107)
-            self.particles.append(Particle(x, y, color, (vx, vy), 0.6, random.randint(4, 8)))
+            vx.append(random.uniform(-40, 40))
+            vy.append(random.uniform(-30, -80))
+            size.append(random.randint(4, 8))
+        self._spawn(x, y, (139, 125, 107), vx, vy, 0.6, size, False)
     
     def spawn_attack(self, x, y, owner):
         color = (255, 200, 50) if owner == "player" else (255, 100, 50)
+        vx, vy, size = [], [], []
         for _ in range(12):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(100, 250)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            self.particles.append(Particle(x, y, color, (vx, vy), 0.5, 
-                                         random.randint(6, 10), glow=True))
+            pvx, pvy = self._radial_velocity(100, 250)
+            vx.append(pvx)
+            vy.append(pvy)
+            size.append(random.randint(6, 10))
+        self._spawn(x, y, color, vx, vy, 0.5, size, True)
         self.spawn_spark(x, y, (255, 255, 200), 8)
     
     def spawn_footstep(self, x, y):
+        px, py, vx, vy, size = [], [], [], [], []
         for _ in range(3):
-            offset_x = random.uniform(-10, 10)
-            offset_y = random.uniform(-5, 5)
-            self.particles.append(Particle(
-                x + offset_x, y + offset_y,
-                (100, 140, 100),
-                (random.uniform(-20, 20), random.uniform(-10, -30)),
-                0.4, random.randint(3, 6)
-            ))
+            px.append(x + random.uniform(-10, 10))
+            py.append(y + random.uniform(-5, 5))
+            vx.append(random.uniform(-20, 20))
+            vy.append(random.uniform(-10, -30))
+            size.append(random.randint(3, 6))
+        self._spawn(px, py, (100, 140, 100), vx, vy, 0.4, size, False)
     
     def spawn_magic_trail(self, x, y, color):
-        self.particles.append(Particle(x, y, color, 
-                                     (random.uniform(-10, 10), random.uniform(-10, 10)), 
-                                     0.5, random.randint(3, 6), glow=True))
+        vx = random.uniform(-10, 10)
+        vy = random.uniform(-10, 10)
+        self._spawn(x, y, color, [vx], [vy], 0.5, [random.randint(3, 6)], True)
+    
+    # ============================================================
+    # SIMULACIÓN
+    # ============================================================
     
     def update(self, dt):
-        for p in self.particles[:]:
-            p.update(dt)
-            if not p.is_alive():
-                self.particles.remove(p)
+        n = self.count
+        if not n:
+            return
+        self.x[:n] += self.vx[:n] * dt
+        self.y[:n] += self.vy[:n] * dt
+        lifetime = self.lifetime[:n]
+        lifetime -= dt
+        
+        dead = np.flatnonzero(lifetime <= 0)
+        if not len(dead):
+            return
+        
+        # Swap-remove: las vivas del final ocupan los huecos del principio
+        alive_n = n - len(dead)
+        holes = dead[dead < alive_n]
+        if len(holes):
+            tail = np.arange(alive_n, n)
+            movers = tail[lifetime[alive_n:] > 0]
+            for values in (self.x, self.y, self.vx, self.vy, self.lifetime,
+                           self.max_lifetime, self.size, self.color, self.glow):
+                values[holes] = values[movers]
+        self.count = alive_n
+    
+    # ============================================================
+    # DIBUJADO
+    # ============================================================
     
     def draw(self, screen):
-        for p in self.particles:
-            p.draw(screen)
+        """Dibuja todas las partículas con un único Surface.blits."""
+        batch = StampBatch()
+        self.collect(batch)
+        batch.flush(screen)
+    
+    def collect(self, batch):
+        """
+        Añade las partículas a un StampBatch: por cada una, su glow (si
+        tiene) y su círculo, en el mismo orden en que se dibujaban.
+
+        Cada sello se identifica con un código entero (glow, alpha, radio,
+        color); np.unique agrupa los iguales, así que solo se busca una
+        superficie por grupo y no por partícula.
+        """
+        n = self.count
+        if not n:
+            return
+        size = self.size[:n].astype(np.int64)
+        color = self.color[:n].astype(np.int64)
+        alpha = (255 * (self.lifetime[:n] / self.max_lifetime[:n])).astype(np.int64)
+        # Mismo cuantizado que alpha_bucket
+        glow_alpha = np.clip((alpha // 2 + ALPHA_STEP // 2) // ALPHA_STEP * ALPHA_STEP, 0, 255)
+        x, y = self.x[:n], self.y[:n]
+        
+        # Posición 2i: glow de la partícula i; 2i + 1: su círculo
+        solid = (size << 24) | (color[:, 0] << 16) | (color[:, 1] << 8) | color[:, 2]
+        codes = np.empty(2 * n, dtype=np.int64)
+        codes[0::2] = (1 << 40) | (glow_alpha << 32) | solid
+        codes[1::2] = solid
+        px = np.empty(2 * n, dtype=np.int64)
+        py = np.empty(2 * n, dtype=np.int64)
+        px[0::2] = (x - size * 2).astype(np.int64)
+        py[0::2] = (y - size * 2).astype(np.int64)
+        px[1::2] = x.astype(np.int64) - size
+        py[1::2] = y.astype(np.int64) - size
+        keep = np.empty(2 * n, dtype=bool)
+        keep[0::2] = self.glow[:n]
+        keep[1::2] = size >= 1
+        codes, px, py = codes[keep], px[keep], py[keep]
+        
+        unique, index = np.unique(codes, return_inverse=True)
+        stamps = [self._stamp_for(batch, code) for code in unique.tolist()]
+        batch.items.extend(zip(map(stamps.__getitem__, index.tolist()),
+                               zip(px.tolist(), py.tolist())))
+    
+    def get_bounds(self):
+        """
+        Zona que pinta cada partícula viva (glow incluido): array (n, 4)
+        de x, y, ancho, alto, para el modo dirty-rect.
+        """
+        n = self.count
+        reach = self.size[:n].astype(np.int64) * 2 + 1
+        bounds = np.empty((n, 4), dtype=np.int64)
+        bounds[:, 0] = np.floor(self.x[:n]) - reach
+        bounds[:, 1] = np.floor(self.y[:n]) - reach
+        bounds[:, 2] = bounds[:, 3] = reach * 2 + 1
+        return bounds
+    
+    @staticmethod
+    def _stamp_for(batch, code):
+        """Superficie de un código de sello de collect()."""
+        size = (code >> 24) & 0xFF
+        color = ((code >> 16) & 0xFF, (code >> 8) & 0xFF, code & 0xFF)
+        if code >> 40:
+            return batch.stamp(size * 2, color, (code >> 32) & 0xFF)
+        return batch.stamp(size, color, 255, size * 2 + 1, (size, size))
@@ -0,0 +1,316 @@
+"""
+Pathfinding - Búsqueda de Caminos sobre el Panal
+================================================
+Servicio A* sobre la tabla de adyacencia de GridManager, más campos de
+flujo (mapas de distancia multi-origen) para mover hordas de enemigos.
+
+- Coste de entrar en un tile: 1 + tile.movement_cost (el mismo gancho que
+  usa MoveAction.get_cost). Con costes >= 0 la distancia hexagonal es una
+  heurística admisible, así que A* devuelve el camino óptimo.
+- Restricciones: zonas permitidas (owner), tiles bloqueados explícitamente
+  y ocupación (unidades/torres). El tile de origen nunca bloquea.
+- Caché: cada resultado guarda el camino y los tiles que la búsqueda llegó
+  a examinar. Cuando GridManager avisa de un cambio en un tile solo se
+  descartan los caminos afectados:
+    * tile ocupado -> caminos que pasaban por él.
+    * tile liberado o con otro coste -> búsquedas que lo examinaron.
+- Campo de flujo: un único Dijkstra desde todos los orígenes (unidades del
+  jugador) da a cada tile su distancia al origen más cercano; el siguiente
+  paso de cualquier enemigo es una consulta a sus 6 vecinos.
+"""
+import heapq
+from collections import OrderedDict
+
+# Máximo de consultas guardadas (se descartan las más antiguas)
+PATH_CACHE_SIZE = 512
+
+INF = float('inf')
+
+
+class FlowField:
+    """Distancia de cada tile al origen más cercano (índice de tile -> coste)."""
+
+    def __init__(self, grid_manager, distance):
+        self.grid = grid_manager
+        self.distance = distance
+
+    def get_distance(self, tile):
+        """Coste desde el tile hasta el origen más cercano (inf = inalcanzable)."""
+        return self.distance[tile.index]
+
+    def ranked_steps(self, tile, zones=None):
+        """
+        Vecinos libres que acercan a un origen, del mejor al peor.
+        Returns: lista de (tile, distancia); vacía si ninguno mejora.
+        """
+        here = self.distance[tile.index]
+        steps = []
+        for n in self.grid.get_neighbors(tile):
+            if zones is not None and n.owner not in zones:
+                continue
+            if not n.is_empty():
+                continue
+            dist = self.distance[n.index]
+            if dist < here:
+                steps.append((n, dist))
+        steps.sort(key=lambda step: step[1])
+        return steps
+
+    def next_step(self, tile, zones=None):
+        """Mejor vecino al que moverse, o None si quedarse es lo óptimo."""
+        steps = self.ranked_steps(tile, zones)
+        return steps[0][0] if steps else None
+
+
+class PathfindingService:
+    """A* con caché invalidada por ocupación, y campos de flujo por turno."""
+
+    def __init__(self, grid_manager, cache_size=PATH_CACHE_SIZE):
+        self.grid = grid_manager
+        self.cache_size = cache_size
+
+        # Coordenadas cúbicas por índice de tile (heurística)
+        layout = grid_manager.layout
+        self._cubes = [layout.offset_to_cube(t.col, t.row) for t in grid_manager.tiles]
+
+        # clave -> (camino en índices, índices examinados)
+        self._cache = OrderedDict()
+        # índice de tile -> claves cuya búsqueda lo examinó
+        self._dependents = {}
+        
+        # Último campo de flujo: (clave de orígenes/obstáculos, FlowField)
+        self._flow = (None, None)
+        self.flow_builds = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+        grid_manager.add_occupancy_listener(self._on_tile_changed)
+
+    # ============================================================
+    # CONSULTAS
+    # ============================================================
+
+    def find_path(self, start_tile, goal_tile, zones=None, blocked=None,
+                  allow_occupied_goal=True, closest=False):
+        """
+        Camino de menor coste entre dos tiles.
+
+        Args:
+            zones: owners permitidos ("player", "enemy"); None = todos.
+            blocked: tiles que no se pueden pisar además de los ocupados.
+            allow_occupied_goal: el destino puede estar ocupado (atacar).
+            closest: si el destino es inalcanzable, devuelve el camino al
+                tile alcanzable más cercano a él.
+
+        Returns: lista de tiles [start, ..., goal] o None si no hay camino.
+        """
+        if start_tile is None or goal_tile is None:
+            return None
+
+        zones = frozenset(zones) if zones is not None else None
+        blocked = frozenset(t.index for t in blocked) if blocked else frozenset()
+        key = (start_tile.index, goal_tile.index, zones, blocked,
+               allow_occupied_goal, closest)
+
+        entry = self._cache.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            path = entry[0]
+        else:
+            self.misses += 1
+            path, touched = self._search(start_tile.index, goal_tile.index, zones,
+                                         blocked, allow_occupied_goal, closest)
+            self._store(key, path, touched)
+
+        if path is None:
+            return None
+        tiles = self.grid.tiles
+        return [tiles[i] for i in path]
+
+    def get_flow_field(self, source_tiles):
+        """
+        Campo de flujo hacia los tiles origen (p.ej. unidades vivas del jugador).
+
+        Solo las torres bloquean la propagación: las unidades se mueven durante
+        el turno y se filtran al consultar (FlowField.ranked_steps), así que un
+        campo sirve para todos los enemigos hasta que cambian los orígenes o
+        las torres. Mientras no cambien se reutiliza sin recalcular.
+        """
+        sources = tuple(sorted(t.index for t in source_tiles))
+        towers = tuple(sorted(t.index for t in self.grid._tower_tiles.values()))
+        key = (sources, towers, self.grid.cost_version)
+        if self._flow[0] == key:
+            return self._flow[1]
+
+        field = FlowField(self.grid, self._flood(sources))
+        self._flow = (key, field)
+        self.flow_builds += 1
+        return field
+
+    def _flood(self, sources):
+        """Dijkstra multi-origen sobre índices de tile (torres bloquean)."""
+        tiles = self.grid.tiles
+        table = self.grid.neighbor_table
+        distance = [INF] * len(tiles)
+        frontier = []
+        for index in sources:
+            distance[index] = 0
+            frontier.append((0, index))
+        heapq.heapify(frontier)
+
+        while frontier:
+            dist, current = heapq.heappop(frontier)
+            if dist > distance[current]:
+                continue
+            # Entrar en el origen no cuesta: se ataca desde el tile vecino
+            tile = tiles[current]
+            step = 1 if dist == 0 else 1 + tile.movement_cost
+            new_dist = dist + step
+
+            offset = current * 6
+            for slot in range(offset, offset + 6):
+                n = table[slot]
+                if n < 0 or new_dist >= distance[n]:
+                    continue
+                distance[n] = new_dist
+                # Los tiles con torre reciben distancia pero no propagan
+                if tiles[n].tower is None:
+                    heapq.heappush(frontier, (new_dist, n))
+        return distance
+
+    def path_cost(self, path):
+        """Coste de recorrer un camino (sin contar el tile de origen)."""
+        if not path:
+            return 0
+        return sum(1 + tile.movement_cost for tile in path[1:])
+
+    def clear(self):
+        """Vacía la caché."""
+        self._cache.clear()
+        self._dependents.clear()
+        self._flow = (None, None)
+
+    def get_stats(self):
+        """Estadísticas de la caché (para depuración y benchmarks)."""
+        return {
+            'entries': len(self._cache),
+            'hits': self.hits,
+            'misses': self.misses,
+            'invalidations': self.invalidations,
+            'flow_builds': self.flow_builds,
+        }
+
+    # ============================================================
+    # A*
+    # ============================================================
+
+    def _search(self, start, goal, zones, blocked, allow_occupied_goal, closest):
+        """
+        A* sobre índices de tile.
+        Returns: (camino en índices o None, set de índices examinados).
+        """
+        tiles = self.grid.tiles
+        table = self.grid.neighbor_table
+        cubes = self._cubes
+        gx, gy, gz = cubes[goal]
+
+        def heuristic(index):
+            x, y, z = cubes[index]
+            return max(abs(x - gx), abs(y - gy), abs(z - gz))
+
+        touched = {start}
+        came_from = {start: -1}
+        cost_so_far = {start: 0}
+        best = start
+        best_key = (heuristic(start), 0)
+
+        counter = 0
+        frontier = [(best_key[0], counter, start)]
+
+        while frontier:
+            _, _, current = heapq.heappop(frontier)
+            if current == goal:
+                best = goal
+                break
+
+            base_cost = cost_so_far[current]
+            if closest:
+                current_key = (heuristic(current), base_cost)
+                if current_key < best_key:
+                    best, best_key = current, current_key
+
+            offset = current * 6
+            for slot in range(offset, offset + 6):
+                n = table[slot]
+                if n < 0:
+                    continue
+                touched.add(n)
+                tile = tiles[n]
+                if n in blocked:
+                    continue
+                if zones is not None and tile.owner not in zones:
+                    continue
+                if not tile.is_empty() and not (n == goal and allow_occupied_goal):
+                    continue
+
+                new_cost = base_cost + 1 + tile.movement_cost
+                if new_cost < cost_so_far.get(n, float('inf')):
+                    cost_so_far[n] = new_cost
+                    came_from[n] = current
+                    counter += 1
+                    heapq.heappush(frontier, (new_cost + heuristic(n), counter, n))
+
+        if best != goal and not closest:
+            return None, touched
+
+        path = []
+        node = best
+        while node != -1:
+            path.append(node)
+            node = came_from[node]
+        path.reverse()
+        return path, touched
+
+    # ============================================================
+    # CACHÉ E INVALIDACIÓN
+    # ============================================================
+
+    def _store(self, key, path, touched):
+        """Guarda un resultado y registra sus dependencias."""
+        self._cache[key] = (path, touched)
+        for index in touched:
+            self._dependents.setdefault(index, set()).add(key)
+
+        while len(self._cache) > self.cache_size:
+            old_key = next(iter(self._cache))
+            self._discard(old_key)
+
+    def _discard(self, key):
+        """Elimina una entrada y sus dependencias."""
+        entry = self._cache.pop(key, None)
+        if entry is None:
+            return
+        for index in entry[1]:
+            keys = self._dependents.get(index)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._dependents[index]
+
+    def _on_tile_changed(self, tile):
+        """Oyente de GridManager: invalida solo los caminos afectados."""
+        keys = self._dependents.get(tile.index)
+        if not keys:
+            return
+
+        occupied = not tile.is_empty()
+        for key in list(keys):
+            path = self._cache[key][0]
+            # Ocupar un tile fuera del camino no puede mejorarlo ni romperlo
+            if occupied and (path is None or tile.index not in path):
+                continue
+            self._discard(key)
+            self.invalidations += 1
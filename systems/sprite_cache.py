@@ -0,0 +1,119 @@
+"""
+Sprite Cache - Figuras Pre-renderizadas
+=======================================
+Las figuras geométricas (unidades, torres) se componen de 20-40
+primitivas de pygame. Como su aspecto solo depende de unos pocos
+parámetros (tipo, facción, escala y fase de animación cuantizada), cada
+combinación se dibuja una vez en una superficie con alpha y después solo
+se copia con un blit.
+
+La caché es LRU con un tope de memoria en bytes: al superarlo se
+descartan los sprites usados hace más tiempo.
+"""
+import math
+from collections import OrderedDict
+
+import pygame
+
+# Tope de memoria por defecto (bytes de píxeles de todos los sprites)
+SPRITE_CACHE_BYTES = 24 * 1024 * 1024
+# Fases en que se cuantiza un ciclo de animación
+SPRITE_PHASES = 32
+
+
+def quantize_phase(time, period, phases=SPRITE_PHASES):
+    """
+    Cuantiza un instante dentro de un ciclo.
+
+    Returns:
+        (fase, instante representativo de esa fase)
+    """
+    phase = int(time % period / period * phases) % phases
+    return phase, phase * period / phases
+
+
+class SpriteCache:
+    """Caché LRU de sprites con tope de memoria."""
+
+    def __init__(self, max_bytes=SPRITE_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        # {clave: (superficie, (origen_x, origen_y))}
+        self._sprites = OrderedDict()
+        self.bytes_used = 0
+
+        # Estadísticas
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, render, extent):
+        """
+        Sprite de una clave, dibujándolo si no está en caché.
+
+        Args:
+            key: tupla hashable que identifica la figura
+            render: callback(surface, x, y) que dibuja la figura centrada en x, y
+            extent: distancia máxima (px) a la que la figura pinta desde su centro
+
+        Returns:
+            (superficie, (origen_x, origen_y)): el centro de la figura está
+            en el origen dentro de la superficie
+        """
+        entry = self._sprites.get(key)
+        if entry is not None:
+            self._sprites.move_to_end(key)
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        entry = self._render(render, extent)
+        self._sprites[key] = entry
+        self.bytes_used += self._size_of(entry[0])
+        self._evict()
+        return entry
+
+    def draw(self, screen, key, render, extent, x, y):
+        """Copia a pantalla el sprite de una clave centrado en x, y."""
+        sprite, (ox, oy) = self.get(key, render, extent)
+        screen.blit(sprite, (int(x) - ox, int(y) - oy))
+
+    def _render(self, render, extent):
+        """Dibuja la figura en un lienzo y lo recorta a la zona pintada."""
+        half = int(math.ceil(extent)) + 2
+        canvas = pygame.Surface((half * 2 + 1, half * 2 + 1), pygame.SRCALPHA)
+        render(canvas, half, half)
+
+        bounds = canvas.get_bounding_rect()
+        sprite = canvas.subsurface(bounds).copy()
+        # Con pantalla creada, el formato de la pantalla acelera los blits
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert_alpha()
+        return sprite, (half - bounds.x, half - bounds.y)
+
+    @staticmethod
+    def _size_of(surface):
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    def _evict(self):
+        """Descarta los sprites menos usados hasta respetar el tope."""
+        while self.bytes_used > self.max_bytes and len(self._sprites) > 1:
+            _, (sprite, _) = self._sprites.popitem(last=False)
+            self.bytes_used -= self._size_of(sprite)
+            self.evictions += 1
+
+    def clear(self):
+        self._sprites.clear()
+        self.bytes_used = 0
+
+    def get_stats(self):
+        return {
+            'entries': len(self._sprites),
+            'bytes': self.bytes_used,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+
+# Caché compartida por todas las figuras geométricas
+sprite_cache = SpriteCache()
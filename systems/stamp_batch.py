@@ -0,0 +1,57 @@
+"""
+Stamp Batch - Efectos en un Solo Blit
+=====================================
+Partículas y estelas de proyectiles son cientos de círculos por frame, y
+cada pygame.draw.circle o blit suelto paga el coste de una llamada a
+pygame. Aquí cada círculo se convierte en un "sello" pre-renderizado
+(superficie de la caché de glows, agrupada por radio, color y alpha
+cuantizado) y todos se envían a pantalla en un único Surface.blits.
+
+El orden de la lista se respeta, así que el resultado es el mismo que
+dibujar los círculos uno a uno.
+"""
+from systems.glow_cache import glow_cache, GLOW_CACHE_SIZE
+
+
+class StampBatch:
+    """Lista de blits (sello, posición) que se vuelca una vez por frame."""
+
+    def __init__(self, cache=glow_cache):
+        self.cache = cache
+        self.items = []
+        # (radio, color, alpha, relleno) -> superficie: evita la LRU por sello
+        self._stamps = {}
+
+        # Estadísticas del último flush
+        self.last_count = 0
+
+    def stamp(self, radius, color, alpha=255, size=None, center=None):
+        """Superficie de un círculo (mismos argumentos que GlowCache.circle)."""
+        key = (radius, color, alpha, size, center)
+        surface = self._stamps.get(key)
+        if surface is None:
+            if len(self._stamps) >= GLOW_CACHE_SIZE:
+                self._stamps.clear()
+            surface = self.cache.circle(radius, color, alpha, size=size, center=center)
+            self._stamps[key] = surface
+        return surface
+
+    def add_circle(self, color, x, y, radius):
+        """Equivale a pygame.draw.circle(screen, color, (x, y), radius) con x, y enteros."""
+        if radius < 1:
+            return
+        self.items.append((self.stamp(radius, color, 255, radius * 2 + 1, (radius, radius)),
+                           (x - radius, y - radius)))
+
+    def add(self, surface, pos):
+        self.items.append((surface, pos))
+
+    def flush(self, screen):
+        """Dibuja todo lo acumulado con un solo Surface.blits y vacía el lote."""
+        self.last_count = len(self.items)
+        if self.items:
+            screen.blits(self.items, doreturn=False)
+            self.items = []
+
+    def __len__(self):
+        return len(self.items)
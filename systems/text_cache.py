@@ -0,0 +1,95 @@
+"""
+Text Cache - Textos Pre-renderizados
+====================================
+El HUD, los botones, el oráculo y las etiquetas de tiles renderizaban sus
+textos (rasterizado de glifos) en cada frame aunque casi nunca cambian.
+Esta caché guarda la superficie de cada (fuente, texto, color, antialias)
+con expulsión LRU, y resuelve una sola vez cada fuente del sistema
+(pygame.font.SysFont busca el archivo en disco en cada llamada).
+
+Las superficies devueltas son compartidas: solo se deben copiar con blit.
+"""
+from collections import OrderedDict
+
+import pygame
+
+# Máximo de textos renderizados guardados (LRU)
+TEXT_CACHE_SIZE = 256
+
+_fonts = {}
+
+
+def get_font(name, size, bold=False, italic=False):
+    """pygame.font.SysFont resuelta una vez por combinación de parámetros."""
+    key = (name, size, bold, italic)
+    font = _fonts.get(key)
+    if font is None:
+        font = pygame.font.SysFont(name, size, bold=bold, italic=italic)
+        _fonts[key] = font
+    return font
+
+
+class TextCache:
+    """Caché LRU de superficies de texto y de textos recortados."""
+
+    def __init__(self, max_entries=TEXT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._surfaces = OrderedDict()
+        # (fuente, texto, ancho máximo) -> texto recortado con "..."
+        self._fitted = {}
+
+        # Estadísticas (cada fallo es un texto rasterizado)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font, text, color, antialias=True):
+        """Equivalente a font.render(text, antialias, color), cacheado."""
+        key = (font, text, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def fit(self, font, text, max_width):
+        """
+        Recorta un texto con "..." hasta que quepa en max_width píxeles.
+        Mide con font.size (sin rasterizar) y recuerda el resultado.
+        """
+        key = (font, text, max_width)
+        fitted = self._fitted.get(key)
+        if fitted is None:
+            fitted = text
+            if font.size(text)[0] > max_width:
+                while len(fitted) > 3 and font.size(fitted + "...")[0] > max_width:
+                    fitted = fitted[:-1]
+                fitted = fitted + "..."
+            if len(self._fitted) >= self.max_entries:
+                self._fitted.clear()
+            self._fitted[key] = fitted
+        return fitted
+
+    def clear(self):
+        self._surfaces.clear()
+        self._fitted.clear()
+
+    def get_stats(self):
+        return {
+            'entries': len(self._surfaces),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+
+# Caché compartida por toda la interfaz
+text_cache = TextCache()
@@ -3,5 +3,6 @@ Interfaz de usuario
 """
 
 from .buttons import OracleOfKimi, StyledButton, PersistentMenu
+from .retained_layer import RetainedLayer
 
-__all__ = ['OracleOfKimi', 'StyledButton', 'PersistentMenu']
+__all__ = ['OracleOfKimi', 'StyledButton', 'PersistentMenu', 'RetainedLayer']
@@ -3,6 +3,9 @@ Botones y UI del juego
 """
 import pygame
 import math
+from systems.glow_cache import glow_cache
+from systems.text_cache import text_cache
+from ui.retained_layer import RetainedLayer
 
 
 class OracleOfKimi:
@@ -12,7 +15,7 @@ class OracleOfKimi:
         self.advice = ""
         self.recommended_tile = None
     
-    def analyze_battlefield(self, selected_unit, selected_tile, grid, player_units, enemy_units):
+    def analyze_battlefield(self, selected_unit, selected_tile, grid_manager, player_units, enemy_units):
         from config.constants import ZONE_ENEMY_Y
         
         self.recommended_tile = None
@@ -21,7 +24,7 @@ class OracleOfKimi:
             self.advice = "Selecciona una unidad"
             return
         
-        neighbors = selected_tile.get_neighbors(grid)
+        neighbors = grid_manager.get_neighbors(selected_tile)
         valid_moves = [n for n in neighbors if n.is_empty()]
         
         if not valid_moves:
@@ -38,12 +41,7 @@ class OracleOfKimi:
                 if not enemy.is_alive():
                     continue
                 
-                enemy_tile = None
-                for t in grid.values():
-                    if getattr(t, 'unit', None) == enemy:
-                        enemy_tile = t
-                        break
-                
+                enemy_tile = grid_manager.get_unit_tile(enemy)
                 if enemy_tile:
                     dist = math.sqrt((move_tile.x - enemy_tile.x)**2 + 
                                    (move_tile.y - enemy_tile.y)**2)
@@ -72,19 +70,26 @@ class OracleOfKimi:
         
         if best_tile:
             self.recommended_tile = best_tile
-            best_tile.oracle_recommended = True
+            grid_manager.set_oracle_recommended(best_tile)
             self.advice = "¡Mueve a la casilla DORADA!"
         else:
             self.advice = "Posición defensiva recomendada"
             if valid_moves:
                 self.recommended_tile = valid_moves[0]
-                self.recommended_tile.oracle_recommended = True
+                grid_manager.set_oracle_recommended(self.recommended_tile)
     
-    def clear_recommendation(self, grid):
-        for tile in grid.values():
-            tile.oracle_recommended = False
+    def clear_recommendation(self, grid_manager):
+        grid_manager.set_oracle_recommended(None)
         self.recommended_tile = None
     
+    def get_rect(self):
+        """Zona de pantalla que pinta draw() (None si no hay consejo)."""
+        from config.constants import SCREEN_WIDTH
+        
+        if not self.advice:
+            return None
+        return pygame.Rect(SCREEN_WIDTH // 2 - 220, 110, 440, 70)
+    
     def draw(self, screen, font):
         from config.constants import SCREEN_WIDTH, COLOR_HONEY_BORDER
         
@@ -94,9 +99,7 @@ class OracleOfKimi:
         panel_x = SCREEN_WIDTH // 2 - 220
         panel_y = 110
         
-        panel = pygame.Surface((440, 70), pygame.SRCALPHA)
-        pygame.draw.rect(panel, (40, 30, 10, 220), (0, 0, 440, 70), border_radius=10)
-        pygame.draw.rect(panel, COLOR_HONEY_BORDER, (0, 0, 440, 70), 3, border_radius=10)
+        panel = glow_cache.panel((440, 70), (40, 30, 10, 220), COLOR_HONEY_BORDER, 3)
         screen.blit(panel, (panel_x, panel_y))
         
         star_points = []
@@ -109,10 +112,10 @@ class OracleOfKimi:
         pygame.draw.polygon(screen, COLOR_HONEY_BORDER, star_points)
         pygame.draw.polygon(screen, (255, 255, 200), star_points, 2)
         
-        text = font.render("KIMI:", True, COLOR_HONEY_BORDER)
+        text = text_cache.render(font, "KIMI:", COLOR_HONEY_BORDER)
         screen.blit(text, (panel_x + 55, panel_y + 8))
         
-        text = font.render(self.advice, True, (255, 255, 220))
+        text = text_cache.render(font, self.advice, (255, 255, 220))
         screen.blit(text, (panel_x + 55, panel_y + 35))
 
 
@@ -173,52 +176,52 @@ class StyledButton:
             self.pressed = False
         return False
     
-    def draw(self, screen, font):
-        import pygame
+    def visual_state(self):
+        """
+        Lo que draw() pinta en este frame: texto, rectángulo, desplazamiento
+        de pulsación, si hay glow y color de fondo. Sirve de clave para
+        capas retenidas.
+        """
+        base = self._lerp_color(self.COLOR_BASE, self.COLOR_HOVER, self.hover_anim)
+        active = self._lerp_color(base, self.COLOR_ACTIVE, self.press_anim)
+        return (self.text, tuple(self.rect), int(self.press_anim * 3),
+                self.hover_anim > 0.1, active)
+    
+    def draw(self, screen, font, origin=(0, 0)):
+        """
+        Args:
+            origin: esquina de screen en coordenadas de pantalla (para
+                dibujar dentro de una capa en vez de en la pantalla)
+        """
+        _, _, press_offset, glow, active = self.visual_state()
         
-        # Offset por animación de presión
-        press_offset = int(self.press_anim * 3)
+        # Rectángulo con animación (pulsación)
+        anim_rect = self.rect.move(-origin[0], -origin[1] + press_offset)
         
-        # Rectángulo con animación
-        anim_rect = self.rect.copy()
-        anim_rect.y += press_offset
+        # pygame.draw no mezcla alpha: los colores van opacos, igual que se
+        # veían en la pantalla, para que en una capa SRCALPHA salga lo mismo
         
         # Glow exterior cuando hovered
-        if self.hover_anim > 0.1:
-            glow_color = (*self.COLOR_BORDER[:3], int(self.hover_anim * 100))
+        if glow:
             for i in range(3, 0, -1):
                 glow_rect = anim_rect.inflate(i*4, i*4)
-                pygame.draw.rect(screen, glow_color, glow_rect, border_radius=10)
-        
-        # Color base interpolado
-        base = self._lerp_color(self.COLOR_BASE, self.COLOR_HOVER, self.hover_anim)
-        active = self._lerp_color(base, self.COLOR_ACTIVE, self.press_anim)
+                pygame.draw.rect(screen, self.COLOR_BORDER, glow_rect, border_radius=10)
         
         # Fondo del botón
         pygame.draw.rect(screen, active, anim_rect, border_radius=8)
         
-        # Borde dorado brillante
-        border_alpha = 150 + int(self.hover_anim * 105)
-        border_color = (*self.COLOR_BORDER[:3], border_alpha)
-        pygame.draw.rect(screen, border_color, anim_rect, 2, border_radius=8)
+        # Borde dorado
+        pygame.draw.rect(screen, self.COLOR_BORDER, anim_rect, 2, border_radius=8)
         
         # Línea decorativa superior
         line_y = anim_rect.y + 4
-        pygame.draw.line(screen, (255, 255, 255, 80), 
+        pygame.draw.line(screen, (255, 255, 255), 
                         (anim_rect.x + 8, line_y), 
                         (anim_rect.right - 8, line_y), 1)
         
-        # Texto centrado con truncamiento inteligente
-        display_text = self.text
-        text_surf = font.render(display_text, True, self.COLOR_TEXT)
-        
-        # Truncar si es muy largo
-        max_width = anim_rect.width - 20
-        if text_surf.get_width() > max_width:
-            while len(display_text) > 3 and font.render(display_text + "...", True, self.COLOR_TEXT).get_width() > max_width:
-                display_text = display_text[:-1]
-            display_text = display_text + "..."
-            text_surf = font.render(display_text, True, self.COLOR_TEXT)
+        # Texto centrado con truncamiento inteligente (si es muy largo)
+        display_text = text_cache.fit(font, self.text, anim_rect.width - 20)
+        text_surf = text_cache.render(font, display_text, self.COLOR_TEXT)
         
         # Centrar texto
         text_rect = text_surf.get_rect(center=anim_rect.center)
@@ -244,6 +247,8 @@ class PersistentMenu:
         self.visible = True
         self.title = "ACCIONES"
         self.anim_offset = 0.0
+        # Panel, título y botones ya compuestos (se recomponen al cambiar)
+        self.layer = RetainedLayer()
         
     def clear(self):
         self.buttons = []
@@ -278,28 +283,45 @@ class PersistentMenu:
                 return btn.action
         return None
     
+    def get_rect(self):
+        """
+        Zona de pantalla que pinta draw() (None si está oculto): el panel
+        más el glow y la animación de pulsación del último botón.
+        """
+        if not self.visible:
+            return None
+        total_height = 50 + len(self.buttons) * 44
+        return pygame.Rect(self.x - 10, self.y - 10, self.width + 20, total_height + 10)
+    
     def draw(self, screen, font):
         if not self.visible:
             return
         
-        import pygame
+        rect = self.get_rect()
+        key = (self.title, id(font), rect.size, tuple(btn.visual_state() for btn in self.buttons))
+        layer = self.layer.get(key, lambda: self._render(font, rect))
+        screen.blit(layer, rect)
+    
+    def _render(self, font, rect):
+        """Compone el menú en una capa del tamaño de get_rect()."""
+        layer = pygame.Surface(rect.size, pygame.SRCALPHA)
+        ox, oy = rect.topleft
         
         # Fondo del panel
         total_height = 50 + len(self.buttons) * 44
-        panel = pygame.Surface((self.width + 20, total_height), pygame.SRCALPHA)
-        pygame.draw.rect(panel, self.COLOR_BG, (0, 0, self.width + 20, total_height), border_radius=10)
-        pygame.draw.rect(panel, self.COLOR_BORDER, (0, 0, self.width + 20, total_height), 2, border_radius=10)
-        screen.blit(panel, (self.x - 10, self.y - 10))
+        panel = glow_cache.panel((self.width + 20, total_height), self.COLOR_BG, self.COLOR_BORDER)
+        layer.blit(panel, (self.x - 10 - ox, self.y - 10 - oy))
         
         # Título
-        title_surf = font.render(self.title, True, self.COLOR_BORDER)
-        screen.blit(title_surf, (self.x, self.y - 5))
+        title_surf = text_cache.render(font, self.title, self.COLOR_BORDER)
+        layer.blit(title_surf, (self.x - ox, self.y - 5 - oy))
         
         # Línea separadora
-        pygame.draw.line(screen, self.COLOR_BORDER, 
-                        (self.x, self.y + 20), 
-                        (self.x + self.width, self.y + 20), 2)
+        pygame.draw.line(layer, self.COLOR_BORDER, 
+                        (self.x - ox, self.y + 20 - oy), 
+                        (self.x + self.width - ox, self.y + 20 - oy), 2)
         
         # Botones
         for btn in self.buttons:
-            btn.draw(screen, font)
+            btn.draw(layer, font, rect.topleft)
+        return layer
@@ -0,0 +1,47 @@
+"""
+Retained Layer - Capas de Interfaz Retenidas
+============================================
+El panel superior, el menú de acciones y las pantallas de victoria y
+derrota se componían desde cero cada frame (superficie SRCALPHA nueva,
+rectángulos, textos). Una RetainedLayer guarda la superficie ya compuesta
+junto con la clave de su contenido (ronda, unidad activa, AP, recuentos,
+estado visual de los botones...) y solo la vuelve a componer cuando esa
+clave cambia; el resto de frames es un único blit.
+"""
+
+
+class RetainedLayer:
+    """Superficie compuesta que se reutiliza mientras su contenido no cambie."""
+
+    def __init__(self):
+        self.key = None
+        self.surface = None
+
+        # Estadísticas (cada render es una composición completa)
+        self.hits = 0
+        self.renders = 0
+
+    def get(self, key, render):
+        """
+        Args:
+            key: valor comparable que resume todo lo que se dibuja
+            render: callable sin argumentos que devuelve la superficie
+                compuesta; solo se llama si key cambió
+
+        Returns:
+            la superficie (compartida: solo copiarla con blit)
+        """
+        if self.surface is None or key != self.key:
+            self.surface = render()
+            self.key = key
+            self.renders += 1
+        else:
+            self.hits += 1
+        return self.surface
+
+    def invalidate(self):
+        """Fuerza a recomponer en el próximo get (p. ej. cambió la fuente)."""
+        self.surface = None
+
+    def get_stats(self):
+        return {'hits': self.hits, 'renders': self.renders}